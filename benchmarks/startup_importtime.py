@@ -0,0 +1,82 @@
+"""
+Start-up import time benchmark
+
+Imports a module (main.py by default) in a fresh interpreter with `-X importtime` and reports where the import time goes.
+It fails if one of the heavy optional dependencies in LAZY_MODULES is imported at start-up, or if the total import time is
+above the budget.
+
+Usage:
+    python benchmarks/startup_importtime.py [--module main] [--repeat 5] [--top 15] [--budget SECONDS]
+"""
+import argparse
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+PROJECT_DIR = Path(__file__).resolve().parent.parent
+
+# dependencies that must only be imported when they are used (plotting, interpolation, downloading)
+LAZY_MODULES = ("matplotlib", "scipy", "bs4")
+
+def measure_import_time(module:str="main")->dict:
+    """
+    Imports module in a fresh interpreter with -X importtime
+
+    Args:
+        module (str): the module to import, relative to the project directory
+
+    Returns:
+        dict: imported module name -> cumulative import time in microseconds
+    """
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=PROJECT_DIR, capture_output=True, text=True, env={**os.environ, "QT_QPA_PLATFORM": "offscreen"},
+    )
+    if result.returncode != 0:
+        raise RuntimeError(f"import {module} failed:\n{result.stderr}")
+
+    times = dict()
+    for line in result.stderr.splitlines():
+        # import time: self [us] | cumulative | imported package
+        if not line.startswith("import time:") or "imported package" in line:
+            continue
+        _, cumulative, name = line[len("import time:"):].split("|")
+        times[name.strip()] = int(cumulative)
+    return times
+
+def lazy_modules_imported(times:dict)->list:
+    """
+    Returns the top-level packages of LAZY_MODULES that were imported
+    """
+    return sorted({name.split(".")[0] for name in times if name.split(".")[0] in LAZY_MODULES})
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--module", default="main", help="module to import (default: main)")
+    parser.add_argument("--repeat", type=int, default=5, help="number of fresh interpreters, the fastest run is reported")
+    parser.add_argument("--top", type=int, default=15, help="number of slowest modules to list")
+    parser.add_argument("--budget", type=float, default=None, help="fail if the import takes longer than this many seconds")
+    args = parser.parse_args()
+
+    runs = [measure_import_time(args.module) for _ in range(args.repeat)]
+    times = min(runs, key=lambda run: run[args.module])
+    total = times[args.module] / 1e6
+
+    print(f"import {args.module}: {total:.3f} s (best of {args.repeat})")
+    for name, cumulative in sorted(times.items(), key=lambda item: item[1], reverse=True)[:args.top]:
+        print(f"    {cumulative / 1e3:9.1f} ms  {name}")
+
+    failed = False
+    lazy = lazy_modules_imported(times)
+    if lazy:
+        print(f"FAIL: imported at start-up: {', '.join(lazy)}")
+        failed = True
+    if args.budget is not None and total > args.budget:
+        print(f"FAIL: {total:.3f} s is over the budget of {args.budget:.3f} s")
+        failed = True
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
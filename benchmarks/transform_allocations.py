@@ -0,0 +1,90 @@
+"""
+Transform allocation benchmark
+
+Drives Airfoil_new through a series of incidence, chord and position updates, the way the manipulation spin boxes do,
+and measures with tracemalloc how many bytes each update allocates, with and without the in-place mode.
+It fails if an in-place update allocates a coordinate-sized array.
+
+Usage:
+    python benchmarks/transform_allocations.py [--airfoil airfoils/clarky.dat] [--updates 1000]
+"""
+import argparse
+import os
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+
+PROJECT_DIR = Path(__file__).resolve().parent.parent
+sys.path.insert(0, os.fspath(PROJECT_DIR))
+
+import numpy as np
+
+from models.airfoils import Airfoil_new
+
+DEFAULT_AIRFOIL = os.fspath(PROJECT_DIR / "airfoils" / "clarky.dat")
+
+def measure_update_allocations(airfoil_path:str=DEFAULT_AIRFOIL, updates:int=1000, in_place:bool=True)->dict:
+    """
+    Loads an airfoil and transforms it updates times
+
+    Args:
+        airfoil_path (str): the airfoil file
+        updates (int): number of transform updates
+        in_place (bool): whether the airfoil uses the in-place mode
+
+    Returns:
+        dict: num_points, array_bytes (size of the coordinates), peak_bytes (mean bytes allocated at the peak of an update),
+            seconds (mean time of an update, measured without tracemalloc)
+    """
+    foil = Airfoil_new()
+    foil.IN_PLACE = in_place
+    foil.load(airfoil_path)
+    angles = np.linspace(-10, 10, updates).tolist()
+    chords = np.linspace(0.5, 2, updates).tolist()
+
+    # warm up, so the buffer of the in-place mode is already allocated
+    for i in range(10):
+        foil.update_transform(incidence=angles[i], chord=chords[i], position=(0.0, 0.0))
+
+    start = time.perf_counter()
+    for i in range(updates):
+        foil.update_transform(incidence=angles[i], chord=chords[i], position=(0.0, 0.0))
+    seconds = (time.perf_counter() - start) / updates
+
+    tracemalloc.start()
+    peaks = 0
+    for i in range(updates):
+        tracemalloc.reset_peak()
+        current, _ = tracemalloc.get_traced_memory()
+        foil.update_transform(incidence=angles[i], chord=chords[i], position=(0.0, 0.0))
+        _, peak = tracemalloc.get_traced_memory()
+        peaks += peak - current
+    tracemalloc.stop()
+
+    return {
+        "num_points": len(foil.getData()),
+        "array_bytes": foil.getData().nbytes,
+        "peak_bytes": peaks / updates,
+        "seconds": seconds,
+    }
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--airfoil", default=DEFAULT_AIRFOIL, help="airfoil file to transform (default: clarky.dat)")
+    parser.add_argument("--updates", type=int, default=1000, help="number of transform updates")
+    args = parser.parse_args()
+
+    results = {mode: measure_update_allocations(args.airfoil, args.updates, in_place=mode == "in place") for mode in ("copy", "in place")}
+    array_bytes = results["copy"]["array_bytes"]
+    print(f"{args.updates} updates of {results['copy']['num_points']} points ({array_bytes} bytes of coordinates)")
+    for mode, result in results.items():
+        print(f"    {mode:8s}  {result['peak_bytes']:9.0f} bytes allocated per update  {result['seconds'] * 1e6:7.1f} us per update")
+
+    if results["in place"]["peak_bytes"] >= array_bytes:
+        print("FAIL: in-place updates allocate coordinate arrays")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -8,6 +8,33 @@ PROJECT_DIR = Path(__file__).resolve().parent
 # AIRFOILS_FOLDER = os.fspath(PROJECT_DIR / 'airfoils')
 AIRFOILS_FOLDER = os.path.join(PROJECT_DIR / 'airfoils' / 'airfoil_archive')
 
+# Packed binary archive compiled from the airfoils folder (see scripts/archive.py)
+AIRFOILS_ARCHIVE = os.path.join(PROJECT_DIR / 'airfoils', 'airfoil_archive.bin')
+
+# Manifest of the files in the airfoils folder, used to only re-parse files that changed (see scripts/manifest.py)
+AIRFOILS_MANIFEST = os.path.join(PROJECT_DIR / 'airfoils', 'airfoil_manifest.json')
+
+# Shape-similarity index of the airfoils folder (see scripts/similarity.py)
+AIRFOILS_SIMILARITY = os.path.join(PROJECT_DIR / 'airfoils', 'airfoil_similarity.npz')
+
+# Geometric parameters of the airfoils folder, used to filter the airfoil list (see scripts/parameters.py)
+AIRFOILS_PARAMETERS = os.path.join(PROJECT_DIR / 'airfoils', 'airfoil_parameters.npz')
+
+# Folder of the airfoil preview thumbnails, named by geometry hash (see scripts/thumbnails.py)
+AIRFOILS_THUMBNAILS = os.path.join(PROJECT_DIR / 'airfoils', 'thumbnails')
+
+# Width and height in pixels of the airfoil preview thumbnails
+THUMBNAIL_SIZE = (96, 32)
+
+# Memory budget in bytes for parsed airfoil coordinates kept in memory (see scripts/cache.py)
+GEOMETRY_CACHE_BYTES = 64 * 1024 * 1024
+
+# Memory budget in bytes for repaneled airfoil coordinates kept in memory (see scripts/repanel.py)
+REPANEL_CACHE_BYTES = 16 * 1024 * 1024
+
+# Maximum deviation in chords of the airfoil outline drawn in charts, about a pixel of a full-width chart (see scripts/simplify.py)
+DISPLAY_TOLERANCE = 5e-4
+
 # Relative path to the qml files
 MAIN_QML_FILE = os.path.join(PROJECT_DIR / 'qml', 'main.qml')
 SPLASH_QML_FILE = os.path.join(PROJECT_DIR / 'qml', 'splash.qml')
\ No newline at end of file
@@ -10,9 +10,11 @@ from PySide2.QtWidgets import QApplication, QMainWindow
 
 from models.data import AirfoilListModel
 from models.airfoils import Airfoil_new
+from models.scheduler import UpdateScheduler
+from models.comparison import ComparisonListModel
 from scripts.functions import get_foils_from_dir
 import globals
-from models.controllers import SplashController, ProjectController, airfoil_listmodel
+from models.controllers import SplashController, ProjectController, SimilarityController, airfoil_listmodel, airfoil_filtermodel
 
 from logger_config import logger
     
@@ -23,7 +25,13 @@ if __name__ == "__main__":
 
     splash_controller = SplashController()
     project_controller = ProjectController()
+    similarity_controller = SimilarityController()
     data_model = Airfoil_new()
+    data_model.IN_PLACE = True # the spin boxes update the airfoil many times a second
+    data_model.DISPLAY_TOLERANCE = globals.DISPLAY_TOLERANCE
+    transform_scheduler = UpdateScheduler(data_model) # the spin boxes go through it, it transforms off the GUI thread
+    app.aboutToQuit.connect(transform_scheduler.stop)
+    comparison_model = ComparisonListModel()
 
     root_context.setContextProperty("splashController", splash_controller)
 
@@ -35,9 +43,17 @@ if __name__ == "__main__":
     def load_main():
         # Load main screen
         engine.clearComponentCache()
+        Airfoil_new.ARCHIVE = splash_controller.thread.archive
+        comparison_model.store.ARCHIVE = splash_controller.thread.archive
+        similarity_controller.index = splash_controller.thread.similarity
+        airfoil_filtermodel.setParameterTable(splash_controller.thread.parameters)
         root_context.setContextProperty("dataModel", data_model)
+        root_context.setContextProperty("transformScheduler", transform_scheduler)
+        root_context.setContextProperty("comparisonModel", comparison_model)
         root_context.setContextProperty("airfoilListModel", airfoil_listmodel)
+        root_context.setContextProperty("airfoilFilterModel", airfoil_filtermodel)
         root_context.setContextProperty("projectController", project_controller)
+        root_context.setContextProperty("similarityController", similarity_controller)
         try:
             engine.load(globals.MAIN_QML_FILE)
             splash_screen = engine.rootObjects()[0]
@@ -10,21 +10,28 @@ Classes:
 
 # from typing import Dict
 import numpy as np
-from scipy.interpolate import interp1d
 # from scipy.misc import derivative
-import matplotlib.pyplot as plt
+# matplotlib is only needed by show(), it is imported there to keep it out of the application start-up
 import re
 
 import os
 # from pathlib import Path
 # import sys
 
-from PySide2.QtCore import Property, QAbstractListModel, QObject, Qt, Signal, Slot
+from PySide2.QtCore import Property, QAbstractListModel, QObject, QPointF, Qt, Signal, Slot
+from PySide2.QtCharts import QtCharts
 from logger_config import logger
+from scripts.parsers import parse_airfoil_file
+from scripts.cache import geometry_cache
+from scripts.transforms import AffineTransform
+from scripts.lod import LODPyramid
+from scripts.export import FORMATS as CURVE_FORMATS, plane_axes, write_curve
+from scripts.writers import WRITERS as CAD_WRITERS, export_sections_to
+from models.geometry import GeometryCore, GeometryViews
 
-## remember to update the _data attribute in the emethods that modify the airfoil data, such as initialise_foil(). since the _data attribute is what is being exposed to QML and not the 4 data arrays 
+## the coordinates of both airfoil classes live in one GeometryCore buffer (self.GEOMETRY), UPPER_X etc. are views of it
 
-class Airfoil_new(QObject):
+class Airfoil_new(QObject, GeometryViews):
     """
     Creates an airfoil object which can be rotated, moved, scaled. Base class for all airfoil types defined in the module
 
@@ -35,6 +42,7 @@ class Airfoil_new(QObject):
         PATH (str): description
         NAME (str): description
         NUM_POINTS (int): description
+        GEOMETRY (GeometryCore): the coordinates in Selig order and the index of the leading edge, all the arrays below are views of it
         UPPER (np.ndarray): description
         LOWER (np.ndarray): description
         UPPER_X (np.ndarray): description
@@ -43,6 +51,10 @@ class Airfoil_new(QObject):
         LOWER_Y (np.ndarray): description
         PLANE (str): description
         INCIDENCE (float): description
+        CHORD (float): chord the source coordinates are scaled to
+        POSITION (tuple (float, float)): position of the quarter chord
+        TRANSFORM (AffineTransform): transform from the source coordinates to the current coordinates
+        VERSION (int): incremented every time the coordinates change
         X (np.ndarray): description
         Y (np.ndarray): description
         Z (np.ndarray): description
@@ -50,10 +62,15 @@ class Airfoil_new(QObject):
     Methods:
         calculate_quarter_chord(): Calcualtes the position of the quarter chord of the airfoil
         calculate_chord(): Calculates the length of the chord of the airfoil
+        simplified(): Returns the coordinates decimated to a maximum deviation in chords
+        fillSeries(): Replaces the points of a chart series with the coordinates
+        fillVisibleSeries(): Replaces the points of a chart series with the visible coordinates at screen resolution
         count_points(): count the number of points for the upper curve and lower curves
         center_foil(): centers the coordinates of the foil to make the quarter chord lie at (0,0)
         order_points(): Order the airfoil coordinates such that the data goes from LE over the upper surface to TE and then back to LE over the lower surface
         load(): Load the data from the dat file into the object and returns 2 matrices upper and lower, which contain 2 vectors each: X and Y
+        load_from_archive(): Load the data of an airfoil from a packed airfoil archive
+        update_transform(): Changes the incidence, chord and position and recomputes the coordinates from the source in one matrix multiply
         scale_to(): Scales the airfoil to the given chord
         translate_to(): Translates the airfoil to a desired x, y position
         rotate_to(): Rotates the airfoil to a specific angle
@@ -61,10 +78,15 @@ class Airfoil_new(QObject):
         plane(): Specify and change the plane to be used when exporting to solidworks txt, which requires 3 columns of airfoil data depending on the plane in which the foil will be used
         flip(): Flip the airfoil vertically or horizontally
         close_TE(): CLoses the trailing edge. if the trailing edge is closed, it does nothing. If blend_TE is set to True, this will close the TE to a point, or otherwise make the TE a short vertical line
+        repanel(): Redistributes the points along an arc-length spline with cosine or leading-edge clustered spacing
         show(): Plots an airfoil using the airfoil data points
         export_curve_to(): Exports the airfoil coordinates to a file that is readable by CAD software
     """
     dataChanged = Signal()
+    ARCHIVE = None # AirfoilArchive used by load() for files that have been compiled into it
+    CACHE = geometry_cache # GeometryCache used by load() for files that are not in ARCHIVE
+    IN_PLACE = False # if True, transforms overwrite one preallocated buffer instead of allocating new coordinates
+    DISPLAY_TOLERANCE = None # maximum deviation in chords of the coordinates shown in charts (displayData), None shows all points
 
     def __init__(self, airfoil_path=None, airfoil_name:str=None, plane:str="XY", incidence:float=None, chord:float=None, position:tuple=None, TE_treatment:str="point", parent=None):
         """
@@ -80,9 +102,15 @@ class Airfoil_new(QObject):
         """
         self.NAME = None
         super().__init__(parent)
+        self.PLANE = plane # plane the coordinates are exported in, see plane()
         self.LOADED = False 
         # becomes true if data is in the airfoil
         # and false if it is empty, either upon initialisatoin, or reset
+        self.VERSION = 0 # incremented every time the coordinates change
+        self.GEOMETRY = None # GeometryCore of the current coordinates
+        self.SOURCE = None # GeometryCore of the loaded coordinates, the source of all transforms
+        self._display = (None, None) # (VERSION, coordinates) of the last displayData
+        self._lod = (None, None) # (VERSION, LODPyramid) of the last lod()
 
         if airfoil_path:
             # if path to airfoil data is given
@@ -96,7 +124,7 @@ class Airfoil_new(QObject):
     @Slot(str)
     def load(self, filename:str, plane=None, incidence=None, chord=None, position=None, TE_treatment=None):
         """
-    Reads a Selig-format airfoil file and returns the airfoil name,
+    Reads a Selig or Lednicer format airfoil file and returns the airfoil name,
     the total number of points, and four NumPy arrays:
     x_upper, y_upper, x_lower, y_lower.
 
@@ -109,14 +137,15 @@ class Airfoil_new(QObject):
     where the index is optional. In a Selig file the coordinates are usually
     ordered such that the first section (upper surface) runs from the trailing
     edge to the leading edge and the second section (lower surface) runs from
-    the leading edge to the trailing edge. This function splits the data at the
-    leading edge (identified as the point with the minimum x value) and then
-    reverses each section so that:
-      - x_upper, y_upper run from the leading edge to the trailing edge.
-      - x_lower, y_lower run from the trailing edge to the leading edge.
+    the leading edge to the trailing edge. This function finds the leading edge
+    (identified as the point with the minimum x value) and stores its index in
+    LE_INDEX, so that:
+      - data[:LE_INDEX+1] is the upper surface, from the trailing edge to the leading edge.
+      - data[LE_INDEX:] is the lower surface, from the leading edge to the trailing edge.
     
-    It also checks for a duplicate trailing edge point (often present in Selig files)
-    and removes it before concatenation.
+    A trailing edge point shared by both surfaces (often present in Selig files) is
+    kept at both ends, so the trailing edge is always data[0] and data[-1]. Lednicer files are converted to Selig order
+    by scripts.parsers.parse_airfoil_file before the split.
     
     Args:
         filename (str): Path to the airfoil file.
@@ -129,147 +158,170 @@ class Airfoil_new(QObject):
         x_lower (np.ndarray): x-coordinates for the lower surface.
         y_lower (np.ndarray): y-coordinates for the lower surface.
     """
-        # Read and strip file lines; ignore completely blank lines.
         if filename == "":
             return
 
-        with open(filename, 'r') as f:
-            lines = f.readlines()
-        lines = [line.strip() for line in lines if line.strip() != '']
-
-        # Define a regex pattern to extract (optional index) and two numbers (x and y)
-        # Pattern explanation:
-        #   ^\s*           -> start of the line (allowing whitespace)
-        #   (?:\d+\s+)?    -> an optional index followed by whitespace
-        #   ([-+]?\d*\.?\d+(?:[eE][-+]?\d+)?)  -> x-coordinate (float, with optional exponent)
-        #   \s+            -> whitespace separator
-        #   ([-+]?\d*\.?\d+(?:[eE][-+]?\d+)?)  -> y-coordinate (float, with optional exponent)
-        coordinate_pattern = re.compile(
-            r'^\s*(?:\d+\s+)?([-+]?\d*\.?\d+(?:[eE][-+]?\d+)?)\s+([-+]?\d*\.?\d+(?:[eE][-+]?\d+)?)'
-        )
-
-        # Determine if the first non-empty line is a header (name) or coordinate data.
-        if not lines:
-            raise ValueError("File is empty.")
-        first_line = lines[0]
-        if coordinate_pattern.match(first_line):
-            # No header present; use the file name (without extension) as the airfoil name.
-            name = os.path.splitext(os.path.basename(filename))[0]
-            data_lines = lines
-        else:
-            name = first_line
-            data_lines = lines[1:]
-        
-        # Extract coordinate data using regex
-        data = []
-        for line in data_lines:
-            match = coordinate_pattern.match(line)
-            if match:
-                try:
-                    x_val = float(match.group(1))
-                    y_val = float(match.group(2))
-                    data.append((x_val, y_val))
-                except ValueError:
-                    continue  # Skip lines that cannot be parsed as floats
-        
-        num_points = len(data)
-        if num_points < 2:
-            raise ValueError("Not enough data points were found in the file.")
-        
-        # Convert to NumPy array for easier processing
-        data = np.array(data)  # shape (num_points, 2)
-        x_all = data[:, 0]
-        y_all = data[:, 1]
-        
-        # Identify the leading edge point as the one with the minimum x value
-        i_le = np.argmin(x_all)
-        
+        if self.ARCHIVE is not None and filename in self.ARCHIVE:
+            # the file has been compiled into the archive, slice it instead of parsing the file
+            self.load_from_archive(self.ARCHIVE, filename, plane=plane, incidence=incidence, chord=chord, position=position, TE_treatment=TE_treatment)
+            return
+
+        # Read the file in one pass (the regex is only used for malformed lines), identify the leading edge point as the one
+        # with the minimum x value.
         # According to Selig format:
         # - Upper surface data: from the start of the file (trailing edge) to the leading edge.
         # - Lower surface data: from the leading edge to the end of the file (trailing edge).
-        upper_data = data[:i_le+1]
-        lower_data = data[i_le:]
-        
-        # Remove a duplicate trailing edge point if it exists.
-        # Typically the trailing edge appears as the first point of the upper surface and the last point of the lower surface.
-        if np.allclose(upper_data[0], lower_data[-1], atol=1e-6):
-            lower_data = lower_data[:-1]
-        
-        # Reorder the data to match the desired output:
-        # For the upper surface: desired order is from leading edge to trailing edge.
-        #   (File order is trailing edge -> ... -> leading edge, so we reverse it)
-        upper_data_reversed = upper_data[::-1]
+        # Files that were loaded before are served from the geometry cache as long as they did not change on disk.
+        name, num_points, data, i_le = self.CACHE.get(filename)
         
-        # For the lower surface: desired order is from trailing edge to leading edge.
-        #   (File order is leading edge -> ... -> trailing edge, so we reverse it)
-        lower_data_reversed = lower_data[::-1]
-        
-        # Split into separate arrays.
-        x_upper = upper_data_reversed[:, 0]
-        y_upper = upper_data_reversed[:, 1]
-        x_lower = lower_data_reversed[:, 0]
-        y_lower = lower_data_reversed[:, 1]
-
         # Add data into the class instance parameters
         self.NAME = name
         self.NUM_POINTS = num_points
-        # self.dataChanged.emit() # this should already be emited by the self._data property definition
         
-        x = np.hstack((x_lower, x_upper[::-1]))
-        y = np.hstack((y_lower, y_upper[::-1]))
-        self._data = np.vstack((x, y)).T
+        # the coordinates keep the file (Selig) order: from the trailing edge over the upper surface to the leading edge
+        # and back over the lower surface, which is the outline that is drawn on the chart
+        self._set_source(data, i_le)
 
         if plane or incidence or chord or position or TE_treatment:
             self.initialise_foil(plane=plane, incidence=incidence, chord=chord, position=position, TE_treatment=TE_treatment)
 
         # return name, num_points, x_upper, y_upper, x_lower, y_lower
     
-    def initialise_foil(self, plane, incidence, chord, position, TE_treatment):
-        # self.close_TE(blend = blend_trailing_edge)
+    def load_from_archive(self, archive, filename:str, plane=None, incidence=None, chord=None, position=None, TE_treatment=None):
+        """
+        Loads an airfoil from a packed archive (see scripts.archive) instead of parsing its file.
+        The coordinates are a view into the memory-mapped archive, so no data is read or copied until it is used.
 
-        self.PLANE = plane
-        self.INCIDENCE = 0
-        
-        # center foil, then scale, then rotate, then translate
-        # center the airfoil quarter_chord
-        # move this functionality to a separate function thqt is called here, and is also called if the airfoil is initialised empty and loaded later
-        
-        # if self.LOADED:
-        self.center_foil()
+        Args:
+            archive (AirfoilArchive): an open airfoil archive
+            filename (str): path of the airfoil file, as listed in the archive
 
-            # but if chord is given scale the foil to the given chord. 
-        if chord:
-            self.UPPER_X, self.UPPER_Y, self.LOWER_X, self.LOWER_Y = self.scale_to(chord)
+        Raises:
+            KeyError: if the file is not in the archive
+        """
+        i = archive.index_of(filename)
+        data = archive.coordinates(i)
 
-            # rotate airfoil
-        if incidence:
-            self.UPPER_X, self.UPPER_Y, self.LOWER_X, self.LOWER_Y = self.rotate_to(incidence)
+        self.PATH = filename
+        self.NAME = archive.NAMES[i]
+        self.NUM_POINTS = len(data)
+        self._set_source(data, archive.split(i))
 
-            # translate foil to desired position
-        if position:
-            self.UPPER_X, self.UPPER_Y, self.LOWER_X, self.LOWER_Y = self.translate_to(*position)
+        if plane or incidence or chord or position or TE_treatment:
+            self.initialise_foil(plane=plane, incidence=incidence, chord=chord, position=position, TE_treatment=TE_treatment)
+
+    def initialise_foil(self, plane, incidence, chord, position, TE_treatment):
+        # self.close_TE(blend = blend_trailing_edge)
+
+        if plane:
+            self.plane(plane)
+
+        # center foil, then scale, then rotate, then translate, all in one transform of the source coordinates
+        self.update_transform(incidence=incidence or 0.0, chord=chord, position=position or (0.0, 0.0))
             
         # self.X, self.Y = self.order_points()
         # self.Z = np.zeros_like(self.X)
 
+    def _set_source(self, data:np.ndarray, i_le:int):
+        """
+        Sets the loaded coordinates as the source of all transforms and resets the transform to the identity
+        """
+        self.SOURCE = GeometryCore(data, i_le)
+        self.GEOMETRY = self.SOURCE
+        self._buffer = None # allocated by the first in-place transform
+        self.TRANSFORM = AffineTransform()
+        self.VERSION += 1
+        self.SOURCE_CHORD = self.calculate_chord()
+        self.SOURCE_QUARTER_CHORD = self.calculate_quarter_chord()
+        self.INCIDENCE = 0.0
+        self.CHORD = self.SOURCE_CHORD
+        self.POSITION = self.SOURCE_QUARTER_CHORD
+
+    def update_transform(self, incidence:float=None, chord:float=None, position:tuple=None, out:np.ndarray=None)->np.ndarray:
+        """
+        Changes the incidence, chord and/or position of the airfoil and recomputes its coordinates from the source
+        coordinates with a single affine matrix, so repeated changes do not accumulate rounding errors.
+        Arguments that are None are left unchanged.
+
+        The coordinates are written into out if it is given, or into a buffer that is allocated once per loaded airfoil
+        if IN_PLACE is True, so repeated updates do not allocate. In both cases the returned array is overwritten by the
+        next update, use VERSION to tell whether the coordinates changed since they were last read.
+
+        Args:
+            incidence (float): angle in degrees between the chord and the horizontal, positive values raise the leading edge
+            chord (float): length of the chord
+            position (tuple): x, y of the quarter chord
+            out (np.ndarray): (N, 2) float64 array to write the coordinates into
+
+        Returns:
+            np.ndarray: the transformed (N, 2) coordinates
+        """
+        if incidence is not None:
+            self.INCIDENCE = incidence
+        if chord is not None:
+            self.CHORD = chord
+        if position is not None:
+            self.POSITION = tuple(position)
+
+        self.TRANSFORM.set_parameters(scale=self.CHORD / self.SOURCE_CHORD, angle=self.INCIDENCE,
+                                      position=self.POSITION, pivot=self.SOURCE_QUARTER_CHORD)
+        if out is None:
+            out = self._in_place_buffer()
+        points = self.TRANSFORM.apply(self.SOURCE.points, out=out)
+        if points is not self.GEOMETRY.points:
+            self.GEOMETRY = GeometryCore(points, self.SOURCE.le_index)
+        self.VERSION += 1
+        self.dataChanged.emit()
+        return points
+
+    def _in_place_buffer(self)->np.ndarray:
+        """Returns the buffer transforms are written into if IN_PLACE is True, allocated once per loaded airfoil, or None"""
+        if not self.IN_PLACE:
+            return None
+        if self._buffer is None:
+            self._buffer = np.empty(self.SOURCE.points.shape, dtype=np.float64)
+        return self._buffer
+
+    def set_transformed(self, points:np.ndarray, incidence:float, chord:float, position:tuple):
+        """
+        Sets coordinates that were transformed from SOURCE elsewhere, e.g. on a worker thread by an UpdateScheduler,
+        together with the incidence, chord and position they were transformed with, and emits dataChanged.
+        The points are copied, into the in-place buffer if IN_PLACE is True, so the caller can reuse its array.
+        """
+        self.INCIDENCE = incidence
+        self.CHORD = chord
+        self.POSITION = tuple(position)
+        self.TRANSFORM.set_parameters(scale=self.CHORD / self.SOURCE_CHORD, angle=self.INCIDENCE,
+                                      position=self.POSITION, pivot=self.SOURCE_QUARTER_CHORD)
+        buffer = self._in_place_buffer()
+        if buffer is None:
+            points = np.array(points, dtype=np.float64)
+        else:
+            np.copyto(buffer, points)
+            points = buffer
+        if points is not self.GEOMETRY.points:
+            self.GEOMETRY = GeometryCore(points, self.SOURCE.le_index)
+        self.VERSION += 1
+        self.dataChanged.emit()
+
     def calculate_quarter_chord(self):
         """
-        Calcualtes the position of the quarter chord of the airfoil and sets the self.QUARTER_CHORD parameter
+        Calcualtes the position of the quarter chord of the airfoil, a quarter of the way from the leading edge to the
+        middle of the trailing edge
 
         Returns:
             tuple: x, y
         """
-        # self.QUARTER_CHORD =  (((self.UPPER_X[-1] - self.UPPER_X[0])/4)+self.UPPER_X[0], ((self.UPPER_Y[-1] - self.UPPER_Y[0])/4)+self.UPPER_Y[0])
-        return (((self.UPPER_X[-1] - self.UPPER_X[0])/4)+self.UPPER_X[0], ((self.UPPER_Y[-1] - self.UPPER_Y[0])/4)+self.UPPER_Y[0])
+        return self.GEOMETRY.quarter_chord()
     
     def calculate_chord(self):
         """
-        Calculates the length of the chord of the airfoil
+        Calculates the length of the chord of the airfoil, from the leading edge to the middle of the trailing edge
 
         Returns:
             float: chord
         """
-        return np.sqrt((self.UPPER_X[-1] - self.UPPER_X[0])**2 + (self.UPPER_Y[-1] - self.UPPER_Y[0])**2)
+        return self.GEOMETRY.chord()
     
     def count_points(self):
         """
@@ -279,111 +331,121 @@ class Airfoil_new(QObject):
         Returns:
             tuple: num_upper, num_lower
         """
-        pass
+        return len(self.GEOMETRY.upper), len(self.GEOMETRY.lower)
 
     def center_foil(self):
         '''centers the coordinates of the foil to make the quarter chord lie at (0,0)'''
         
-        self.UPPER_X, self.UPPER_Y, self.LOWER_X, self.LOWER_Y = self.translate_to(0,0)
+        self.translate_to(0, 0)
 
     def order_points(self):
         """
         Order the airfoil coordinates such that the data goes from LE over the upper surface to TE and then back to LE over the lower surface.
 
         Returns: 
-            tuple: X, Y - X coordinates and Y coordinates of the foil from LE to TE and back to LE
-        """
-        # check if the data is in the correct order.
-        # CORRECT ORDER: x values of upper curve goes from small to high and lower curve from high to small
-        if (self.UPPER_X[0] < self.UPPER_X[-1]) and (self.LOWER_X[0] < self.LOWER_X[-1]):
-            # Upper curve goes from small to high but lower cuve also goes from low to high. lower curve needs to reverse
-            self.LOWER_X = np.flipud(self.LOWER_X)
-            self.LOWER_Y = np.flipud(self.LOWER_Y)
-            print('Lower curve reversed')
-        
-        # implement code to remove duplicate TE point
-        # if last point of upper curve == first point of lower curve, remove the TE point
-        # first point in lower curve
-        if (self.UPPER_X[-1] == self.LOWER_X[0]) and (self.UPPER_Y[-1] == self.LOWER_Y[0]):
-            lower_x = self.LOWER_X[1:]
-            lower_y = self.LOWER_Y[1:]
-        else:
-            lower_x = self.LOWER_X[:]
-            lower_y = self.LOWER_Y[:]
-
-        # concatenate X and Y coordinates
-        X = np.concatenate((self.UPPER_X, lower_x))
-        Y = np.concatenate((self.UPPER_Y, lower_y))
-
-        return X, Y
+            tuple: X, Y - X coordinates and Y coordinates of the foil from LE to TE and back to LE, copies of the coordinates
+        """
+        # reversed Selig order runs from the lower TE to the LE and over the upper surface to the upper TE, rolling it to
+        # start at the LE puts the upper surface first and the lower surface, from the TE back towards the LE, after it
+        start = len(self.GEOMETRY) - 1 - self.LE_INDEX
+        return np.roll(self.X, -start), np.roll(self.Y, -start)
 
     @Slot()    
     def getData(self):
-        # fix this, since self._data does not exist yet
-        return self._data
+        if self.GEOMETRY is None:
+            return np.empty((0, 2))
+        return self.GEOMETRY.points
     
     data = Property(np.ndarray, fget=getData, notify=dataChanged)
 
-    def scale_to(self, chord:float)->tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    def simplified(self, tolerance:float)->GeometryCore:
+        """
+        Returns the current coordinates decimated to a maximum deviation of tolerance chords, see scripts.simplify
+        """
+        return self.GEOMETRY.simplified(tolerance)
+
+    def getDisplayData(self)->np.ndarray:
+        """
+        Returns the coordinates to draw in charts, decimated to DISPLAY_TOLERANCE. The result is kept until the coordinates change
+        """
+        if self.GEOMETRY is None or self.DISPLAY_TOLERANCE is None:
+            return self.getData()
+        version, points = self._display
+        if version != self.VERSION:
+            points = self.simplified(self.DISPLAY_TOLERANCE).points
+            self._display = (self.VERSION, points)
+        return points
+
+    displayData = Property(np.ndarray, fget=getDisplayData, notify=dataChanged)
+
+    @Slot(QtCharts.QXYSeries)
+    def fillSeries(self, series:QtCharts.QXYSeries):
+        """
+        Replaces all the points of a chart series with the displayData coordinates in one call, so QML does not have to
+        fetch and append the coordinates point by point
+        """
+        series.replace([QPointF(x, y) for x, y in self.getDisplayData().tolist()])
+
+    def lod(self)->LODPyramid:
+        """
+        Returns the level-of-detail pyramid of the current coordinates, see scripts.lod. It is kept until the coordinates change
         """
-        Scales the airfoil to the given chord and returns upper_x, upper_y, lower_x, lower_y to be assigned back into the Instance attributes
+        version, pyramid = self._lod
+        if version != self.VERSION:
+            pyramid = LODPyramid(self.getData())
+            self._lod = (self.VERSION, pyramid)
+        return pyramid
+
+    @Slot(QtCharts.QXYSeries, float, float, float, float, int)
+    def fillVisibleSeries(self, series:QtCharts.QXYSeries, x_min:float, x_max:float, y_min:float, y_max:float, pixels:int):
+        """
+        Replaces all the points of a chart series with the part of the coordinates inside the axis ranges, at about one
+        bucket of points per pixel of the plot area width
+        """
+        points = self.lod().visible((x_min, x_max), (y_min, y_max), pixels)
+        series.replace([QPointF(x, y) for x, y in points.tolist()])
+
+    def getVersion(self):
+        return self.VERSION
+
+    version = Property(int, fget=getVersion, notify=dataChanged)
+
+    @Slot(float)
+    def scale_to(self, chord:float)->np.ndarray:
+        """
+        Scales the airfoil about its quarter chord to the given chord
         Args:
             chord: the desired chord of the airfoil
         
         Returns:
-            tuple: upper_x, upper_y, lower_x, lower_y
+            np.ndarray: the transformed (N, 2) coordinates
         """
-        #calculate the scaling factor based on the current chord and the desired chord
-        old_chord = self.calculate_chord()
-        sc_factor = chord / old_chord
-        
-        # if quarter_chord is not at (0,0), you need to translate it to (0,0), perform scale operation and restore the translation
-        quarter_chord = self.calculate_quarter_chord()
-        if quarter_chord != (0.0, 0.0):
-            x_u_t, y_u_t, x_l_t, y_l_t = self.__translate(self.UPPER_X, self.UPPER_Y, self.LOWER_X, self.LOWER_Y, -quarter_chord[0], -quarter_chord[1])
-            x_u_s, y_u_s, x_l_s, y_l_s = self.__scale(x_u_t, y_u_t, x_l_t, y_l_t, sc_factor)
-            x_u_o, y_u_o, x_l_o, y_l_o = self.__translate(x_u_s, y_u_s, x_l_s, y_l_s, quarter_chord[0], quarter_chord[1])
-        else:
-           x_u_o, y_u_o, x_l_o, y_l_o = self.__scale(self.UPPER_X, self.UPPER_Y, self.LOWER_X, self.LOWER_Y, sc_factor)
-
-        return x_u_o, y_u_o, x_l_o, y_l_o
+        return self.update_transform(chord=chord)
 
-    def translate_to(self, x_position:float, y_position:float):
+    @Slot(float, float)
+    def translate_to(self, x_position:float, y_position:float)->np.ndarray:
         """
-        Translates the airfoil to a desired x, y position
+        Translates the airfoil quarter chord to a desired x, y position
         Args:
             x_position (float): desired x position of the foil
             y_position (float): desired y position of the foil
 
         Returns:
-            Tuple (tuple): upper_x, upper_y, lower_x, lower_y
+            np.ndarray: the transformed (N, 2) coordinates
         """
-        # calculate the distance between the quarter chord and the desired position
-        quarter_chord_x, quarter_chord_y = self.calculate_quarter_chord()
-
-        dx = x_position - quarter_chord_x
-        dy = y_position - quarter_chord_y
-        x_u_t, y_u_t, x_l_t, y_l_t = self.__translate(self.UPPER_X, self.UPPER_Y, self.LOWER_X, self.LOWER_Y, dx, dy)
-
-        return x_u_t, y_u_t, x_l_t, y_l_t
+        return self.update_transform(position=(x_position, y_position))
 
-    def rotate_to(self, angle):
+    @Slot(float)
+    def rotate_to(self, angle:float)->np.ndarray:
         """
-        Rotates the airfoil to a specific angle
+        Rotates the airfoil about its quarter chord to a specific angle of incidence
         Args:
-            angle
+            angle (float): incidence in degrees, positive values raise the leading edge
         
         Returns:
-            tuple
+            np.ndarray: the transformed (N, 2) coordinates
         """
-        da = angle - self.INCIDENCE
-
-        x_u_r, y_u_r, x_l_r, y_l_r = self.__rotate(self.UPPER_X, self.UPPER_Y, self.LOWER_X, self.LOWER_Y, da)
-
-        # update foil incidence angle
-        self.INCIDENCE = angle
-
-        return x_u_r, y_u_r, x_l_r, y_l_r
+        return self.update_transform(incidence=angle)
     
     def normalise(self):
         """
@@ -404,7 +466,8 @@ class Airfoil_new(QObject):
         # if plane is yz or YZ, X data maps to Y column and Y data maps to Z column
         # if plane is zy or ZY, X data maps to Z column and Y data maps to Y column
         # merge the implementation of the plane and flip methods
-        pass
+        plane_axes(plane) # raises ValueError for an unknown plane
+        self.PLANE = plane.upper()
 
     def flip(self, axis="hor"):
         """
@@ -417,25 +480,25 @@ class Airfoil_new(QObject):
         CLoses the trailing edge. if the trailing edge is closed, it does nothing.
         If blend_TE is set to True, this will close the TE to a point, or otherwise make the TE a short vertical line
         Short TE line is preferable for hot-wire manufacturing but choice is left to user
+        The source coordinates are closed, so the current incidence, chord and position are kept.
         """
-        ### does this implementation add a new point to the trailing edge or does it simply move the last point to the middle of the trailing edge?
-        # also ensure that the line does not exceed a certain threshold size for very large scaled foils
-        # call this function before any transformation
-        # if x_upper[-1] == y_upper[-1]
-        
-        if (self.UPPER_X[-1] != self.LOWER_X[-1]):
-            self.UPPER_X[-1] = self.LOWER_X[-1] = (self.UPPER_X[-1] + self.LOWER_X[-1])/2
-
-        if self.UPPER_Y[-1] != self.LOWER_Y[-1]:
-            if blend:
-                self.UPPER_Y[-1] = self.LOWER_Y[-1] = (self.UPPER_Y[-1] + self.LOWER_Y[-1])/2
-            else:
-                # close TE as a line instead of to a point. simply add a point between the end of the upper and lower curves
-                self.UPPER_Y = np.append(self.UPPER_Y, (self.UPPER_Y[-1] + self.LOWER_Y[-1])/2)
-                self.UPPER_X = np.append(self.UPPER_X, self.UPPER_X[-1])
-                self.LOWER_Y = np.append(self.LOWER_Y, (self.UPPER_Y[-1] + self.LOWER_Y[-1])/2)
-                self.LOWER_X = np.append(self.LOWER_X, self.LOWER_X[-1])
+        closed = self.SOURCE.closed_trailing_edge(blend)
+        incidence, chord, position = self.INCIDENCE, self.CHORD, self.POSITION
+        self._set_source(closed.points, closed.le_index)
+        self.update_transform(incidence=incidence, chord=chord, position=position)
         
+    def repanel(self, num_points:int, spacing:str="cosine"):
+        """
+        Redistributes the points of the airfoil along an arc-length spline through its points, with cosine ("cosine"),
+        leading-edge clustered ("le") or uniform ("uniform") spacing. The source coordinates are repaneled, so the current
+        incidence, chord and position are kept.
+        """
+        repaneled = self.SOURCE.repaneled(num_points, spacing)
+        incidence, chord, position = self.INCIDENCE, self.CHORD, self.POSITION
+        self._set_source(repaneled.points, repaneled.le_index)
+        self.NUM_POINTS = num_points
+        self.update_transform(incidence=incidence, chord=chord, position=position)
+
     def show(self, show_camber=False, figsize=(12,8), save=''):
         """
         Plots an airfoil using the airfoil data points
@@ -446,6 +509,7 @@ class Airfoil_new(QObject):
         # implement passing other arguments for fig and for ax into the method
         # implement save
         # implement plotting by interpolation
+        import matplotlib.pyplot as plt
 
         fig, ax = plt.subplots(figsize=figsize)
 
@@ -467,151 +531,49 @@ class Airfoil_new(QObject):
 
         fig.show()
 
-    def export_curve_to(self, format='solidworks_curve'):
+    def save_thumbnail(self, filename:str, size:tuple=None)->str:
+        """
+        Renders a small preview of the current coordinates to a PNG file without opening a window, see scripts.thumbnails
+
+        Args:
+            filename (str): path of the PNG file
+            size (tuple): width, height in pixels, THUMBNAIL_SIZE by default
+        """
+        from scripts.thumbnails import render_thumbnail, THUMBNAIL_SIZE
+        return render_thumbnail(self.getData(), filename, size or THUMBNAIL_SIZE)
+
+    def export_curve_to(self, format='solidworks_curve', tolerance:float=None):
         """
         Exports the airfoil coordinates to a file
-        format: "SW txt" - the airfoil coordinates are saved as txt prepared to be used as a solidworks curve .txt
+        format: "solidworks_curve" - the airfoil coordinates are saved as txt prepared to be used as a solidworks curve .txt, in PLANE
                 "SW curve" - the airfoil coordinates are saved as a solidworks curve .sldcrv file
                 "xml" - the airfoil coordinates are saved as xml file for xflr5 .xml
+                "dxf" - the airfoil coordinates are saved as a 3D polyline in a dxf file .dxf
+                "svg" - the airfoil coordinates are saved as a polyline in an svg file .svg
+                "dat" - the airfoil coordinates are saved as a Selig dat file .dat
                 "NURBS" - the airfoil coordinates are saved as a NURBS curve  
                 "csv" - the airfoil coordinates are saved as a csv file .csv
+        tolerance: if given, the coordinates are decimated to a maximum deviation of tolerance chords before they are written
 
+        Raises:
+            ValueError: if the format is not one of the formats that can be written
         """
-        if format == "solidworks_curve":
-            file_ext = ".txt"
-            self.EXPORT_FILENAME = self.NAME.replace(' ', '_') + file_ext
-            with open(self.EXPORT_FILENAME, mode="w") as file:
-                for x,y,z in zip(self.X, self.Y, self.Z):
-                    if self.PLANE == 'xy' or "XY":
-                        file.write(f"{str(x)}\t{str(y)}\t{str(z)}\n")
-                    elif self.PLANE == 'xz' or 'XZ':
-                        file.write(f"{str(x)}\t{str(z)}\t{str(y)}\n")
-                    elif self.PLANE == 'yz' or 'YZ':
-                        file.write(f"{str(y)}\t{str(z)}\t{str(x)}\n")
-            
-        elif format == "xml":
-            file_ext = ".xml"
-            self.EXPORT_FILENAME = self.NAME.replace(' ', '_') + file_ext
-
-            # implement xml export
-            # create an xml file with the airfoil coordinates
-            # <?xml version="1.0"?>
-            # <airfoil>
-            #     <name>airfoil name</name>
-            #     <points>
-            #         <point>
-            #             <x>0.0</x>
-            #             <y>0.0</y>
-            #             <z>0.0</z>
-            #         </point>
-            #     </points>
-            # </airfoil>
-            # save the xml file
+        geometry = self.GEOMETRY if tolerance is None else self.simplified(tolerance)
+        if format in CURVE_FORMATS:
+            # the coordinates are mapped to PLANE and written in one call, see scripts.export
+            self.EXPORT_FILENAME = write_curve(self.NAME.replace(' ', '_'), geometry.points[::-1], plane=self.PLANE or "XY", format=format)
+
+        elif "." + format in CAD_WRITERS:
+            # streamed from the coordinate buffer in Selig order, see scripts.writers
+            options = dict() if format in ("svg", "dat") else dict(plane=self.PLANE or "XY")
+            self.EXPORT_FILENAME = export_sections_to(self.NAME.replace(' ', '_') + "." + format, geometry.points, names=self.NAME, **options)
         else:
-            print(f"Invalid format: {format}")
+            raise ValueError(f"Invalid format: {format}")
 
-        print(f'{self.NAME} saved as {format} file - {self.EXPORT_FILENAME}')
-    
-    # internal methods
+        logger.info(f'{self.NAME} saved as {format} file - {self.EXPORT_FILENAME}')
     
-    def __rotate(self, x_upper, y_upper, x_lower, y_lower, angle):
-        """
-        Rotate the airfoil by {incidence} degrees about the origin (0,0).
-        
-        Args:
-            x_upper
-            y_upper
-            x_lower
-            y_lower
-            incidence: the angle in degrees to rotate the airfoil. +ve values rotate the airfoil CW and -ve values rotate the airfoil CCW
-        
-        Returns:
-            tuple: upper_x, upper_y, lower_x, lower_y
-        """
-        print(f"rotate by {angle}")
-        # this can only be called after the airfoil quarter chord has been moved to the origin as it rotates the
-        # foil coordinates about the origin
-        # if this method is caled on a foil that has been moved away from the origin, it should move the foil to the
-        # origin, rotate the foil and then move the foil  back to its position
-        # find a way to save the incidence angle of the airfoil
-
-        angle_rad = np.deg2rad(angle)
-        self.ROTATION_MATRIX = np.array([
-            [ np.cos(angle_rad), -np.sin(angle_rad)],
-            [ np.sin(angle_rad),  np.cos(angle_rad)],
-            ])
-        # rotate upper x and y values
-        rotated_upper = np.dot(np.column_stack((x_upper, y_upper)), self.ROTATION_MATRIX)
-        upper_x, upper_y = rotated_upper[:,0], rotated_upper[:,1]
-
-        # rotate lower x and y values
-        rotated_lower = np.dot(np.column_stack((x_lower, y_lower)), self.ROTATION_MATRIX)
-        lower_x, lower_y = rotated_lower[:,0], rotated_lower[:,1]
-
-        return upper_x, upper_y, lower_x, lower_y
-    
-    def __translate(self, x_upper, y_upper, x_lower, y_lower, dx, dy):
-        """
-        Moves the airfoil by a specific distance in the vertical and horizontal. 
-        horizontal_offset: positive values move the airfoil rightward
-        vertical_offset: positive values move the airfoil upward
-        Args:
-            x_upper, y_upper, x_lower, y_lower, dx=0, dy=0
-        Returns:
-            tuple: upper_x, upper_y, lower_x, lower_y
-        """
-        print(f"translate by {dx}, {dy}")
-        self.TRANSLATION_MATRIX = np.array([
-            [1, 0, dx],
-            [0, 1, dy],
-            [0, 0,  1]
-        ])
-
-        # augment coordinates with extra column of 1s
-        upper_homogenous = np.vstack((x_upper, y_upper, np.ones_like(x_upper)))
-        lower_homogenous = np.vstack((x_lower, y_lower, np.ones_like(x_lower)))
-
-        # translate upper x and y values
-        translated_upper = np.dot( self.TRANSLATION_MATRIX, upper_homogenous)
-        upper_x, upper_y = translated_upper[0], translated_upper[1]
 
-        # translate lower x and y values
-        translated_lower = np.dot( self.TRANSLATION_MATRIX, lower_homogenous)
-        lower_x, lower_y = translated_lower[0], translated_lower[1]
-
-        return upper_x, upper_y, lower_x, lower_y
-    
-    def __scale(self, x_upper, y_upper, x_lower, y_lower, scale_factor):
-        """
-        Scales the airfoil by scale factor.
-        Args:
-            x_upper
-            y_upper
-            x_lower
-            y_lower
-            scale_factor: factor to scale the airfoil
-        
-        Returns:
-            tuple: upper_x, upper_y, lower_x, lower_y
-        """
-        print(f"scale by {scale_factor}")
-        self.SCALING_MATRIX = np.array([
-            [scale_factor,     0],
-            [0,     scale_factor]
-        ])
-
-        # rotate upper x and y values
-        scaled_upper = np.dot(np.column_stack((x_upper, y_upper)), self.SCALING_MATRIX)
-        upper_x, upper_y = scaled_upper[:,0], scaled_upper[:,1]
-
-        # rotate lower x and y values
-        scaled_lower = np.dot(np.column_stack((x_lower, y_lower)), self.SCALING_MATRIX)
-        lower_x, lower_y = scaled_lower[:,0], scaled_lower[:,1]
-
-        return upper_x, upper_y, lower_x, lower_y
-
-
-class Airfoil:
+class Airfoil(GeometryViews):
     """
     Creates an airfoil object which can be rotated, moved, scaled. Base class for all airfoil types defined in the module
 
@@ -622,6 +584,7 @@ class Airfoil:
         PATH (str): description
         NAME (str): description
         NUM_POINTS (int): description
+        GEOMETRY (GeometryCore): the coordinates in Selig order and the index of the leading edge, all the arrays below are views of it
         UPPER (np.ndarray): description
         LOWER (np.ndarray): description
         UPPER_X (np.ndarray): description
@@ -648,6 +611,7 @@ class Airfoil:
         plane(): Specify and change the plane to be used when exporting to solidworks txt, which requires 3 columns of airfoil data depending on the plane in which the foil will be used
         flip(): Flip the airfoil vertically or horizontally
         close_TE(): CLoses the trailing edge. if the trailing edge is closed, it does nothing. If blend_TE is set to True, this will close the TE to a point, or otherwise make the TE a short vertical line
+        repanel(): Redistributes the points along an arc-length spline with cosine or leading-edge clustered spacing
         show(): Plots an airfoil using the airfoil data points
         export_curve_to(): Exports the airfoil coordinates to a file that is readable by CAD software
     """
@@ -667,18 +631,14 @@ class Airfoil:
             # if path to airfoil data is given
             self.PATH = airfoil_path
             self.NAME = None
-            self.NUM_POINTS = None
-            self.UPPER, self.LOWER = self.load(self.PATH)
+            self.load(self.PATH)
 
-        elif airfoil_data:
+        elif airfoil_data is not None:
             # if airfoil coordinates are supplied
             self.PATH = None
-            self.UPPER, self.LOWER = airfoil_data
+            self.GEOMETRY = GeometryCore.from_surfaces(*airfoil_data)
             self.NAME = airfoil_name
-            self.NUM_POINTS = self.count_points()
-        
-        self.UPPER_X, self.UPPER_Y = self.UPPER
-        self.LOWER_X, self.LOWER_Y = self.LOWER
+        self.NUM_POINTS = len(self.GEOMETRY)
 
         self.close_TE(blend = blend_trailing_edge)
 
@@ -691,28 +651,25 @@ class Airfoil:
 
         # but if chord is given scale the foil to the given chord. 
         if chord:
-            self.UPPER_X, self.UPPER_Y, self.LOWER_X, self.LOWER_Y = self.scale_to(chord)
+            self.scale_to(chord)
 
         # rotate airfoil
         if incidence:
-            self.UPPER_X, self.UPPER_Y, self.LOWER_X, self.LOWER_Y = self.rotate_to(incidence)
+            self.rotate_to(incidence)
 
         # translate foil to desired position
         if position:
-            self.UPPER_X, self.UPPER_Y, self.LOWER_X, self.LOWER_Y = self.translate_to(*position)
-        
-        self.X, self.Y = self.order_points()
-        self.Z = np.zeros_like(self.X)
+            self.translate_to(*position)
 
     def calculate_quarter_chord(self):
         """
-        Calcualtes the position of the quarter chord of the airfoil and sets the self.QUARTER_CHORD parameter
+        Calcualtes the position of the quarter chord of the airfoil, a quarter of the way from the leading edge to the
+        middle of the trailing edge
 
         Returns:
             tuple: x, y
         """
-        # self.QUARTER_CHORD =  (((self.UPPER_X[-1] - self.UPPER_X[0])/4)+self.UPPER_X[0], ((self.UPPER_Y[-1] - self.UPPER_Y[0])/4)+self.UPPER_Y[0])
-        return (((self.UPPER_X[-1] - self.UPPER_X[0])/4)+self.UPPER_X[0], ((self.UPPER_Y[-1] - self.UPPER_Y[0])/4)+self.UPPER_Y[0])
+        return self.GEOMETRY.quarter_chord()
     
     def calculate_chord(self):
         """
@@ -721,7 +678,7 @@ class Airfoil:
         Returns:
             float: chord
         """
-        return np.sqrt((self.UPPER_X[-1] - self.UPPER_X[0])**2 + (self.UPPER_Y[-1] - self.UPPER_Y[0])**2)
+        return self.GEOMETRY.chord()
     
     def count_points(self):
         """
@@ -731,96 +688,52 @@ class Airfoil:
         Returns:
             tuple: num_upper, num_lower
         """
-        pass
+        return len(self.GEOMETRY.upper), len(self.GEOMETRY.lower)
 
     def center_foil(self):
         '''centers the coordinates of the foil to make the quarter chord lie at (0,0)'''
         
-        self.UPPER_X, self.UPPER_Y, self.LOWER_X, self.LOWER_Y = self.translate_to(0,0)
+        self.translate_to(0, 0)
 
     def order_points(self):
         """
         Order the airfoil coordinates such that the data goes from LE over the upper surface to TE and then back to LE over the lower surface.
 
         Returns: 
-            tuple: X, Y - X coordinates and Y coordinates of the foil from LE to TE and back to LE
-        """
-        # check if the data is in the correct order.
-        # CORRECT ORDER: x values of upper curve goes from small to high and lower curve from high to small
-        if (self.UPPER_X[0] < self.UPPER_X[-1]) and (self.LOWER_X[0] < self.LOWER_X[-1]):
-            # Upper curve goes from small to high but lower cuve also goes from low to high. lower curve needs to reverse
-            self.LOWER_X = np.flipud(self.LOWER_X)
-            self.LOWER_Y = np.flipud(self.LOWER_Y)
-            print('Lower curve reversed')
-        
-        # implement code to remove duplicate TE point
-        # if last point of upper curve == first point of lower curve, remove the TE point
-        # first point in lower curve
-        if (self.UPPER_X[-1] == self.LOWER_X[0]) and (self.UPPER_Y[-1] == self.LOWER_Y[0]):
-            lower_x = self.LOWER_X[1:]
-            lower_y = self.LOWER_Y[1:]
-        else:
-            lower_x = self.LOWER_X[:]
-            lower_y = self.LOWER_Y[:]
-
-        # concatenate X and Y coordinates
-        X = np.concatenate((self.UPPER_X, lower_x))
-        Y = np.concatenate((self.UPPER_Y, lower_y))
-
-        return X, Y
+            tuple: X, Y - X coordinates and Y coordinates of the foil from LE to TE and back to LE, copies of the coordinates
+        """
+        # reversed Selig order runs from the lower TE to the LE and over the upper surface to the upper TE, rolling it to
+        # start at the LE puts the upper surface first and the lower surface, from the TE back towards the LE, after it
+        start = len(self.GEOMETRY) - 1 - self.LE_INDEX
+        return np.roll(self.X, -start), np.roll(self.Y, -start)
 
     def load(self, airfoil_path):
         """
         Load the data from the dat file into the object and returns 2 matrices upper and lower, which contain 2 vectors each: X and Y
         """
-        raw = list()
-        
-        # claim and initialize variables
-        num_points = None
-
         try:
-            with open(airfoil_path) as airfoil_dat:
-                contents = airfoil_dat.readlines()
-        except Exception as e:
-            logger.warn(f"Error -> {e}")
-        else:
-            for line in contents:
-                line_content = line.strip().split() # strip whitespaces and split the line by spaces
-                if len(line_content) < 1: # continue to next line if the line is Empty
-                    continue
-                
-                # non-empty line starting with alphabet
-                elif line_content[0].isalpha():
-                    if self.NAME:
-                        # if name has been defined already and another alphabet line is encountered, show warning and skip
-                        print(f"Warning on line{contents.index(line)}, expected numeric, instead found:\n{' '.join(line_content)}")
-                        continue
-                    # If line contains alphabets, its the name line
-                    self.NAME = ' '.join(line_content)
-
-                elif float(line_content[0]) > 1:
-                    # Number of data points
-                    if self.NUM_POINTS:
-                        # if num_points has been defined already and another line with large value is encountered,
-                        # show warning and skip
-                        print(f"Warning on line{contents.index(line)}, expected airfoil data, instead found:\n{' '.join(line_content)}")
-                        continue
-                    # num_points = list(map(int, list(map(float, line_content))))
-                    num_points_upper = int(float(line_content[0]))
-                    num_points_lower = int(float(line_content[1]))
-
-                elif float(line_content[0]) <= 1:
-                    raw.append(tuple(map(float, line_content))) # append Individual data point as a tuple of x and y values to raw
-        
-        # this assumes that a line is given as number of points in the file
-        # use a conditional block to split the data at the TE, if the data started at the LE and vice versa 
-        upper = np.array(raw[:num_points_upper])
-        lower = np.array(raw[-num_points_lower:])
-        return upper.T, lower.T
+            name, data = parse_airfoil_file(airfoil_path)
+        except (OSError, ValueError) as e:
+            logger.warning(f"Error -> {e}")
+            raise
+
+        if not self.NAME:
+            self.NAME = name
+
+        # the parser returns Selig order, which is the order of the geometry buffer
+        self.GEOMETRY = GeometryCore(data, int(np.argmin(data[:, 0])))
+        return self.UPPER, self.LOWER
+
+    def _apply(self, transform:AffineTransform)->tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Applies the transform to the coordinates in place and returns views of upper_x, upper_y, lower_x, lower_y
+        """
+        transform.apply(self.GEOMETRY.points, out=self.GEOMETRY.points)
+        return self.UPPER_X, self.UPPER_Y, self.LOWER_X, self.LOWER_Y
 
     def scale_to(self, chord):
         """
-        Scales the airfoil to the given chord.
+        Scales the airfoil about its quarter chord to the given chord.
         Args:
             chord: the desired chord of the airfoil
         
@@ -828,19 +741,8 @@ class Airfoil:
             tuple: upper_x, upper_y, lower_x, lower_y
         """
         #calculate the scaling factor based on the current chord and the desired chord
-        old_chord = self.calculate_chord()
-        sc_factor = chord / old_chord
-        
-        # if quarter_chord is not at (0,0), you need to translate it to (0,0), perform scale operation and restore the translation
-        quarter_chord = self.calculate_quarter_chord()
-        if quarter_chord != (0.0, 0.0):
-            x_u_t, y_u_t, x_l_t, y_l_t = self.__translate(self.UPPER_X, self.UPPER_Y, self.LOWER_X, self.LOWER_Y, -quarter_chord[0], -quarter_chord[1])
-            x_u_s, y_u_s, x_l_s, y_l_s = self.__scale(x_u_t, y_u_t, x_l_t, y_l_t, sc_factor)
-            x_u_o, y_u_o, x_l_o, y_l_o = self.__translate(x_u_s, y_u_s, x_l_s, y_l_s, quarter_chord[0], quarter_chord[1])
-        else:
-           x_u_o, y_u_o, x_l_o, y_l_o = self.__scale(self.UPPER_X, self.UPPER_Y, self.LOWER_X, self.LOWER_Y, sc_factor)
-
-        return x_u_o, y_u_o, x_l_o, y_l_o
+        sc_factor = chord / self.calculate_chord()
+        return self._apply(AffineTransform().scale(sc_factor, origin=self.calculate_quarter_chord()))
 
     def translate_to(self, x_position:float, y_position:float):
         """
@@ -850,34 +752,25 @@ class Airfoil:
             y_position (float): desired y position of the foil
 
         Returns:
-            tuple
+            tuple: upper_x, upper_y, lower_x, lower_y
         """
         # calculate the distance between the quarter chord and the desired position
         quarter_chord_x, quarter_chord_y = self.calculate_quarter_chord()
-
-        dx = x_position - quarter_chord_x
-        dy = y_position - quarter_chord_y
-        x_u_t, y_u_t, x_l_t, y_l_t = self.__translate(self.UPPER_X, self.UPPER_Y, self.LOWER_X, self.LOWER_Y, dx, dy)
-
-        return x_u_t, y_u_t, x_l_t, y_l_t
+        return self._apply(AffineTransform().translate(x_position - quarter_chord_x, y_position - quarter_chord_y))
 
     def rotate_to(self, angle):
         """
-        Rotates the airfoil to a specific angle
+        Rotates the airfoil about its quarter chord to a specific angle
         Args:
             angle
         
         Returns:
-            tuple
+            tuple: upper_x, upper_y, lower_x, lower_y
         """
         da = angle - self.INCIDENCE
-
-        x_u_r, y_u_r, x_l_r, y_l_r = self.__rotate(self.UPPER_X, self.UPPER_Y, self.LOWER_X, self.LOWER_Y, da)
-
         # update foil incidence angle
         self.INCIDENCE = angle
-
-        return x_u_r, y_u_r, x_l_r, y_l_r
+        return self._apply(AffineTransform().rotate(da, origin=self.calculate_quarter_chord()))
     
     def normalise(self):
         """
@@ -898,7 +791,8 @@ class Airfoil:
         # if plane is yz or YZ, X data maps to Y column and Y data maps to Z column
         # if plane is zy or ZY, X data maps to Z column and Y data maps to Y column
         # merge the implementation of the plane and flip methods
-        pass
+        plane_axes(plane) # raises ValueError for an unknown plane
+        self.PLANE = plane.upper()
 
     def flip(self, axis="hor"):
         """
@@ -912,24 +806,18 @@ class Airfoil:
         If blend_TE is set to True, this will close the TE to a point, or otherwise make the TE a short vertical line
         Short TE line is preferable for hot-wire manufacturing but choice is left to user
         """
-        ### does this implementation add a new point to the trailing edge or does it simply move the last point to the middle of the trailing edge?
         # also ensure that the line does not exceed a certain threshold size for very large scaled foils
         # call this function before any transformation
-        # if x_upper[-1] == y_upper[-1]
-        
-        if (self.UPPER_X[-1] != self.LOWER_X[-1]):
-            self.UPPER_X[-1] = self.LOWER_X[-1] = (self.UPPER_X[-1] + self.LOWER_X[-1])/2
-
-        if self.UPPER_Y[-1] != self.LOWER_Y[-1]:
-            if blend:
-                self.UPPER_Y[-1] = self.LOWER_Y[-1] = (self.UPPER_Y[-1] + self.LOWER_Y[-1])/2
-            else:
-                # close TE as a line instead of to a point. simply add a point between the end of the upper and lower curves
-                self.UPPER_Y = np.append(self.UPPER_Y, (self.UPPER_Y[-1] + self.LOWER_Y[-1])/2)
-                self.UPPER_X = np.append(self.UPPER_X, self.UPPER_X[-1])
-                self.LOWER_Y = np.append(self.LOWER_Y, (self.UPPER_Y[-1] + self.LOWER_Y[-1])/2)
-                self.LOWER_X = np.append(self.LOWER_X, self.LOWER_X[-1])
+        self.GEOMETRY = self.GEOMETRY.closed_trailing_edge(blend)
         
+    def repanel(self, num_points:int, spacing:str="cosine"):
+        """
+        Redistributes the points of the airfoil along an arc-length spline through its points, with cosine ("cosine"),
+        leading-edge clustered ("le") or uniform ("uniform") spacing
+        """
+        self.GEOMETRY = self.GEOMETRY.repaneled(num_points, spacing).copy()
+        self.NUM_POINTS = num_points
+
     def show(self, show_camber=False, figsize=(12,8), save=''):
         """
         Plots an airfoil using the airfoil data points
@@ -940,6 +828,7 @@ class Airfoil:
         # implement passing other arguments for fig and for ax into the method
         # implement save
         # implement plotting by interpolation
+        import matplotlib.pyplot as plt
 
         fig, ax = plt.subplots(figsize=figsize)
 
@@ -964,145 +853,31 @@ class Airfoil:
     def export_curve_to(self, format='solidworks_curve'):
         """
         Exports the airfoil coordinates to a file
-        format: "SW txt" - the airfoil coordinates are saved as txt prepared to be used as a solidworks curve .txt
+        format: "solidworks_curve" - the airfoil coordinates are saved as txt prepared to be used as a solidworks curve .txt, in PLANE
                 "SW curve" - the airfoil coordinates are saved as a solidworks curve .sldcrv file
                 "xml" - the airfoil coordinates are saved as xml file for xflr5 .xml
+                "dxf" - the airfoil coordinates are saved as a 3D polyline in a dxf file .dxf
+                "svg" - the airfoil coordinates are saved as a polyline in an svg file .svg
+                "dat" - the airfoil coordinates are saved as a Selig dat file .dat
                 "NURBS" - the airfoil coordinates are saved as a NURBS curve  
                 "csv" - the airfoil coordinates are saved as a csv file .csv
 
+        Raises:
+            ValueError: if the format is not one of the formats that can be written
         """
-        if format == "solidworks_curve":
-            file_ext = ".txt"
-            self.EXPORT_FILENAME = self.NAME.replace(' ', '_') + file_ext
-            with open(self.EXPORT_FILENAME, mode="w") as file:
-                for x,y,z in zip(self.X, self.Y, self.Z):
-                    if self.PLANE == 'xy' or "XY":
-                        file.write(f"{str(x)}\t{str(y)}\t{str(z)}\n")
-                    elif self.PLANE == 'xz' or 'XZ':
-                        file.write(f"{str(x)}\t{str(z)}\t{str(y)}\n")
-                    elif self.PLANE == 'yz' or 'YZ':
-                        file.write(f"{str(y)}\t{str(z)}\t{str(x)}\n")
-            
-        elif format == "xml":
-            file_ext = ".xml"
-            self.EXPORT_FILENAME = self.NAME.replace(' ', '_') + file_ext
-
-            # implement xml export
-            # create an xml file with the airfoil coordinates
-            # <?xml version="1.0"?>
-            # <airfoil>
-            #     <name>airfoil name</name>
-            #     <points>
-            #         <point>
-            #             <x>0.0</x>
-            #             <y>0.0</y>
-            #             <z>0.0</z>
-            #         </point>
-            #     </points>
-            # </airfoil>
-            # save the xml file
-        else:
-            print(f"Invalid format: {format}")
+        if format in CURVE_FORMATS:
+            # the coordinates are mapped to PLANE and written in one call, see scripts.export
+            self.EXPORT_FILENAME = write_curve(self.NAME.replace(' ', '_'), self.GEOMETRY.points[::-1], plane=self.PLANE or "XY", format=format)
 
-        print(f'{self.NAME} saved as {format} file - {self.EXPORT_FILENAME}')
-    
-    # Mangled internal methods
-    
-    def __rotate(self, x_upper, y_upper, x_lower, y_lower, angle):
-        """
-        Rotate the airfoil by {incidence} degrees about the origin (0,0).
-        
-        Args:
-            x_upper
-            y_upper
-            x_lower
-            y_lower
-            incidence: the angle in degrees to rotate the airfoil. +ve values rotate the airfoil CW and -ve values rotate the airfoil CCW
-        
-        Returns:
-            tuple: upper_x, upper_y, lower_x, lower_y
-        """
-        print(f"rotate by {angle}")
-        # this can only be called after the airfoil quarter chord has been moved to the origin as it rotates the
-        # foil coordinates about the origin
-        # if this method is caled on a foil that has been moved away from the origin, it should move the foil to the
-        # origin, rotate the foil and then move the foil  back to its position
-        # find a way to save the incidence angle of the airfoil
-
-        angle_rad = np.deg2rad(angle)
-        self.ROTATION_MATRIX = np.array([
-            [ np.cos(angle_rad), -np.sin(angle_rad)],
-            [ np.sin(angle_rad),  np.cos(angle_rad)],
-            ])
-        # rotate upper x and y values
-        rotated_upper = np.dot(np.column_stack((x_upper, y_upper)), self.ROTATION_MATRIX)
-        upper_x, upper_y = rotated_upper[:,0], rotated_upper[:,1]
-
-        # rotate lower x and y values
-        rotated_lower = np.dot(np.column_stack((x_lower, y_lower)), self.ROTATION_MATRIX)
-        lower_x, lower_y = rotated_lower[:,0], rotated_lower[:,1]
-
-        return upper_x, upper_y, lower_x, lower_y
-    
-    def __translate(self, x_upper, y_upper, x_lower, y_lower, dx, dy):
-        """
-        Moves the airfoil by a specific distance in the vertical and horizontal. 
-        horizontal_offset: positive values move the airfoil rightward
-        vertical_offset: positive values move the airfoil upward
-        Args:
-            x_upper, y_upper, x_lower, y_lower, dx=0, dy=0
-        Returns:
-            tuple: upper_x, upper_y, lower_x, lower_y
-        """
-        print(f"translate by {dx}, {dy}")
-        self.TRANSLATION_MATRIX = np.array([
-            [1, 0, dx],
-            [0, 1, dy],
-            [0, 0,  1]
-        ])
-
-        # augment coordinates with extra column of 1s
-        upper_homogenous = np.vstack((x_upper, y_upper, np.ones_like(x_upper)))
-        lower_homogenous = np.vstack((x_lower, y_lower, np.ones_like(x_lower)))
-
-        # translate upper x and y values
-        translated_upper = np.dot( self.TRANSLATION_MATRIX, upper_homogenous)
-        upper_x, upper_y = translated_upper[0], translated_upper[1]
-
-        # translate lower x and y values
-        translated_lower = np.dot( self.TRANSLATION_MATRIX, lower_homogenous)
-        lower_x, lower_y = translated_lower[0], translated_lower[1]
+        elif "." + format in CAD_WRITERS:
+            # streamed from the coordinate buffer in Selig order, see scripts.writers
+            options = dict() if format in ("svg", "dat") else dict(plane=self.PLANE or "XY")
+            self.EXPORT_FILENAME = export_sections_to(self.NAME.replace(' ', '_') + "." + format, self.GEOMETRY.points, names=self.NAME, **options)
+        else:
+            raise ValueError(f"Invalid format: {format}")
 
-        return upper_x, upper_y, lower_x, lower_y
+        logger.info(f'{self.NAME} saved as {format} file - {self.EXPORT_FILENAME}')
     
-    def __scale(self, x_upper, y_upper, x_lower, y_lower, scale_factor):
-        """
-        Scales the airfoil by scale factor.
-        Args:
-            x_upper
-            y_upper
-            x_lower
-            y_lower
-            scale_factor: factor to scale the airfoil
-        
-        Returns:
-            tuple: upper_x, upper_y, lower_x, lower_y
-        """
-        print(f"scale by {scale_factor}")
-        self.SCALING_MATRIX = np.array([
-            [scale_factor,     0],
-            [0,     scale_factor]
-        ])
-
-        # rotate upper x and y values
-        scaled_upper = np.dot(np.column_stack((x_upper, y_upper)), self.SCALING_MATRIX)
-        upper_x, upper_y = scaled_upper[:,0], scaled_upper[:,1]
-
-        # rotate lower x and y values
-        scaled_lower = np.dot(np.column_stack((x_lower, y_lower)), self.SCALING_MATRIX)
-        lower_x, lower_y = scaled_lower[:,0], scaled_lower[:,1]
-
-        return upper_x, upper_y, lower_x, lower_y
 
 class NACA4DigitFoil(Airfoil):
     """
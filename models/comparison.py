@@ -0,0 +1,265 @@
+"""
+This module contains the model of the airfoils overlaid on the chart for comparison.
+
+Every compared airfoil has its own transform, colour and visibility, but airfoils loaded from the same file share one
+read-only source geometry from a GeometryStore, so comparing many variants of a foil does not load it many times.
+A change to one airfoil only updates that airfoil: its coordinates are transformed into its own buffer and the model
+signals a change of that row, so the chart refills one series instead of rebuilding all of them. Colour and visibility
+changes are role changes the series bind to, they do not resend any coordinates.
+
+Classes:
+    GeometryStore: Source geometry of the compared airfoils, loaded once per file
+    ComparisonListModel: A Qt ListModel of the compared airfoils, with their transform, colour and visibility
+    ComparisonItem: A compared airfoil
+"""
+from typing import Dict
+
+import numpy as np
+
+from PySide2.QtCore import Property, QAbstractListModel, QModelIndex, QPointF, Qt, Signal, Slot
+from PySide2.QtCharts import QtCharts
+
+from logger_config import logger
+from models.data import createModelItem
+from models.geometry import GeometryCore
+from scripts.cache import geometry_cache
+from scripts.transforms import AffineTransform
+
+class GeometryStore:
+    """
+    Source geometry of the compared airfoils. Each file is loaded once, from ARCHIVE if it was compiled into it or
+    through the geometry cache otherwise, and is kept as long as a compared airfoil uses it.
+
+    Attributes:
+        ARCHIVE (AirfoilArchive): archive the files are sliced from, set once the archive is open
+        CACHE (GeometryCache): cache used for files that are not in ARCHIVE
+    """
+    def __init__(self, archive=None, cache=geometry_cache):
+        self.ARCHIVE = archive
+        self.CACHE = cache
+        self._entries = dict() # path -> [name, GeometryCore, number of users]
+
+    def __len__(self):
+        return len(self._entries)
+
+    def __contains__(self, path:str):
+        return path in self._entries
+
+    def acquire(self, path:str)->tuple[str, GeometryCore]:
+        """
+        Returns the name and source geometry of an airfoil file, loading it if no compared airfoil uses it yet
+
+        Raises:
+            OSError: if the file cannot be read
+            ValueError: if the file has no valid coordinates
+        """
+        entry = self._entries.get(path)
+        if entry is None:
+            if self.ARCHIVE is not None and path in self.ARCHIVE:
+                i = self.ARCHIVE.index_of(path)
+                name, geometry = self.ARCHIVE.NAMES[i], GeometryCore(self.ARCHIVE.coordinates(i), self.ARCHIVE.split(i))
+            else:
+                name, _, data, i_le = self.CACHE.get(path)
+                geometry = GeometryCore(data, i_le)
+            entry = self._entries[path] = [name, geometry, 0]
+        entry[2] += 1
+        return entry[0], entry[1]
+
+    def release(self, path:str):
+        """Drops the geometry of a file once no compared airfoil uses it"""
+        entry = self._entries.get(path)
+        if entry is not None:
+            entry[2] -= 1
+            if entry[2] <= 0:
+                del self._entries[path]
+
+ComparisonItem = createModelItem("ComparisonItem", ["name", "path", "source", "colour", "visible", "incidence", "chord", "position", "transform", "points", "version"])
+ComparisonItem.__doc__ = """
+This class represents a single compared airfoil.
+
+Args:
+    name (str): The name of the airfoil
+    path (str): The path to the airfoil
+    source (GeometryCore): The shared source geometry, from the GeometryStore
+    colour (str): The colour of the airfoil on the chart
+    visible (bool): Whether the airfoil is shown on the chart
+    incidence (float): The incidence in degrees, positive values raise the leading edge
+    chord (float): The chord the source is scaled to
+    position (tuple): x, y of the quarter chord
+    transform (AffineTransform): The transform from the source to points
+    points (np.ndarray): The transformed (N, 2) coordinates, owned by the item and overwritten by every transform
+    version (int): Incremented every time points change
+"""
+
+class ComparisonListModel(QAbstractListModel):
+    """
+    This List model contains the airfoils overlaid on the chart, each with its own transform, colour and visibility.
+    Changing an airfoil signals dataChanged for its row only, with the roles that changed.
+    """
+    NameRole = Qt.UserRole + 1
+    PathRole = Qt.UserRole + 2
+    ColourRole = Qt.UserRole + 3
+    VisibleRole = Qt.UserRole + 4
+    IncidenceRole = Qt.UserRole + 5
+    ChordRole = Qt.UserRole + 6
+    XRole = Qt.UserRole + 7
+    YRole = Qt.UserRole + 8
+    VersionRole = Qt.UserRole + 9
+
+    # colours given to the airfoils in the order they are added
+    PALETTE = ("#1f77b4", "#ff7f0e", "#2ca02c", "#d62728", "#9467bd", "#8c564b", "#e377c2", "#7f7f7f", "#bcbd22", "#17becf")
+
+    countChanged = Signal()
+
+    def __init__(self, store:GeometryStore=None, parent=None):
+        super().__init__(parent)
+        self.store = GeometryStore() if store is None else store
+        self._data = list()
+        self._added = 0 # number of airfoils added so far, picks the next colour of the palette
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid() or not (0 <= index.row() < len(self._data)):
+            return None
+
+        item = self._data[index.row()]
+
+        if role == ComparisonListModel.NameRole or role == Qt.DisplayRole:
+            return item.name
+        elif role == ComparisonListModel.PathRole:
+            return item.path
+        elif role == ComparisonListModel.ColourRole:
+            return item.colour
+        elif role == ComparisonListModel.VisibleRole:
+            return item.visible
+        elif role == ComparisonListModel.IncidenceRole:
+            return item.incidence
+        elif role == ComparisonListModel.ChordRole:
+            return item.chord
+        elif role == ComparisonListModel.XRole:
+            return item.position[0]
+        elif role == ComparisonListModel.YRole:
+            return item.position[1]
+        elif role == ComparisonListModel.VersionRole:
+            return item.version
+        return None
+
+    def setData(self, index, value, role=Qt.EditRole):
+        """Colour and visibility can be edited from views, the transform is changed with setTransform()"""
+        if not index.isValid() or not (0 <= index.row() < len(self._data)):
+            return False
+        item = self._data[index.row()]
+        if role == ComparisonListModel.ColourRole:
+            item.colour = str(value)
+        elif role == ComparisonListModel.VisibleRole:
+            item.visible = bool(value)
+        else:
+            return False
+        self.dataChanged.emit(index, index, [role])
+        return True
+
+    def flags(self, index):
+        return super().flags(index) | Qt.ItemIsEditable
+
+    def rowCount(self, parent=QModelIndex()):
+        return len(self._data)
+
+    def roleNames(self) -> Dict:
+        roles = {
+            ComparisonListModel.NameRole: b"name",
+            ComparisonListModel.PathRole: b"path",
+            ComparisonListModel.ColourRole: b"colour",
+            ComparisonListModel.VisibleRole: b"visible",
+            ComparisonListModel.IncidenceRole: b"incidence",
+            ComparisonListModel.ChordRole: b"chord",
+            ComparisonListModel.XRole: b"x",
+            ComparisonListModel.YRole: b"y",
+            ComparisonListModel.VersionRole: b"version",
+            }
+        return roles
+
+    @Slot(str, result=int)
+    def addAirfoil(self, path:str)->int:
+        """
+        Adds an airfoil file to the comparison, untransformed and with the next colour of the palette
+
+        Returns:
+            int: the row of the airfoil, -1 if the file could not be loaded
+        """
+        if not path:
+            return -1
+        try:
+            name, source = self.store.acquire(path)
+        except (OSError, ValueError) as e:
+            logger.error(f"Cannot compare {path}: {e}")
+            return -1
+        chord = source.chord()
+        position = source.quarter_chord()
+        colour = self.PALETTE[self._added % len(self.PALETTE)]
+        self._added += 1
+
+        row = len(self._data)
+        self.beginInsertRows(QModelIndex(), row, row)
+        self._data.append(ComparisonItem(name, path, source, colour, True, 0.0, chord, position, AffineTransform(), source.points.copy(), 0))
+        self.endInsertRows()
+        self.countChanged.emit()
+        return row
+
+    @Slot(int)
+    def removeAirfoil(self, row:int):
+        if not 0 <= row < len(self._data):
+            return
+        self.beginRemoveRows(QModelIndex(), row, row)
+        item = self._data.pop(row)
+        self.endRemoveRows()
+        self.store.release(item.path)
+        self.countChanged.emit()
+
+    @Slot()
+    def clear(self):
+        self.beginResetModel()
+        for item in self._data:
+            self.store.release(item.path)
+        self._data = list()
+        self.endResetModel()
+        self.countChanged.emit()
+
+    @Slot(int, float, float, float, float)
+    def setTransform(self, row:int, incidence:float, chord:float, x_position:float, y_position:float):
+        """
+        Sets the incidence, chord and quarter chord position of one airfoil. Its coordinates are recomputed from the shared
+        source into its own buffer, and only its row is signalled as changed
+        """
+        if not 0 <= row < len(self._data):
+            return
+        item = self._data[row]
+        item.incidence, item.chord, item.position = incidence, chord, (x_position, y_position)
+        source = item.source
+        item.transform.set_parameters(scale=chord / source.chord(), angle=incidence, position=item.position, pivot=source.quarter_chord())
+        item.transform.apply(source.points, out=item.points)
+        item.version += 1
+        index = self.index(row)
+        self.dataChanged.emit(index, index, [ComparisonListModel.IncidenceRole, ComparisonListModel.ChordRole,
+                                             ComparisonListModel.XRole, ComparisonListModel.YRole, ComparisonListModel.VersionRole])
+
+    @Slot(int, str)
+    def setColour(self, row:int, colour:str):
+        self.setData(self.index(row), colour, ComparisonListModel.ColourRole)
+
+    @Slot(int, bool)
+    def setVisible(self, row:int, visible:bool):
+        self.setData(self.index(row), visible, ComparisonListModel.VisibleRole)
+
+    def points(self, row:int)->np.ndarray:
+        """Returns the transformed (N, 2) coordinates of an airfoil, overwritten by the next transform of that airfoil"""
+        return self._data[row].points
+
+    @Slot(int, QtCharts.QXYSeries)
+    def fillSeries(self, row:int, series:QtCharts.QXYSeries):
+        """Replaces all the points of a chart series with the coordinates of one airfoil in one call"""
+        if 0 <= row < len(self._data):
+            series.replace([QPointF(x, y) for x, y in self._data[row].points.tolist()])
+
+    def getCount(self):
+        return len(self._data)
+
+    count = Property(int, fget=getCount, notify=countChanged)
@@ -7,10 +7,13 @@ from PySide2.QtCore import QObject, Slot, Signal, Property, QThread
 import logging
 import time
 
-from scripts.functions import get_foils_from_dir
-from models.data import Airfoil, AirfoilTransformation
-from globals import AIRFOILS_FOLDER
-from models.data import AirfoilListModel, ProjectListModel
+from scripts.archive import AirfoilArchive, write_archive
+from scripts.manifest import AirfoilManifest
+from scripts.similarity import SimilarityIndex
+from scripts.parameters import ParameterTable
+from scripts.thumbnails import render_thumbnails
+from globals import AIRFOILS_FOLDER, AIRFOILS_ARCHIVE, AIRFOILS_MANIFEST, AIRFOILS_SIMILARITY, AIRFOILS_PARAMETERS, AIRFOILS_THUMBNAILS
+from models.data import AirfoilListModel, AirfoilFilterModel, ProjectListModel
 import os
 from PySide2.QtWidgets import QFileDialog
 
@@ -19,38 +22,129 @@ logger = logging.getLogger(__name__)
 logging.basicConfig(filename='log.log', format='%(asctime)s - %(levelname)s - %(message)s', encoding='utf-8', level=logging.INFO)
 
 airfoil_listmodel = AirfoilListModel()
+airfoil_filtermodel = AirfoilFilterModel(airfoil_listmodel)
 
 class LoaderThread(QThread):
     loadingProgress = Signal(int, str)
     loadingComplete = Signal()
     step_number = 0
+    archive = None
+    similarity = None
+    parameters = None
+    thumbnails = dict()
+    PROGRESS_INTERVAL = 0.05 # minimum time in seconds between two loadingProgress signals
+    _last_progress = float('-inf')
 
     def run(self):
         # step 1: initialise
         step = "Initialisation"
         self.process_step(1, step)
 
-        # step 2: read airfoils
-        airfoils = get_foils_from_dir(AIRFOILS_FOLDER)
+        # step 2: check the airfoils folder against the manifest, only new and changed files are parsed
+        step = "Check airfoils folder"
+        self.process_step(1, step)
+        manifest = AirfoilManifest(AIRFOILS_FOLDER, AIRFOILS_MANIFEST)
+        manifest.refresh()
+
+        # step 3: update the packed archive and the indexes derived from it, only the new and changed airfoils are processed
+        self.archive = self.open_archive(manifest)
+        self.similarity = self.open_index(SimilarityIndex, AIRFOILS_SIMILARITY, "Update similarity index")
+        self.parameters = self.open_index(ParameterTable, AIRFOILS_PARAMETERS, "Update parameter table")
+
+        # step 4: read airfoils, all rows are inserted at once
+        airfoils = manifest.airfoils()
         logger.info(f"{len(airfoils)} airfoils")
-        for filename, filepath in airfoils:
-            airfoil_listmodel.addItem(filename, filepath)
-            step = f"Load {filename} airfoil"
-            self.process_step(1, step)
+        airfoil_listmodel.addItems(airfoils)
+        step = f"Load {len(airfoils)} airfoils"
+        self.process_step(1, step, count=len(airfoils))
 
-        # step 3: load main qml
+        # step 5: render the missing airfoil thumbnails, the ones of unchanged airfoils are already on disk
+        self.thumbnails = self.render_thumbnails()
+        airfoil_listmodel.setThumbnails(self.thumbnails)
+
+        # step 6: load main qml
         step = "Load main QML"
-        self.process_step(1, step)
+        self.process_step(1, step, force=True)
         time.sleep(0.5) # small delay to ensure that the progressbar reaches the end before the splash screen closes
         self.completed = True
 
         self.loadingComplete.emit()
     
-    def process_step(self, level:int, step:str):
-        self.step_number += 1
-        time.sleep(0.01) # small delay to ensure that the UI has time to update before the next value is sent
+    def open_archive(self, manifest:AirfoilManifest):
+        """
+        Opens the airfoil archive, writing it again first if it does not hold the current contents of the airfoil folder.
+        The archive is written from the files parsed by the manifest refresh and the unchanged airfoils of the previous
+        archive, see AirfoilManifest.records().
+        Returns None if the archive cannot be written, in which case the airfoil files are parsed on demand.
+        """
+        try:
+            previous = AirfoilArchive(AIRFOILS_ARCHIVE) if os.path.exists(AIRFOILS_ARCHIVE) else None
+        except (OSError, ValueError) as e:
+            logger.warning(f"Ignoring unreadable airfoil archive: {e}")
+            previous = None
+        if previous is not None and manifest.matches(previous):
+            return previous
+
+        try:
+            self.process_step(1, "Update airfoil archive")
+            records, hashes = manifest.records(previous)
+            write_archive(AIRFOILS_ARCHIVE, AIRFOILS_FOLDER, records, hashes)
+            return AirfoilArchive(AIRFOILS_ARCHIVE)
+        except (OSError, ValueError) as e:
+            logger.error(f"Airfoil archive unavailable: {e}")
+            return None
+
+    def open_index(self, index_class, index_path:str, step:str):
+        """
+        Opens an index derived from the archive (SimilarityIndex, ParameterTable). If it was not built from the current
+        archive, the rows of the unchanged airfoils are reused and only the other rows are computed from the archive.
+        Returns None if there is no archive to build it from.
+        """
+        if self.archive is None:
+            return None
+        try:
+            previous = index_class.load(index_path) if os.path.exists(index_path) else None
+        except (OSError, ValueError, KeyError) as e:
+            logger.warning(f"Ignoring unreadable {index_class.__name__}: {e}")
+            previous = None
+        if previous is not None and previous.HASHES is not None and previous.HASHES == self.archive.HASHES and previous.PATHS == self.archive.PATHS:
+            return previous
+
+        try:
+            self.process_step(1, step)
+            index = index_class.from_archive(self.archive, previous=previous)
+            index.save(index_path)
+            return index
+        except (OSError, ValueError, KeyError) as e:
+            logger.error(f"{index_class.__name__} unavailable: {e}")
+            return None
+
+    def render_thumbnails(self)->dict:
+        """
+        Renders the thumbnails of the airfoils in the archive that are not in the thumbnail folder yet, in a process pool.
+        Returns the thumbnail of every airfoil by path, an empty dict if there is no archive or the thumbnails cannot be written.
+        """
+        if self.archive is None:
+            return dict()
+        self.process_step(1, "Render airfoil thumbnails")
+        foils = ((path, self.archive.coordinates(i), self.archive.split(i)) for i, path in enumerate(self.archive.PATHS))
+        try:
+            return render_thumbnails(foils, AIRFOILS_THUMBNAILS)
+        except OSError as e:
+            logger.error(f"Airfoil thumbnails unavailable: {e}")
+            return dict()
+
+    def process_step(self, level:int, step:str, count:int=1, force:bool=False):
+        """
+        Advances the progress by count steps. loadingProgress is emitted at most once every PROGRESS_INTERVAL seconds,
+        unless force is True, so the UI is not flooded with updates and the loader never has to wait for it.
+        """
+        self.step_number += count
         logger.log(level=level, msg=step)
-        self.loadingProgress.emit(self.step_number, step)
+        now = time.monotonic()
+        if force or now - self._last_progress >= self.PROGRESS_INTERVAL:
+            self._last_progress = now
+            self.loadingProgress.emit(self.step_number, step)
 
 class SplashController(QObject):
     completed = False
@@ -74,6 +168,21 @@ class SplashController(QObject):
     def finish_loading(self):
         self.loadingComplete.emit()
 
+class SimilarityController(QObject):
+    """
+    Exposes the shape-similarity index to QML
+    """
+    index = None
+
+    @Slot(str, int, result='QVariantList')
+    def findSimilar(self, path, count):
+        """
+        Returns the count airfoils most similar to the airfoil at path, as a list of {name, path, distance}
+        """
+        if self.index is None or path not in self.index:
+            return []
+        return [{"name": name, "path": similar_path, "distance": distance} for name, similar_path, distance in self.index.similar_to(path, count)]
+
 class ProjectController(QObject):
     current_project_path = None
     current_project_data = None
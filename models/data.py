@@ -2,7 +2,8 @@
 This module contains various model classes that are not directly based on airfoil shapes.
 
 Classes:
-    AirfoilListModel: A Qt ListModel that contains the names and paths of all the available airfoils in the database
+    AirfoilListModel: A Qt ListModel that contains the names, paths and thumbnails of all the available airfoils in the database
+    AirfoilFilterModel: A filtered view of AirfoilListModel, by name and by geometric parameters
     AirfoilModelItem: 
     ProjectListModel: A Qt ListModel that contains the names
     ProjectModelItem: 
@@ -15,9 +16,7 @@ Functions:
 from typing import Dict
 
 import numpy as np
-from scipy.interpolate import interp1d
 # from scipy.misc import derivative
-import matplotlib.pyplot as plt
 from logger_config import logger
 
 from pathlib import Path
@@ -26,16 +25,20 @@ import sys
 from PySide2.QtCore import Property, QAbstractListModel, QObject, Qt, QModelIndex, Signal, Slot
 from PySide2.QtGui import QStandardItem, QStandardItemModel
 
+from scripts.search import NameIndex
+
 # Qt Model classes
 
 class AirfoilListModel(QAbstractListModel):
-    """This List model contains the available airfoils, name and path"""
+    """This List model contains the available airfoils, name, path and the url of a preview thumbnail if there is one"""
     PathRole = Qt.UserRole + 1
     NameRole = Qt.UserRole + 2
+    ThumbnailRole = Qt.UserRole + 3
 
     def __init__(self, parent=None):
         super().__init__(parent)
         self._data = list()
+        self._thumbnails = dict() # path -> url of the thumbnail image
     
     def data(self, index, role=Qt.DisplayRole):
         if not index.isValid() or not (0 <= index.row() < len(self._data)):
@@ -47,6 +50,8 @@ class AirfoilListModel(QAbstractListModel):
             return item.path
         elif role == AirfoilListModel.NameRole or role == Qt.DisplayRole:
             return item.name
+        elif role == AirfoilListModel.ThumbnailRole:
+            return self._thumbnails.get(item.path, "")
         return None
 
     def rowCount(self, parent=QModelIndex()):
@@ -55,9 +60,21 @@ class AirfoilListModel(QAbstractListModel):
     def roleNames(self) -> Dict:
         roles = {
             AirfoilListModel.PathRole: b"path",
-            AirfoilListModel.NameRole: b"name"
+            AirfoilListModel.NameRole: b"name",
+            AirfoilListModel.ThumbnailRole: b"thumbnail"
             }
         return roles
+
+    def setThumbnails(self, thumbnails):
+        """
+        Sets the preview thumbnails of the airfoils, rendered beforehand (see scripts/thumbnails.py)
+
+        Args:
+            thumbnails (dict): path of an airfoil -> path of its thumbnail image
+        """
+        self._thumbnails = {path: Path(image).as_uri() for path, image in thumbnails.items()}
+        if self._data:
+            self.dataChanged.emit(self.index(0), self.index(len(self._data) - 1), [AirfoilListModel.ThumbnailRole])
     
     @Slot(str, str)
     def addItem(self, name, path):
@@ -65,6 +82,186 @@ class AirfoilListModel(QAbstractListModel):
         self._data.append(AirfoilModelItem(name, path))
         self.endInsertRows()
 
+    def addItems(self, items):
+        """
+        Adds many airfoils with a single insert, so attached views are only notified once.
+        An empty model is reset instead, which is cheaper for views than an insert.
+
+        Args:
+            items (iterable): tuples of (name, path)
+        """
+        new_items = [AirfoilModelItem(name, path) for name, path in items]
+        if not new_items:
+            return
+        if not self._data:
+            self.beginResetModel()
+            self._data = new_items
+            self.endResetModel()
+        else:
+            self.beginInsertRows(QModelIndex(), len(self._data), len(self._data) + len(new_items) - 1)
+            self._data.extend(new_items)
+            self.endInsertRows()
+
+class AirfoilFilterModel(QAbstractListModel):
+    """
+    Filtered view of an AirfoilListModel for incremental search by name and filtering by geometric parameters.
+    The names are kept in a NameIndex that follows the rows of the source model. A change of filterString is answered from
+    the index and the view is reset once with the list of matching source rows, so no per-row filter callback is needed.
+    parameterFilter is a query on a ParameterTable (see scripts/parameters.py), e.g. "t/c between 0.10 and 0.14 and camber < 2%",
+    answered as a boolean mask over the table. Airfoils that are not in the table do not match a parameter filter.
+    """
+    filterStringChanged = Signal()
+    parameterFilterChanged = Signal()
+    parameterFilterValidChanged = Signal()
+
+    def __init__(self, source_model=None, parent=None):
+        super().__init__(parent)
+        self._source = None
+        self._filter_string = ""
+        self._rows = list() # rows of the source model shown by this model
+        self._index = NameIndex()
+        self._parameter_filter = ""
+        self._parameter_filter_valid = True
+        self._table = None
+        self._table_rows = np.empty(0, dtype=np.int64) # row of the parameter table of each source row, -1 if not in the table
+        if source_model is not None:
+            self.setSourceModel(source_model)
+
+    def sourceModel(self):
+        return self._source
+
+    def setSourceModel(self, source_model):
+        if self._source is not None:
+            self._source.rowsInserted.disconnect(self._rows_inserted)
+            self._source.modelReset.disconnect(self._rebuild_index)
+            self._source.dataChanged.disconnect(self._source_data_changed)
+        self._source = source_model
+        source_model.rowsInserted.connect(self._rows_inserted)
+        source_model.modelReset.connect(self._rebuild_index)
+        source_model.dataChanged.connect(self._source_data_changed)
+        self._rebuild_index()
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid() or not (0 <= index.row() < len(self._rows)):
+            return None
+        return self._source.data(self._source.index(self._rows[index.row()]), role)
+
+    def rowCount(self, parent=QModelIndex()):
+        return len(self._rows)
+
+    def roleNames(self) -> Dict:
+        return self._source.roleNames() if self._source is not None else {}
+
+    @Slot(int, result=int)
+    def sourceRow(self, row):
+        """Returns the row of the source model shown at row, or -1 if row is out of range"""
+        return self._rows[row] if 0 <= row < len(self._rows) else -1
+
+    def _names(self, first, last):
+        return [self._source.data(self._source.index(row), AirfoilListModel.NameRole) for row in range(first, last + 1)]
+
+    def _table_rows_of(self, first, last):
+        if self._table is None:
+            return np.full(last - first + 1, -1, dtype=np.int64)
+        paths = (self._source.data(self._source.index(row), AirfoilListModel.PathRole) for row in range(first, last + 1))
+        return np.fromiter((self._table.index_of(path) for path in paths), dtype=np.int64, count=last - first + 1)
+
+    def _rebuild_index(self):
+        self._index.clear()
+        self._index.extend(self._names(0, self._source.rowCount() - 1))
+        self._table_rows = self._table_rows_of(0, self._source.rowCount() - 1)
+        self._apply_filter()
+
+    def _source_data_changed(self, top_left, bottom_right, roles=None):
+        # the changed source rows are scattered over the filtered rows, the rows in between are signalled too
+        rows = np.asarray(self._rows)
+        rows = np.flatnonzero((rows >= top_left.row()) & (rows <= bottom_right.row()))
+        if len(rows):
+            self.dataChanged.emit(self.index(int(rows[0])), self.index(int(rows[-1])), roles or [])
+
+    def _rows_inserted(self, parent, first, last):
+        if first != len(self._index):
+            # rows were inserted before the end, the row numbers of the index no longer match
+            self._rebuild_index()
+            return
+        self._index.extend(self._names(first, last))
+        self._table_rows = np.concatenate((self._table_rows, self._table_rows_of(first, last)))
+        self._apply_filter()
+
+    def _parameter_mask(self):
+        """Returns the boolean mask of the source rows matching parameterFilter, or None if there is no valid filter"""
+        valid = True
+        mask = None
+        if self._parameter_filter.strip():
+            try:
+                if self._table is None:
+                    raise ValueError("no parameter table")
+                table_mask = self._table.query(self._parameter_filter)
+                mask = np.zeros(len(self._table_rows), dtype=bool)
+                in_table = self._table_rows >= 0
+                mask[in_table] = table_mask[self._table_rows[in_table]]
+            except ValueError as e:
+                # usually a query that is still being typed, the list is left unfiltered by parameters
+                logger.debug(f"Parameter filter {self._parameter_filter!r} ignored: {e}")
+                valid = False
+        if valid != self._parameter_filter_valid:
+            self._parameter_filter_valid = valid
+            self.parameterFilterValidChanged.emit()
+        return mask
+
+    def _apply_filter(self):
+        matches = self._index.search(self._filter_string)
+        mask = self._parameter_mask()
+        if mask is None:
+            rows = list(range(len(self._index))) if matches is None else sorted(matches)
+        elif matches is None:
+            rows = np.flatnonzero(mask).tolist()
+        else:
+            rows = [row for row in sorted(matches) if mask[row]]
+        self.beginResetModel()
+        self._rows = rows
+        self.endResetModel()
+
+    def setParameterTable(self, table):
+        """
+        Sets the ParameterTable that parameterFilter queries, None to disable parameter filtering
+        """
+        self._table = table
+        if self._source is not None:
+            self._table_rows = self._table_rows_of(0, self._source.rowCount() - 1)
+        self._apply_filter()
+
+    def getFilterString(self):
+        return self._filter_string
+
+    @Slot(str)
+    def setFilterString(self, text):
+        if text == self._filter_string:
+            return
+        self._filter_string = text
+        self._apply_filter()
+        self.filterStringChanged.emit()
+
+    filterString = Property(str, fget=getFilterString, fset=setFilterString, notify=filterStringChanged)
+
+    def getParameterFilter(self):
+        return self._parameter_filter
+
+    @Slot(str)
+    def setParameterFilter(self, query):
+        if query == self._parameter_filter:
+            return
+        self._parameter_filter = query
+        self._apply_filter()
+        self.parameterFilterChanged.emit()
+
+    parameterFilter = Property(str, fget=getParameterFilter, fset=setParameterFilter, notify=parameterFilterChanged)
+
+    def getParameterFilterValid(self):
+        return self._parameter_filter_valid
+
+    parameterFilterValid = Property(bool, fget=getParameterFilterValid, notify=parameterFilterValidChanged)
+
 def createModelItem(name, required_attrs):
     """
     This class factory creates a class with the given name and required attributes. It creates classes for the ModelItem for airfoils and for any other list list model needed in this project.
@@ -0,0 +1,196 @@
+"""
+This module contains the geometry core shared by the airfoil classes.
+
+An airfoil is stored once, as a single float64 (N, 2) buffer in Selig order (from the trailing edge over the upper surface
+to the leading edge and back over the lower surface to the trailing edge) plus the index of the leading edge point.
+The surfaces and coordinate columns are views into that buffer, so they never have to be copied or kept in sync.
+
+Classes:
+    GeometryCore: Coordinates of an airfoil and the index of its leading edge
+    GeometryViews: Mixin exposing the GEOMETRY of an airfoil class under the attribute names of the airfoil classes
+"""
+import numpy as np
+
+from scripts.repanel import geometry_hash, repanel_cache
+from scripts.simplify import simplify
+
+class GeometryCore:
+    """
+    Coordinates of an airfoil in Selig order and the index of its leading edge. All the surface and column accessors
+    return views, writing into them changes the buffer.
+
+    Attributes:
+        points (np.ndarray): (N, 2) float64 coordinates in Selig order
+        le_index (int): index of the leading edge point in points
+    """
+    __slots__ = ("points", "le_index")
+
+    def __init__(self, points:np.ndarray, le_index:int):
+        """
+        Args:
+            points (np.ndarray): (N, 2) coordinates in Selig order. A float64 array is used as is, without a copy
+            le_index (int): index of the leading edge point
+        """
+        points = np.asarray(points, dtype=np.float64)
+        if points.ndim != 2 or points.shape[1] != 2:
+            raise ValueError(f"Expected (N, 2) coordinates, got an array of shape {points.shape}")
+        if not 0 <= le_index < len(points):
+            raise ValueError(f"Leading edge index {le_index} is outside of the {len(points)} points")
+        self.points = points
+        self.le_index = int(le_index)
+
+    @classmethod
+    def from_surfaces(cls, upper, lower)->"GeometryCore":
+        """
+        Builds the buffer from separate surfaces, both running from the leading edge to the trailing edge.
+        A leading edge point shared by both surfaces is only stored once.
+
+        Args:
+            upper (array_like): (2, n) x and y of the upper surface
+            lower (array_like): (2, m) x and y of the lower surface
+        """
+        upper = np.asarray(upper, dtype=np.float64).T
+        lower = np.asarray(lower, dtype=np.float64).T
+        if np.array_equal(upper[0], lower[0]):
+            lower = lower[1:]
+        return cls(np.concatenate((upper[::-1], lower)), len(upper) - 1)
+
+    def __len__(self):
+        return len(self.points)
+
+    def __repr__(self):
+        return f"GeometryCore({len(self)} points, le_index={self.le_index})"
+
+    def copy(self)->"GeometryCore":
+        return GeometryCore(self.points.copy(), self.le_index)
+
+    def digest(self)->str:
+        """Hash of the coordinates and the leading edge index, used as a cache key for data derived from the geometry"""
+        return geometry_hash(self.points, self.le_index)
+
+    def repaneled(self, num_points:int, spacing:str="cosine")->"GeometryCore":
+        """
+        Returns the geometry repaneled to num_points points along an arc-length spline, see scripts.repanel.
+        Results are memoized, the returned buffer is read-only and shared with other callers.
+        """
+        points, le_index = repanel_cache.get(self.points, self.le_index, num_points, spacing)
+        return GeometryCore(points, le_index)
+
+    def simplified(self, tolerance:float)->"GeometryCore":
+        """
+        Returns a copy decimated with Douglas-Peucker, deviating from this outline by at most tolerance chords, see
+        scripts.simplify. The leading and trailing edge points are kept.
+        """
+        points, le_index = simplify(self.points, self.le_index, tolerance)
+        return GeometryCore(points, le_index)
+
+    @property
+    def nbytes(self)->int:
+        return self.points.nbytes
+
+    @property
+    def x(self)->np.ndarray:
+        return self.points[:, 0]
+
+    @property
+    def y(self)->np.ndarray:
+        return self.points[:, 1]
+
+    @property
+    def upper(self)->np.ndarray:
+        """(n, 2) upper surface from the leading edge to the trailing edge"""
+        return self.points[self.le_index::-1]
+
+    @property
+    def lower(self)->np.ndarray:
+        """(m, 2) lower surface from the leading edge to the trailing edge"""
+        return self.points[self.le_index:]
+
+    @property
+    def leading_edge(self)->np.ndarray:
+        return self.points[self.le_index]
+
+    @property
+    def trailing_edge(self)->np.ndarray:
+        """Middle of the trailing edge, between the first and last points"""
+        return 0.5 * (self.points[0] + self.points[-1])
+
+    def chord(self)->float:
+        """Length of the chord, from the leading edge to the middle of the trailing edge"""
+        return float(np.hypot(*(self.trailing_edge - self.leading_edge)))
+
+    def quarter_chord(self)->tuple:
+        """x, y of the point a quarter of the way from the leading edge to the middle of the trailing edge"""
+        leading_edge = self.leading_edge
+        return tuple(float(value) for value in leading_edge + 0.25 * (self.trailing_edge - leading_edge))
+
+    def closed_trailing_edge(self, blend:bool=True)->"GeometryCore":
+        """
+        Returns a copy with a closed trailing edge. If blend is True, the first and last points are moved to the middle of
+        the trailing edge, otherwise the middle of the trailing edge is added at both ends, so the trailing edge is a short
+        line (the x of both ends is moved to the middle first). A trailing edge that is already closed is left as is.
+        """
+        points = self.points
+        if np.array_equal(points[0], points[-1]):
+            return self.copy()
+        middle = self.trailing_edge
+        closed = points.copy()
+        if blend:
+            closed[0] = closed[-1] = middle
+            return GeometryCore(closed, self.le_index)
+        closed[0, 0] = closed[-1, 0] = middle[0]
+        return GeometryCore(np.concatenate((middle[np.newaxis], closed, middle[np.newaxis])), self.le_index + 1)
+
+
+def _column_view(surface:str, column:int, doc:str)->property:
+    """Property for a coordinate column of a surface of GEOMETRY. Assigning to it writes into the buffer"""
+    def fget(self):
+        return getattr(self.GEOMETRY, surface)[:, column]
+    def fset(self, values):
+        getattr(self.GEOMETRY, surface)[:, column] = values
+    return property(fget, fset, doc=doc)
+
+class GeometryViews:
+    """
+    Mixin for the airfoil classes, which keep their coordinates in a GeometryCore attribute named GEOMETRY.
+    It exposes the surfaces and coordinate columns as views of that one buffer, under the attribute names the airfoil
+    classes have always used.
+    """
+    __slots__ = ()
+
+    UPPER_X = _column_view("upper", 0, "x of the upper surface, from the leading edge to the trailing edge")
+    UPPER_Y = _column_view("upper", 1, "y of the upper surface, from the leading edge to the trailing edge")
+    LOWER_X = _column_view("lower", 0, "x of the lower surface, from the leading edge to the trailing edge")
+    LOWER_Y = _column_view("lower", 1, "y of the lower surface, from the leading edge to the trailing edge")
+
+    @property
+    def UPPER(self)->np.ndarray:
+        """(2, n) x and y of the upper surface, from the leading edge to the trailing edge"""
+        return self.GEOMETRY.upper.T
+
+    @property
+    def LOWER(self)->np.ndarray:
+        """(2, m) x and y of the lower surface, from the leading edge to the trailing edge"""
+        return self.GEOMETRY.lower.T
+
+    @property
+    def LE_INDEX(self)->int:
+        return self.GEOMETRY.le_index
+
+    @property
+    def X(self)->np.ndarray:
+        """
+        x in reversed Selig order, from the trailing edge of the lower surface to the leading edge and over the upper
+        surface to its trailing edge. See order_points() of the airfoil classes for the order starting at the leading edge
+        """
+        return self.GEOMETRY.x[::-1]
+
+    @property
+    def Y(self)->np.ndarray:
+        """y in the same order as X"""
+        return self.GEOMETRY.y[::-1]
+
+    @property
+    def Z(self)->np.ndarray:
+        """z in the same order as X, the airfoil is planar so this is always zero"""
+        return np.zeros(len(self.GEOMETRY))
@@ -0,0 +1,154 @@
+"""
+This module contains the update scheduler of the airfoil shown in the UI.
+
+The spin boxes change the incidence, chord and position of the airfoil many times a second. Transforming the airfoil on
+the GUI thread for every change, and redrawing the chart after each one, queues up work that is out of date before it
+is done. The scheduler coalesces the changes instead: the latest parameters replace any that have not been computed yet,
+the coordinates are transformed on a worker thread, and the result is handed to the airfoil, which emits dataChanged,
+at most once per display frame. The worker writes into a small pool of result buffers that are handed back once the
+airfoil has copied them into its own buffer (see Airfoil_new.IN_PLACE), so a burst of updates allocates nothing.
+
+Classes:
+    TransformWorker: Thread transforming the source coordinates of an airfoil with the latest submitted transform
+    UpdateScheduler: Coalesces transform requests for an Airfoil_new and publishes the results once per frame
+"""
+import threading
+from collections import deque
+
+import numpy as np
+
+from PySide2.QtCore import QObject, QThread, QTimer, Signal, Slot
+
+from scripts.transforms import AffineTransform
+
+class TransformWorker(QThread):
+    """
+    Thread transforming coordinates. Only the latest submitted job is kept, a job submitted while another one is being
+    computed replaces any job still waiting. Results are written into buffers handed back with recycle(), a new buffer
+    is only allocated if none of the right shape is free.
+
+    Signals:
+        transformed (tuple): the job tuple with the transformed (N, 2) coordinates appended
+    """
+    transformed = Signal(tuple)
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._condition = threading.Condition()
+        self._job = None
+        self._stopping = False
+        self._free = deque() # result buffers no longer used, appended by the GUI thread and popped by the worker
+
+    def recycle(self, points:np.ndarray):
+        """Hands back a result buffer once it is no longer used, a later result is written into it"""
+        self._free.append(points)
+
+    def _result_buffer(self, shape:tuple)->np.ndarray:
+        while self._free:
+            buffer = self._free.pop()
+            if buffer.shape == shape:
+                return buffer
+        return np.empty(shape, dtype=np.float64)
+
+    def submit(self, points, transform:AffineTransform, *context):
+        """Queues the transform of points, context is passed back unchanged with the result"""
+        with self._condition:
+            self._job = (points, transform, context)
+            self._condition.notify()
+
+    def stop(self):
+        """Stops the thread once the job being computed is done and waits for it"""
+        with self._condition:
+            self._stopping = True
+            self._condition.notify()
+        self.wait()
+
+    def run(self):
+        while True:
+            with self._condition:
+                while self._job is None and not self._stopping:
+                    self._condition.wait()
+                if self._stopping:
+                    return
+                (points, transform, context), self._job = self._job, None
+            self.transformed.emit(context + (transform.apply(points, out=self._result_buffer(points.shape)),))
+
+class UpdateScheduler(QObject):
+    """
+    Coalesces transform requests for an Airfoil_new: the latest requested incidence, chord and position win, they are
+    transformed on a TransformWorker and the airfoil is updated, emitting dataChanged, at most once per FRAME_INTERVAL.
+    A result computed for an airfoil that has been reloaded since it was requested is dropped.
+
+    Attributes:
+        FRAME_INTERVAL (int): minimum time in milliseconds between two updates of the airfoil
+    """
+    FRAME_INTERVAL = 16
+
+    def __init__(self, airfoil, parent=None):
+        super().__init__(parent)
+        self.airfoil = airfoil
+        self._requested = None # (source, incidence, chord, position) of the last request
+        self._result = None # latest result waiting for the next frame
+        self.worker = TransformWorker()
+        self.worker.transformed.connect(self._on_transformed) # queued, the worker emits from its own thread
+        self._frame = QTimer(self)
+        self._frame.setSingleShot(True)
+        self._frame.setInterval(self.FRAME_INTERVAL)
+        self._frame.timeout.connect(self._on_frame)
+        self.worker.start()
+
+    @Slot()
+    def stop(self):
+        self.worker.stop()
+
+    def request(self, incidence:float=None, chord:float=None, position:tuple=None):
+        """
+        Requests new transform parameters, arguments that are None keep their last requested value
+        """
+        airfoil = self.airfoil
+        source = airfoil.SOURCE
+        if source is None:
+            return
+        if self._requested is None or self._requested[0] is not source:
+            self._requested = (source, airfoil.INCIDENCE, airfoil.CHORD, airfoil.POSITION)
+        _, last_incidence, last_chord, last_position = self._requested
+        incidence = last_incidence if incidence is None else incidence
+        chord = last_chord if chord is None else chord
+        position = last_position if position is None else tuple(position)
+        self._requested = (source, incidence, chord, position)
+
+        transform = AffineTransform.from_parameters(scale=chord / airfoil.SOURCE_CHORD, angle=incidence,
+                                                    position=position, pivot=airfoil.SOURCE_QUARTER_CHORD)
+        self.worker.submit(source.points, transform, source, incidence, chord, position)
+
+    @Slot(float)
+    def setIncidence(self, incidence:float):
+        self.request(incidence=incidence)
+
+    @Slot(float)
+    def setChord(self, chord:float):
+        self.request(chord=chord)
+
+    @Slot(float, float)
+    def setPosition(self, x_position:float, y_position:float):
+        self.request(position=(x_position, y_position))
+
+    @Slot(tuple)
+    def _on_transformed(self, result:tuple):
+        if self._result is not None:
+            # superseded before it was shown
+            self.worker.recycle(self._result[-1])
+        self._result = result
+        if not self._frame.isActive():
+            # nothing was published during the last frame, the result can be shown right away
+            self._on_frame()
+
+    def _on_frame(self):
+        result, self._result = self._result, None
+        if result is None:
+            return
+        source, incidence, chord, position, points = result
+        if source is self.airfoil.SOURCE:
+            self.airfoil.set_transformed(points, incidence, chord, position)
+        self.worker.recycle(points) # the airfoil keeps a copy
+        self._frame.start()
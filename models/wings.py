@@ -2,6 +2,7 @@
 This module contains various classes that are based on airfoil shapes.
 
 Classes:
+    Section: A wing panel blended between a root and a tip airfoil
     Wing: base class of all classes implemented in the module
     HorizontalTail: 
     VerticalTail: 
@@ -9,11 +10,143 @@ Classes:
 
 """Extra classes for wing objects and propeller objects that are based on various Airfoil sections. A horizontal tail is a type of wing, a vertical tail is a single sided wing, and a propeller is a wing with a twist that is rotated about an axis."""
 
-from .airfoils import Airfoil
+import numpy as np
+
+from .geometry import GeometryCore
+from scripts.transforms import AffineTransform, transform_sections
+from scripts.writers import export_sections_to
+from scripts.gcode import generate_gcode
+
+def unit_chord(geometry:GeometryCore)->GeometryCore:
+    """
+    Returns a copy of the geometry with the leading edge at (0, 0) and the middle of the trailing edge at (1, 0)
+    """
+    leading_edge = geometry.leading_edge
+    dx, dy = geometry.trailing_edge - leading_edge
+    transform = AffineTransform().translate(-leading_edge[0], -leading_edge[1]).rotate(np.degrees(np.arctan2(dy, dx))).scale(1 / np.hypot(dx, dy))
+    return GeometryCore(transform.apply(geometry.points), geometry.le_index)
+
+class Section:
+    """
+    A wing panel between a root and a tip airfoil
+
+    Both airfoils are repaneled once to the same number of points with the same spacing and normalised to a unit chord,
+    so point i of the root corresponds to point i of the tip. Intermediate sections are blends of the two, produced for
+    any number of spanwise stations as one (K, N, 2) array.
+
+    Attributes:
+        ROOT (GeometryCore): unit-chord root airfoil
+        TIP (GeometryCore): unit-chord tip airfoil, with the same number of points and leading edge index as ROOT
+        ROOT_CHORD (float): chord at the root
+        TIP_CHORD (float): chord at the tip
+        SPAN (float): length of the section along the span
+        TWIST (float): incidence of the tip relative to the root in degrees, varying linearly along the span
+        DIHEDRAL (float): dihedral angle in degrees
+    """
+    def __init__(self, root_foil, tip_foil, root_chord, tip_chord, span, twist=0.0, dihedral=0.0, num_points:int=161, spacing:str="cosine"):
+        """
+        Args:
+            root_foil: airfoil at the root, an Airfoil, Airfoil_new or GeometryCore
+            tip_foil: airfoil at the tip, an Airfoil, Airfoil_new or GeometryCore
+            root_chord (float): chord at the root
+            tip_chord (float): chord at the tip
+            span (float): length of the section along the span
+            twist (float): incidence of the tip relative to the root in degrees
+            dihedral (float): dihedral angle in degrees
+            num_points (int): number of points of every section
+            spacing (str): spacing of the points, see scripts.repanel
+        """
+        self.ROOT = unit_chord(self._geometry(root_foil).repaneled(num_points, spacing))
+        self.TIP = unit_chord(self._geometry(tip_foil).repaneled(num_points, spacing))
+        self.ROOT_CHORD = root_chord
+        self.TIP_CHORD = tip_chord
+        self.SPAN = span
+        self.TWIST = twist
+        self.DIHEDRAL = dihedral
+
+    @staticmethod
+    def _geometry(foil)->GeometryCore:
+        return foil if isinstance(foil, GeometryCore) else foil.GEOMETRY
+
+    @property
+    def LE_INDEX(self)->int:
+        return self.ROOT.le_index
+
+    def weights(self, count:int, weighting=None)->np.ndarray:
+        """
+        Returns the blend weights of count sections evenly spaced along the span, 0 is the root shape and 1 the tip shape
+
+        Args:
+            count (int): number of sections, including the root and the tip
+            weighting: None for a linear blend, a callable mapping the spanwise fractions (0 at the root, 1 at the tip)
+                to weights, or an array of count weights
+        """
+        fractions = np.linspace(0.0, 1.0, count)
+        if weighting is None:
+            return fractions
+        weights = weighting(fractions) if callable(weighting) else np.asarray(weighting, dtype=np.float64)
+        if weights.shape != (count,):
+            raise ValueError(f"Expected {count} weights, got an array of shape {weights.shape}")
+        return weights
+
+    def blend(self, weights)->np.ndarray:
+        """
+        Returns the unit-chord shapes blended between the root and the tip
+
+        Args:
+            weights (array_like): (K,) blend weights, 0 is the root shape and 1 the tip shape
+
+        Returns:
+            np.ndarray: (K, N, 2) coordinates in Selig order, with the leading edge at LE_INDEX
+        """
+        weights = np.asarray(weights, dtype=np.float64)[:, np.newaxis, np.newaxis]
+        return self.ROOT.points + weights * (self.TIP.points - self.ROOT.points)
+
+    def sections(self, count:int, weighting=None)->tuple[np.ndarray, np.ndarray]:
+        """
+        Generates count sections from the root to the tip in one vectorized operation. The shapes are blended with the
+        weighting, while chord, twist and dihedral offset vary linearly along the span. Sections are scaled and twisted
+        about their quarter chord, which stays at x = 0.
+
+        Args:
+            count (int): number of sections, including the root and the tip
+            weighting: see weights()
+
+        Returns:
+            tuple: spanwise (K,) positions of the sections along the span, sections (K, N, 2) coordinates
+        """
+        fractions = np.linspace(0.0, 1.0, count)
+        spanwise = fractions * self.SPAN
+        chords = self.ROOT_CHORD + fractions * (self.TIP_CHORD - self.ROOT_CHORD)
+        offsets = spanwise * np.tan(np.radians(self.DIHEDRAL))
+        shapes = self.blend(self.weights(count, weighting))
+        return spanwise, transform_sections(shapes, chords, fractions * self.TWIST, offsets=offsets, pivot=(0.25, 0.0), out=shapes)
+
+    def export(self, filename:str, count:int, weighting=None, name:str="section", **options)->str:
+        """
+        Writes count sections from the root to the tip into one file, each at its spanwise position, in the format given
+        by the extension of filename (.dxf, .svg or .xml), see scripts.writers
+
+        Args:
+            filename (str): path of the file
+            count (int): number of sections, including the root and the tip
+            weighting: see weights()
+            name (str): sections are named name_0 to name_{count - 1}
+            options: passed on to the writer, e.g. plane
+        """
+        spanwise, sections = self.sections(count, weighting)
+        return export_sections_to(filename, sections, spanwise, names=name, **options)
+
+    def gcode(self, feed:float, **options)->str:
+        """
+        Returns the G-code to cut the section with a hot-wire cutter, the root on the XY tower and the tip on the UV
+        tower, see scripts.gcode.generate_gcode for the options (kerf, lead_in, tower_span, ...)
+
+        Args:
+            feed (float): cutting speed in mm/min of the faster end of the wire
+        """
+        return generate_gcode(self, feed, **options)
 
-class Section(Airfoil):
-    def __init__(self, root_foil, tip_foil, root_chord, tip_chord, span, twist, dihedral):
-        pass
     def add_control_surface(self, root_position, tip_position, chord_percent):
         pass
 
@@ -7,7 +7,7 @@ ComboBox {
     //property var customModel: []
     currentIndex: -1
 
-    model: airfoilListModel
+    model: airfoilFilterModel
     textRole: "name"
     valueRole: "path"
     implicitWidth: 120
@@ -18,12 +18,25 @@ ComboBox {
 
     delegate: ItemDelegate {
         width: control.width
-        contentItem: Text {
-            text: model.name
-            color: "#49906a"
-            font: control.font
-            elide: Text.ElideRight
-            verticalAlignment: Text.AlignVCenter
+        contentItem: Row {
+            spacing: 6
+            // preview rendered beforehand by the loader, empty until the thumbnails are ready
+            Image {
+                source: model.thumbnail
+                width: 48
+                height: 16
+                fillMode: Image.PreserveAspectFit
+                asynchronous: true
+                anchors.verticalCenter: parent.verticalCenter
+            }
+            Text {
+                text: model.name
+                color: "#49906a"
+                font: control.font
+                width: control.width - 60
+                elide: Text.ElideRight
+                anchors.verticalCenter: parent.verticalCenter
+            }
         }
         background: Rectangle {
             border.color: "#212bbe"
@@ -43,6 +43,7 @@ Item {
             anchors.right: parent.right
             anchors.top: select_foil_combobox.bottom
             anchors.margins: 10
+            onValueModified: transformScheduler.setIncidence(value)
         }
         ManipulationSpinBox {
             id: scalingSpinbox
@@ -50,6 +51,7 @@ Item {
             anchors.right: parent.right
             anchors.top: rotationSpinbox.bottom
             anchors.margins: 10
+            onValueModified: if (value > 0) transformScheduler.setChord(value)
         }
         ManipulationSpinBox {
             id: xSpinbox
@@ -57,6 +59,7 @@ Item {
             anchors.right: parent.right
             anchors.top: scalingSpinbox.bottom
             anchors.margins: 10
+            onValueModified: transformScheduler.setPosition(value, ySpinbox.value)
         }
         ManipulationSpinBox {
             id: ySpinbox
@@ -64,6 +67,7 @@ Item {
             anchors.right: parent.right
             anchors.top: xSpinbox.bottom
             anchors.margins: 10
+            onValueModified: transformScheduler.setPosition(xSpinbox.value, value)
         }
 
         TextButton {
@@ -96,14 +100,9 @@ Item {
         antialiasing: true
 
         function loadChartData() {
-            foil_chart.removeAllSeries()
-
-            var series = foil_chart.createSeries(LineSeries, "Data Plot", myaxisX, myaxisY);
-            for (var i = 0; i < dataModel.data.length; ++i) {
-                console.log(i);
-                //console.log(dataModel.data[i][0], dataModel.data[i][1]);
-                series.append(dataModel.data[i][0], dataModel.data[i][1]);
-            }
+            // the series is created once and its points are replaced by the model in a single call
+            var series = foil_chart.count > 0 ? foil_chart.series(0) : foil_chart.createSeries(LineSeries, "Data Plot", myaxisX, myaxisY);
+            dataModel.fillSeries(series)
         }
 
         Connections {
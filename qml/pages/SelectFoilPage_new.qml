@@ -3,6 +3,7 @@ import QtQuick.Window 2.12
 import QtQuick.Controls 2.12
 import QtQuick.Layouts 1.12
 import QtCharts 2.12
+import QtQml 2.12
 import QtQuick.Dialogs 1.2
 import "../components"
 
@@ -37,6 +38,27 @@ Item {
             anchors.fill: parent
             anchors.margins: 10
 
+            CustomTextField {
+                id: searchField
+                Layout.preferredHeight: 30
+                Layout.preferredWidth: 120
+                borderWidth: 1
+                placeholderText: qsTr("Search airfoils")
+
+                // the filter model narrows the combobox list as the user types
+                onTextChanged: airfoilFilterModel.filterString = text
+            }
+            CustomTextField {
+                id: parameterField
+                Layout.preferredHeight: 30
+                Layout.preferredWidth: 160
+                borderWidth: 1
+                borderColor: airfoilFilterModel.parameterFilterValid ? "#33334c" : "#d94848"
+                placeholderText: qsTr("t/c > 0.1 and camber < 2%")
+
+                // filters the combobox list by the geometric parameters of the airfoils
+                onTextChanged: airfoilFilterModel.parameterFilter = text
+            }
             CustomComboBox {
                 id: select_foilCombobox
                 Layout.preferredHeight: 30
@@ -66,6 +88,62 @@ Item {
 
                 colorDefault: "white"
             }
+            TextButton {
+                id: compareButton
+                text: qsTr("Compare")
+                Layout.minimumHeight: 30
+                Layout.minimumWidth: 70
+
+                colorDefault: "white"
+                onClicked: comparisonModel.addAirfoil(select_foilCombobox.currentValue)
+            }
+            TextButton {
+                id: similarButton
+                text: qsTr("Similar")
+                Layout.minimumHeight: 30
+                Layout.minimumWidth: 60
+
+                colorDefault: "white"
+                onClicked: {
+                    similarList.model = similarityController.findSimilar(select_foilCombobox.currentValue, 10)
+                    similarDialog.open()
+                }
+            }
+
+            Popup {
+                id: similarDialog
+                y: parent.height
+                width: 260
+                height: 280
+                visible: false
+
+                background: Rectangle {
+                    border.color: "#707070"
+                    border.width: 1
+                    radius: 10
+                }
+                contentItem: ListView {
+                    id: similarList
+                    clip: true
+                    spacing: 2
+
+                    // entries are {name, path, distance}, distance is the rms surface difference in chord units
+                    delegate: ItemDelegate {
+                        width: similarList.width
+                        height: 24
+                        text: modelData.name + "  (" + modelData.distance.toFixed(4) + ")"
+                        onClicked: {
+                            dataModel.load(modelData.path)
+                            similarDialog.close()
+                        }
+                    }
+                    Label {
+                        anchors.centerIn: parent
+                        visible: similarList.count === 0
+                        text: qsTr("No similar airfoils")
+                    }
+                }
+            }
         }
     }
     Rectangle {
@@ -171,6 +249,7 @@ Item {
                         anchors.right: parent.right
                         anchors.top: parent.top
                         anchors.margins: 10
+                        onValueModified: transformScheduler.setPosition(value, ySpinbox.value)
                     }
                     ManipulationSpinBox {
                         id: ySpinbox
@@ -178,6 +257,7 @@ Item {
                         anchors.right: parent.right
                         anchors.top: xSpinbox.bottom
                         anchors.margins: 10
+                        onValueModified: transformScheduler.setPosition(xSpinbox.value, value)
                     }
                 }
             }
@@ -339,17 +419,39 @@ Item {
         legend.visible: false
         antialiasing: true
 
+        property var dataSeries: null
+
         function loadChartData() {
-            foil_chart.removeAllSeries()
+            // the series is created once and its points are replaced by the model in a single call,
+            // only the part inside the axes is sent, at about one point per pixel of the plot area
+            if (dataSeries === null)
+                dataSeries = foil_chart.createSeries(ChartView.SeriesTypeLine, "Data Plot", myaxisX, myaxisY);
+            dataModel.fillVisibleSeries(dataSeries, myaxisX.min, myaxisX.max, myaxisY.min, myaxisY.max, Math.ceil(foil_chart.plotArea.width))
+        }
 
-            var series = foil_chart.createSeries(LineSeries, "Data Plot", myaxisX, myaxisY);
-            for (var i = 0; i < dataModel.data.length; ++i) {
-                console.log(i);
-                //console.log(dataModel.data[i][0], dataModel.data[i][1]);
-                series.append(dataModel.data[i][0], dataModel.data[i][1]);
+        // one series per compared airfoil, a change of one airfoil only refills its own series
+        Instantiator {
+            model: comparisonModel
+            delegate: QtObject {
+                property int version: model.version
+                property color colour: model.colour
+                property bool shown: model.visible
+                property var series: null
+                onVersionChanged: if (series) comparisonModel.fillSeries(index, series)
+                onColourChanged: if (series) series.color = colour
+                onShownChanged: if (series) series.visible = shown
             }
+            onObjectAdded: {
+                object.series = foil_chart.createSeries(ChartView.SeriesTypeLine, "Comparison " + index, myaxisX, myaxisY)
+                object.series.color = object.colour
+                object.series.visible = object.shown
+                comparisonModel.fillSeries(index, object.series)
+            }
+            onObjectRemoved: foil_chart.removeSeries(object.series)
         }
 
+        onPlotAreaChanged: foil_chart.loadChartData()
+
         Connections {
             target: dataModel
             function onDataChanged () {
@@ -366,11 +468,13 @@ Item {
             id:myaxisX
             min: 0; max: 1
             tickCount: 11
+            onRangeChanged: foil_chart.loadChartData()
         }
         ValueAxis {
             id:myaxisY
             min: -0.5; max: 0.5
             tickCount: 11
+            onRangeChanged: foil_chart.loadChartData()
         }
     }
 }
@@ -0,0 +1,215 @@
+"""
+Packed binary archive of the airfoil database
+
+The archive is built once from the airfoil folder and read back through a memory map, so that selecting an airfoil is a slice
+of one contiguous coordinate block instead of opening and parsing its text file.
+
+Layout (little endian):
+    header: magic (8 bytes), version (uint32), number of foils (uint32), index size in bytes (uint64), number of points (uint64)
+    index: utf-8 JSON holding the folder, file names, airfoil names and optionally the content hash of every file, padded
+        to a multiple of 8 bytes
+    offsets: int64 array of (number of foils + 1), the points of foil i are coordinates[offsets[i]:offsets[i+1]]
+    splits: int64 array of (number of foils), the leading edge index of each foil within its own points
+    coordinates: float64 array of (number of points, 2), every foil in Selig order as listed in its file
+
+Classes:
+    AirfoilArchive: Read-only, memory-mapped view of an archive file
+
+Functions:
+    write_archive: Writes parsed airfoils to an archive file
+    build_archive: Compiles the airfoil folder into an archive file
+    match_rows: Matches the airfoils of an archive with the rows of an index built from a previous archive
+"""
+import json
+import os
+import struct
+
+import numpy as np
+
+from logger_config import logger
+from scripts.functions import get_foils_from_dir
+from scripts.ingest import ingest_airfoils
+
+ARCHIVE_MAGIC = b"AIRFMARC"
+ARCHIVE_VERSION = 2
+HEADER = struct.Struct("<8sIIQQ")
+
+def _pad(size:int)->int:
+    """Returns the number of bytes needed to bring size to a multiple of 8"""
+    return -size % 8
+
+def write_archive(archive_path:str, folder:str, records:list, hashes:list=None)->int:
+    """
+    Writes parsed airfoils to one packed archive, in the order of records
+
+    Args:
+        archive_path (str): path of the archive file to write
+        folder (str): the airfoil folder the records were parsed from
+        records (list): AirfoilRecords, see scripts.ingest. Their coordinates may be views into another archive
+        hashes (list): content hash of every file, see scripts.manifest. Lets derived indexes and later archives reuse
+            the rows of unchanged files
+
+    Returns:
+        int: the number of airfoils written to the archive
+    """
+    names = [record.name for record in records]
+    paths = [record.path for record in records]
+    splits = np.array([record.le_index for record in records], dtype=np.int64)
+    offsets = np.zeros(len(records) + 1, dtype=np.int64)
+    if records:
+        np.cumsum([len(record.coordinates) for record in records], out=offsets[1:])
+        coordinates = np.ascontiguousarray(np.concatenate([record.coordinates for record in records]), dtype='<f8')
+    else:
+        coordinates = np.empty((0, 2), dtype='<f8')
+
+    index = {
+        "folder": os.fspath(folder),
+        "files": [os.path.basename(path) for path in paths],
+        "names": names,
+    }
+    if hashes is not None:
+        index["hashes"] = list(hashes)
+    index = json.dumps(index).encode('utf-8')
+    index += b"\0" * _pad(len(index))
+
+    # write to a temporary file first so a reader never maps a half-written archive
+    temp_path = archive_path + ".tmp"
+    with open(temp_path, 'wb') as f:
+        f.write(HEADER.pack(ARCHIVE_MAGIC, ARCHIVE_VERSION, len(names), len(index), len(coordinates)))
+        f.write(index)
+        f.write(offsets.astype('<i8').tobytes())
+        f.write(splits.astype('<i8').tobytes())
+        f.write(coordinates.tobytes())
+    os.replace(temp_path, archive_path)
+
+    logger.info(f"{len(names)} airfoils ({len(coordinates)} points) written to {archive_path}")
+    return len(names)
+
+def build_archive(folder:str, archive_path:str, max_workers:int=None)->tuple[int, list]:
+    """
+    Compiles every airfoil file in folder into one packed archive. The files are parsed and validated in parallel,
+    files that fail are logged and left out of the archive.
+
+    Args:
+        folder (str): the airfoil folder
+        archive_path (str): path of the archive file to write
+        max_workers (int): the number of worker processes used to parse the files, defaults to the number of CPUs
+
+    Returns:
+        tuple: count, errors - the number of airfoils written to the archive and an IngestError for every file left out
+    """
+    records, errors, stats = ingest_airfoils([path for _, path in get_foils_from_dir(folder)], max_workers=max_workers)
+    if errors:
+        logger.warning(f"{stats.num_errors} of {stats.num_files} airfoil files could not be parsed and were left out of {archive_path}")
+    return write_archive(archive_path, folder, records), errors
+
+def match_rows(archive, previous)->np.ndarray:
+    """
+    Matches the airfoils of an archive with the rows of an index built from a previous archive (SimilarityIndex,
+    ParameterTable). A row can be reused if the previous index has the same file with the same content hash.
+
+    Args:
+        archive (AirfoilArchive): the current archive
+        previous: an index with PATHS and HASHES, or None
+
+    Returns:
+        np.ndarray: (len(archive),) row of every airfoil in previous, -1 where it has to be computed
+    """
+    sources = np.full(len(archive), -1, dtype=np.intp)
+    if previous is None or archive.HASHES is None or previous.HASHES is None:
+        return sources
+    rows = {(os.path.normpath(path), digest): row for row, (path, digest) in enumerate(zip(previous.PATHS, previous.HASHES))}
+    for i, (path, digest) in enumerate(zip(archive.PATHS, archive.HASHES)):
+        sources[i] = rows.get((os.path.normpath(path), digest), -1)
+    return sources
+
+class AirfoilArchive:
+    """
+    Read-only view of an airfoil archive. The file is memory mapped, so the arrays returned by coordinates(),
+    upper() and lower() are views into the map and no coordinate data is copied or parsed.
+
+    Attributes:
+        PATH (str): path to the archive file
+        FOLDER (str): the airfoil folder the archive was built from
+        NAMES (list): the airfoil names
+        PATHS (list): the paths of the airfoil files, in the same order as NAMES
+        HASHES (list): the content hashes of the airfoil files, in the same order as NAMES, None if they were not recorded
+        OFFSETS (np.ndarray): per-foil offsets into COORDINATES
+        SPLITS (np.ndarray): per-foil leading edge index
+        COORDINATES (np.ndarray): (M, 2) coordinate block of every foil
+    """
+    def __init__(self, archive_path:str):
+        """
+        Args:
+            archive_path (str): path to an archive written by build_archive()
+
+        Raises:
+            ValueError: if the file is not an airfoil archive of a supported version
+        """
+        self.PATH = archive_path
+        self._buffer = np.memmap(archive_path, dtype=np.uint8, mode='r')
+
+        if len(self._buffer) < HEADER.size:
+            raise ValueError(f"{archive_path} is not an airfoil archive")
+        magic, version, count, index_size, num_points = HEADER.unpack(self._buffer[:HEADER.size].tobytes())
+        if magic != ARCHIVE_MAGIC or version != ARCHIVE_VERSION:
+            raise ValueError(f"{archive_path} is not an airfoil archive of version {ARCHIVE_VERSION}")
+
+        start = HEADER.size
+        index = json.loads(self._buffer[start:start + index_size].tobytes().rstrip(b"\0").decode('utf-8'))
+        start += index_size
+        self.OFFSETS = self._buffer[start:start + 8 * (count + 1)].view('<i8')
+        start += 8 * (count + 1)
+        self.SPLITS = self._buffer[start:start + 8 * count].view('<i8')
+        start += 8 * count
+        self.COORDINATES = self._buffer[start:start + 16 * num_points].view('<f8').reshape(-1, 2)
+
+        self.FOLDER = index["folder"]
+        self.NAMES = index["names"]
+        self.PATHS = [os.path.join(self.FOLDER, file) for file in index["files"]]
+        self.HASHES = index.get("hashes")
+        self._lookup = {os.path.normpath(path): i for i, path in enumerate(self.PATHS)}
+
+    def __len__(self):
+        return len(self.NAMES)
+
+    def __contains__(self, path):
+        return os.path.normpath(path) in self._lookup
+
+    def index_of(self, path:str)->int:
+        """
+        Returns the position of the airfoil file in the archive
+
+        Raises:
+            KeyError: if the file is not in the archive
+        """
+        return self._lookup[os.path.normpath(path)]
+
+    def coordinates(self, i:int)->np.ndarray:
+        """
+        Returns the (N, 2) coordinates of foil i in Selig order, as a view into the archive
+        """
+        return self.COORDINATES[self.OFFSETS[i]:self.OFFSETS[i+1]]
+
+    def split(self, i:int)->int:
+        """
+        Returns the leading edge index of foil i
+        """
+        return int(self.SPLITS[i])
+
+    def upper(self, i:int)->np.ndarray:
+        """
+        Returns the upper surface of foil i, from the trailing edge to the leading edge
+        """
+        return self.coordinates(i)[:self.split(i)+1]
+
+    def lower(self, i:int)->np.ndarray:
+        """
+        Returns the lower surface of foil i, from the leading edge to the trailing edge
+        """
+        return self.coordinates(i)[self.split(i):]
+
+
+if __name__ == "__main__":
+    from globals import AIRFOILS_ARCHIVE, AIRFOILS_FOLDER
+    build_archive(AIRFOILS_FOLDER, AIRFOILS_ARCHIVE)
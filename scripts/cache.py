@@ -0,0 +1,155 @@
+"""
+In-memory caches of parsed and derived airfoil geometry
+
+Classes:
+    LRUCache: Thread-safe least-recently-used cache with a memory budget
+    GeometryCache: Least-recently-used cache of parsed airfoil files with a memory budget
+"""
+import os
+import threading
+from collections import OrderedDict
+
+from globals import GEOMETRY_CACHE_BYTES
+from scripts.parsers import read_airfoil
+
+class LRUCache:
+    """
+    Least-recently-used cache with a memory budget. Every value is stored with its size in bytes, and the least recently
+    used values are evicted once the total exceeds max_bytes. The values are computed by the caller between lookup() and
+    store(), outside the lock, so other threads are not blocked while a value is parsed or computed.
+
+    Attributes:
+        max_bytes (int): memory budget for the cached values
+        nbytes (int): memory currently used by the cached values
+        hits (int): number of lookups served from the cache
+        misses (int): number of lookups that found no valid value
+    """
+    def __init__(self, max_bytes:int):
+        """
+        Args:
+            max_bytes (int): memory budget for the cached values
+        """
+        self.max_bytes = max_bytes
+        self.nbytes = 0
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict() # key -> (value, nbytes)
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._entries)
+
+    def lookup(self, key, valid=None):
+        """
+        Returns the cached value of key and marks it as the most recently used, or None if it is not cached
+
+        Args:
+            key: key of the value
+            valid (callable): if given, a cached value for which valid(value) is False is treated as missing
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and (valid is None or valid(entry[0])):
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return entry[0]
+            self.misses += 1
+            return None
+
+    def store(self, key, value, nbytes:int):
+        """
+        Caches a value in place of any value of key, then evicts the least recently used values until the cache is
+        within budget. A value larger than the whole budget is not cached.
+        """
+        with self._lock:
+            self._remove(key)
+            if nbytes <= self.max_bytes:
+                self._entries[key] = (value, nbytes)
+                self.nbytes += nbytes
+                self._evict()
+
+    def resize(self, max_bytes:int):
+        """
+        Changes the memory budget, evicting the least recently used entries if the cache is now over budget
+        """
+        with self._lock:
+            self.max_bytes = max_bytes
+            self._evict()
+
+    def clear(self):
+        """
+        Empties the cache and resets the counters
+        """
+        with self._lock:
+            self._entries.clear()
+            self.nbytes = 0
+            self.hits = 0
+            self.misses = 0
+
+    def stats(self)->dict:
+        """
+        Returns the hit and miss counters and the memory use of the cache
+        """
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "entries": len(self._entries),
+                "nbytes": self.nbytes,
+                "max_bytes": self.max_bytes,
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": self.hits / lookups if lookups else 0.0,
+            }
+
+    def _remove(self, key):
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self.nbytes -= entry[1]
+
+    def _evict(self):
+        while self.nbytes > self.max_bytes and self._entries:
+            _, (_, nbytes) = self._entries.popitem(last=False)
+            self.nbytes -= nbytes
+
+class GeometryCache(LRUCache):
+    """
+    Least-recently-used cache of parsed airfoil files, keyed by path and modification time.
+    A file that changed on disk since it was cached is parsed again. The cached arrays are read-only,
+    since the same array is handed to every caller.
+    """
+    def __init__(self, max_bytes:int=GEOMETRY_CACHE_BYTES):
+        """
+        Args:
+            max_bytes (int): memory budget for the cached coordinate arrays
+        """
+        super().__init__(max_bytes)
+
+    def get(self, filename:str)->tuple:
+        """
+        Returns the parsed airfoil file, parsing it if it is not cached or changed on disk
+
+        Args:
+            filename (str): Path to the airfoil file.
+
+        Returns:
+            tuple: name, num_points, data, i_le - see scripts.parsers.read_airfoil
+
+        Raises:
+            OSError: if the file cannot be read
+            ValueError: if the file is empty or fewer than 2 points were found
+        """
+        path = os.path.normpath(filename)
+        mtime = os.stat(path).st_mtime_ns
+
+        entry = self.lookup(path, valid=lambda entry: entry[0] == mtime)
+        if entry is not None:
+            return entry[1]
+
+        name, num_points, data, i_le = read_airfoil(path)
+        data.setflags(write=False)
+        geometry = (name, num_points, data, i_le)
+        self.store(path, (mtime, geometry), data.nbytes)
+        return geometry
+
+# cache shared by all airfoil objects
+geometry_cache = GeometryCache()
@@ -0,0 +1,157 @@
+"""
+Export of airfoil and wing section coordinates to text curve files
+
+CAD software reads curves as one point per line with three coordinates, so the 2D coordinates of an airfoil are first
+mapped to the plane the airfoil is used in. A plane is named horizontal axis first, then vertical axis: in "XY" the
+chord runs along X and the thickness along Y, in "ZY" the chord runs along Z and the thickness along Y. The remaining
+axis holds a constant depth, e.g. the spanwise position of a wing section.
+
+The mapped (N, 3) array is formatted with a single string formatting operation over all the values and written with
+one call, instead of formatting and writing every point separately. Batches of airfoils or wing sections are written to
+a folder by a process pool.
+
+Formats:
+    solidworks_curve: tab separated x, y, z per line, readable as a SolidWorks curve (.txt)
+    csv: comma separated x, y, z per line with a header (.csv)
+
+Functions:
+    plane_axes: Returns the 3D axes the horizontal and vertical coordinates are mapped to, and the depth axis
+    map_to_plane: Maps 2D coordinates to 3D coordinates in a plane, vectorized over any number of sections
+    format_points: Formats an (N, 3) array as text lines
+    write_curve: Writes the coordinates of an airfoil to a curve file
+    export_batch: Writes the coordinates of many airfoils or sections to a folder in parallel
+    export_sections: Writes every section of a (K, N, 2) stack to its own file, at its spanwise depth
+"""
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+PLANES = ("XY", "YX", "XZ", "ZX", "YZ", "ZY")
+FORMATS = {
+    # format: (file extension, delimiter, header)
+    "solidworks_curve": (".txt", "\t", ""),
+    "csv": (".csv", ",", "x,y,z\n"),
+}
+# below this number of files the pool start-up costs more than it saves
+MIN_PARALLEL_FILES = 32
+
+def plane_axes(plane:str)->tuple[int, int, int]:
+    """
+    Returns the indices (0 for X, 1 for Y, 2 for Z) of the axes the horizontal and vertical coordinates are mapped to,
+    and of the remaining depth axis
+
+    Raises:
+        ValueError: if plane is not one of PLANES, in any case
+    """
+    plane = plane.upper()
+    if plane not in PLANES:
+        raise ValueError(f"Unknown plane {plane!r}, expected one of {', '.join(PLANES)}")
+    horizontal, vertical = "XYZ".index(plane[0]), "XYZ".index(plane[1])
+    return horizontal, vertical, 3 - horizontal - vertical
+
+def map_to_plane(points:np.ndarray, plane:str="XY", depth=0.0)->np.ndarray:
+    """
+    Maps 2D coordinates to 3D coordinates in a plane
+
+    Args:
+        points (np.ndarray): (..., N, 2) coordinates, e.g. (N, 2) for an airfoil or (K, N, 2) for K sections
+        plane (str): one of PLANES
+        depth (array_like): position along the remaining axis, a scalar or one value per section (shape (...))
+
+    Returns:
+        np.ndarray: (..., N, 3) coordinates
+    """
+    points = np.asarray(points, dtype=np.float64)
+    horizontal, vertical, other = plane_axes(plane)
+    mapped = np.empty(points.shape[:-1] + (3,))
+    mapped[..., horizontal] = points[..., 0]
+    mapped[..., vertical] = points[..., 1]
+    mapped[..., other] = np.asarray(depth, dtype=np.float64)[..., np.newaxis]
+    return mapped
+
+def format_points(points:np.ndarray, delimiter:str="\t", precision:int=8)->str:
+    """
+    Formats an (N, 3) array as N lines of delimited values, with one %-formatting operation over all the values
+
+    Args:
+        points (np.ndarray): (N, 3) coordinates
+        delimiter (str): separator of the values of a line
+        precision (int): significant digits of every value
+    """
+    points = np.asarray(points, dtype=np.float64)
+    line = delimiter.join([f"%.{precision}g"] * points.shape[1]) + "\n"
+    return (line * len(points)) % tuple(points.ravel().tolist())
+
+def write_curve(filename:str, points:np.ndarray, plane:str="XY", depth:float=0.0, format:str="solidworks_curve", precision:int=8)->str:
+    """
+    Writes the coordinates of an airfoil to a curve file
+
+    Args:
+        filename (str): path of the file, the extension of the format is added if it is missing
+        points (np.ndarray): (N, 2) coordinates
+        plane (str): one of PLANES
+        depth (float): position along the axis that is not in the plane
+        format (str): one of FORMATS
+        precision (int): significant digits of every value
+
+    Returns:
+        str: the path of the written file
+
+    Raises:
+        ValueError: if the plane or the format is unknown
+    """
+    if format not in FORMATS:
+        raise ValueError(f"Unknown format {format!r}, expected one of {', '.join(FORMATS)}")
+    extension, delimiter, header = FORMATS[format]
+    if not filename.endswith(extension):
+        filename += extension
+    text = header + format_points(map_to_plane(points, plane, depth), delimiter, precision)
+    with open(filename, mode="w", newline="\n") as file:
+        file.write(text)
+    return filename
+
+def _export_job(job:tuple)->str:
+    filename, points, plane, depth, format, precision = job
+    return write_curve(filename, points, plane, depth, format, precision)
+
+def export_batch(foils, folder:str, plane:str="XY", format:str="solidworks_curve", precision:int=8, processes:int=None)->list:
+    """
+    Writes the coordinates of many airfoils or sections to a folder, in a process pool
+
+    Args:
+        foils (iterable): tuples of (name, points) or (name, points, depth), with (N, 2) points. Spaces in the names are
+            replaced by underscores in the file names
+        folder (str): target folder, created if it does not exist
+        plane, format, precision: see write_curve()
+        processes (int): number of worker processes, the number of CPUs by default. 0 and batches of fewer than
+            MIN_PARALLEL_FILES are written in this process
+
+    Returns:
+        list: paths of the written files, in the order of foils
+    """
+    plane_axes(plane) # fail before starting any worker
+    if format not in FORMATS:
+        raise ValueError(f"Unknown format {format!r}, expected one of {', '.join(FORMATS)}")
+    os.makedirs(folder, exist_ok=True)
+    jobs = list()
+    for foil in foils:
+        name, points = foil[:2]
+        depth = foil[2] if len(foil) > 2 else 0.0
+        jobs.append((os.path.join(folder, name.replace(' ', '_')), np.asarray(points), plane, float(depth), format, precision))
+
+    if processes == 0 or len(jobs) < MIN_PARALLEL_FILES:
+        return [_export_job(job) for job in jobs]
+    # spawned workers only import this module, forking a process that runs Qt threads is not safe
+    context = multiprocessing.get_context("spawn")
+    with ProcessPoolExecutor(max_workers=processes, mp_context=context) as pool:
+        return list(pool.map(_export_job, jobs, chunksize=max(1, len(jobs) // (4 * (processes or os.cpu_count() or 1)))))
+
+def export_sections(name:str, sections:np.ndarray, spanwise, folder:str, plane:str="XY", format:str="solidworks_curve", precision:int=8, processes:int=None)->list:
+    """
+    Writes every section of a (K, N, 2) stack, e.g. from models.wings.Section.sections(), to its own file named
+    name_0, name_1, ..., with the depth axis at its spanwise position. See export_batch() for the other arguments.
+    """
+    foils = ((f"{name}_{k}", section, depth) for k, (section, depth) in enumerate(zip(sections, np.asarray(spanwise, dtype=np.float64))))
+    return export_batch(foils, folder, plane, format, precision, processes)
@@ -3,18 +3,20 @@ Helper functions
 """
 import os
 from pathlib import Path
-from bs4 import BeautifulSoup
 import re
 
 def get_foils_from_dir(data_path:str)-> list:
     """
-    Checks through the data_path directory and returns a list of tuples of (filename, path) for each file that is present in the directory
+    Checks through the data_path directory and returns a list of tuples of (filename, path) for each file that is present in the directory.
+    Sub-directories are skipped.
     """
-    # implement check to know if f is a file or directory, since including a directory will likely raise errors
-    files = [(f, os.path.join(data_path, f)) for f in os.listdir(data_path)]# if os.path.isfile(f)]
+    with os.scandir(data_path) as entries:
+        files = [(entry.name, os.path.join(data_path, entry.name)) for entry in entries if entry.is_file()]
     return files
 
 def get_save_airfoils():
+    # BeautifulSoup is only needed when downloading, so it is not imported with the other helper functions
+    from bs4 import BeautifulSoup
     try:
         import urllib.request as urllib2
     except ImportError:
@@ -0,0 +1,139 @@
+"""
+Hot-wire cutter G-code
+
+A hot-wire cutter drives the two ends of the wire independently: one tower moves along X and Y, the other along U and V.
+Cutting a tapered or twisted wing panel needs the two ends to reach corresponding points of the root and tip outlines at
+the same time. models.wings.Section repanels the root and tip onto the same stations, so point i of the root corresponds
+to point i of the tip and every line of G-code moves both ends to a pair of matched points.
+
+The toolpath is built from the root and tip outlines of a Section:
+    - both outlines are offset outwards by half the kerf, the width of foam the wire melts away
+    - the wire ends are extrapolated from the root and tip planes to the towers, if the tower spacing is given
+    - the wire enters and leaves at the trailing edge through a lead-in
+    - the feed rate of every move is scaled by the lengths of the root and tip moves, so that the end that travels
+      further moves at the nominal feed rate. Machine controllers apply F to the length of the move over all four axes,
+      which would otherwise slow the cut down wherever the root and tip moves differ in length.
+
+All the moves are formatted with one %-formatting operation over the whole (M, 5) array.
+
+Functions:
+    offset_outline: Offsets a closed outline along its normals
+    toolpath: Returns the synchronised XY and UV wire paths of a Section
+    feed_rates: Returns the feed rate of every move of a four-axis path
+    format_moves: Formats moves as G1 lines
+    generate_gcode: Returns the G-code to cut a Section
+"""
+import numpy as np
+
+AXES = ("X", "Y", "U", "V")
+
+def offset_outline(points:np.ndarray, distance:float)->np.ndarray:
+    """
+    Offsets an outline along the normals of its points, outwards for positive distances. The normal of a point is the
+    normal of the chord between its neighbours, so the offset outline keeps one point per point and stays matched.
+
+    Args:
+        points (np.ndarray): (N, 2) coordinates of a closed outline in Selig order, clockwise or counter-clockwise
+        distance (float): offset distance
+    """
+    points = np.asarray(points, dtype=np.float64)
+    if distance == 0:
+        return points.copy()
+    # neighbours, the first and last points only have one
+    tangents = np.empty_like(points)
+    tangents[1:-1] = points[2:] - points[:-2]
+    tangents[0] = points[1] - points[0]
+    tangents[-1] = points[-1] - points[-2]
+    lengths = np.hypot(*tangents.T)
+    tangents /= np.where(lengths > 0, lengths, 1.0)[:, np.newaxis]
+    normals = np.column_stack((tangents[:, 1], -tangents[:, 0])) # right of the direction of travel
+    # the right side is outside for a counter-clockwise outline (positive area)
+    x, y = points.T
+    area = 0.5 * (np.dot(x, np.roll(y, -1)) - np.dot(y, np.roll(x, -1)))
+    return points + np.sign(area or 1.0) * distance * normals
+
+def toolpath(section, kerf:float=0.0, tip_kerf:float=None, lead_in:float=10.0, tower_span:float=None, root_offset:float=0.0)->tuple[np.ndarray, np.ndarray]:
+    """
+    Returns the synchronised paths of the two ends of the wire to cut a Section
+
+    Args:
+        section (Section): the wing panel, its root and tip share the same stations (see models.wings.Section)
+        kerf (float): width of the cut at the root
+        tip_kerf (float): width of the cut at the tip, kerf if not given
+        lead_in (float): distance behind the trailing edge where the wire enters and leaves the foam
+        tower_span (float): distance between the XY and UV towers. If given, the wire ends are extrapolated from the root
+            and tip planes to the towers, otherwise the root and tip outlines are used as they are
+        root_offset (float): distance from the XY tower to the root plane, used with tower_span
+
+    Returns:
+        tuple: xy, uv - the (M, 2) positions of the XY and UV ends of the wire, row i of both is reached at the same time
+    """
+    spanwise, (root, tip) = section.sections(2)
+    root = offset_outline(root, 0.5 * kerf)
+    tip = offset_outline(tip, 0.5 * (kerf if tip_kerf is None else tip_kerf))
+
+    # enter at the trailing edge, go around the outline and leave at the trailing edge
+    outlines = np.stack((root, tip))
+    trailing_edges = 0.5 * (outlines[:, 0] + outlines[:, -1])
+    starts = trailing_edges + np.array([lead_in, 0.0])
+    path = np.concatenate((starts[:, np.newaxis], trailing_edges[:, np.newaxis], outlines, trailing_edges[:, np.newaxis], starts[:, np.newaxis]), axis=1)
+
+    root_path, tip_path = path
+    if tower_span is None:
+        return root_path, tip_path
+    # the wire is a straight line through the root and tip points, extended to the towers
+    span = spanwise[-1] - spanwise[0]
+    direction = (tip_path - root_path) / span
+    return root_path - root_offset * direction, root_path + (tower_span - root_offset) * direction
+
+def feed_rates(xy:np.ndarray, uv:np.ndarray, feed:float)->np.ndarray:
+    """
+    Returns the F value of every move of a four-axis path, so that the end of the wire with the longer move travels at
+    feed. A move of length l_xy at one tower and l_uv at the other gets F = feed * hypot(l_xy, l_uv) / max(l_xy, l_uv).
+
+    Args:
+        xy, uv (np.ndarray): (M, 2) positions of both ends of the wire
+        feed (float): cutting speed of the faster end
+
+    Returns:
+        np.ndarray: (M - 1,) feed rates of the moves to rows 1 to M - 1
+    """
+    xy_lengths = np.hypot(*np.diff(xy, axis=0).T)
+    uv_lengths = np.hypot(*np.diff(uv, axis=0).T)
+    longest = np.maximum(xy_lengths, uv_lengths)
+    return np.where(longest > 0, feed * np.hypot(xy_lengths, uv_lengths) / np.where(longest > 0, longest, 1.0), feed)
+
+def format_moves(xy:np.ndarray, uv:np.ndarray, feeds:np.ndarray, axes:tuple=AXES, precision:int=4)->str:
+    """Formats moves to the rows of xy and uv, with their feed rates, as G1 lines"""
+    moves = np.column_stack((xy, uv, feeds))
+    line = f"G1 {axes[0]}%.{precision}f {axes[1]}%.{precision}f {axes[2]}%.{precision}f {axes[3]}%.{precision}f F%.1f\n"
+    return (line * len(moves)) % tuple(moves.ravel().tolist())
+
+def generate_gcode(section, feed:float, kerf:float=0.0, tip_kerf:float=None, lead_in:float=10.0, tower_span:float=None,
+                   root_offset:float=0.0, axes:tuple=AXES, heat:float=None, precision:int=4)->str:
+    """
+    Returns the G-code to cut a Section, in millimetres and absolute coordinates. The wire starts at the lead-in point,
+    which it moves to with a rapid move, and ends there.
+
+    Args:
+        section (Section): the wing panel, in millimetres
+        feed (float): cutting speed in mm/min of the faster end of the wire
+        kerf, tip_kerf, lead_in, tower_span, root_offset: see toolpath()
+        axes (tuple): names of the x and y axes of the first tower and of the second tower, e.g. ("X", "Y", "Z", "A") for GRBL
+        heat (float): if given, the wire is switched on with M3 S{heat} before the cut and off with M5 after it
+        precision (int): decimals of the coordinates
+
+    Returns:
+        str: the G-code program
+    """
+    xy, uv = toolpath(section, kerf, tip_kerf, lead_in, tower_span, root_offset)
+    lines = [
+        "(hot-wire cut generated by airfoil tools)",
+        "G21", # millimetres
+        "G90", # absolute coordinates
+        f"G0 {axes[0]}{xy[0, 0]:.{precision}f} {axes[1]}{xy[0, 1]:.{precision}f} {axes[2]}{uv[0, 0]:.{precision}f} {axes[3]}{uv[0, 1]:.{precision}f}",
+    ]
+    if heat is not None:
+        lines.append(f"M3 S{heat:g}")
+    program = "\n".join(lines) + "\n" + format_moves(xy[1:], uv[1:], feed_rates(xy, uv, feed), axes, precision)
+    return program + ("M5\n" if heat is not None else "") + "M2\n"
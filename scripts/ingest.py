@@ -0,0 +1,149 @@
+"""
+Parallel ingestion and validation of the airfoil database
+
+Files are parsed with the same logic as Airfoil_new.load (see scripts.parsers.read_airfoil) in a pool of worker processes.
+Every file comes back as an AirfoilRecord or an IngestError, so a bad file is reported instead of stopping the whole run.
+
+Classes:
+    AirfoilRecord: A parsed and validated airfoil file
+    IngestError: A file that could not be parsed or failed validation
+    IngestStats: Timing of an ingestion run
+
+Functions:
+    ingest_file: Parses and validates a single file
+    ingest_airfoils: Parses and validates a list of files across a process pool
+"""
+import multiprocessing
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from typing import NamedTuple
+
+import numpy as np
+
+from logger_config import logger
+from scripts.parsers import read_airfoil
+
+# below this number of files the pool start-up costs more than it saves
+MIN_PARALLEL_FILES = 64
+
+class AirfoilRecord(NamedTuple):
+    """
+    A parsed and validated airfoil file
+
+    Args:
+        path (str): path to the airfoil file
+        name (str): the airfoil name
+        num_points (int): the number of points defined in the file
+        coordinates (np.ndarray): (N, 2) coordinates in Selig order, a closed trailing edge point at both ends
+        le_index (int): index of the leading edge in coordinates
+    """
+    path: str
+    name: str
+    num_points: int
+    coordinates: np.ndarray
+    le_index: int
+
+class IngestError(NamedTuple):
+    """
+    A file that could not be parsed or failed validation
+
+    Args:
+        path (str): path to the airfoil file
+        error (str): the name of the exception, e.g. "ValueError"
+        message (str): the exception message
+    """
+    path: str
+    error: str
+    message: str
+
+class IngestStats(NamedTuple):
+    """
+    Timing of an ingestion run
+
+    Args:
+        num_files (int): the number of files processed
+        num_errors (int): the number of files that failed
+        workers (int): the number of worker processes, 1 if the files were processed in-process
+        seconds (float): wall time of the run
+        files_per_second (float): throughput of the run
+    """
+    num_files: int
+    num_errors: int
+    workers: int
+    seconds: float
+    files_per_second: float
+
+def validate_airfoil(data:np.ndarray, i_le:int):
+    """
+    Checks that the coordinates describe a usable airfoil
+
+    Raises:
+        ValueError: if a coordinate is not finite, a surface has fewer than 2 points or the chord is zero
+    """
+    if not np.isfinite(data).all():
+        raise ValueError("The coordinates contain values that are not finite.")
+    if i_le < 1 or i_le > len(data) - 2:
+        raise ValueError("The leading edge is at the end of the data, one of the surfaces is missing.")
+    if np.ptp(data[:, 0]) <= 0:
+        raise ValueError("The chord of the airfoil is zero.")
+
+def ingest_file(path:str):
+    """
+    Parses and validates a single airfoil file.
+    This runs in the worker processes, so it never raises: failures are returned as an IngestError.
+
+    Returns:
+        AirfoilRecord or IngestError
+    """
+    try:
+        name, num_points, data, i_le = read_airfoil(path)
+        validate_airfoil(data, i_le)
+    except Exception as e:
+        return IngestError(path, type(e).__name__, str(e))
+    return AirfoilRecord(path, name, num_points, data, i_le)
+
+def ingest_airfoils(paths:list, max_workers:int=None)->tuple[list, list, IngestStats]:
+    """
+    Parses and validates airfoil files across a process pool
+
+    Args:
+        paths (list): paths to the airfoil files
+        max_workers (int): the number of worker processes, defaults to the number of CPUs. Small batches and
+            max_workers=1 are processed in-process
+
+    Returns:
+        tuple: records, errors, stats - records and errors keep the order of paths
+    """
+    paths = list(paths)
+    workers = max_workers or os.cpu_count() or 1
+    workers = min(workers, max(1, len(paths)))
+
+    start = time.perf_counter()
+    if workers == 1 or len(paths) < MIN_PARALLEL_FILES:
+        workers = 1
+        results = [ingest_file(path) for path in paths]
+    else:
+        # send the files in chunks so each worker gets a few large tasks instead of one task per file
+        chunksize = max(1, len(paths) // (workers * 4))
+        # spawned workers only import this module, forking a process that runs Qt threads (the LoaderThread) is not safe
+        context = multiprocessing.get_context("spawn")
+        with ProcessPoolExecutor(max_workers=workers, mp_context=context) as executor:
+            results = list(executor.map(ingest_file, paths, chunksize=chunksize))
+    seconds = time.perf_counter() - start
+
+    records = [result for result in results if isinstance(result, AirfoilRecord)]
+    errors = [result for result in results if isinstance(result, IngestError)]
+    for error in errors:
+        logger.warning(f"Skipping {error.path}: {error.error}: {error.message}")
+
+    stats = IngestStats(len(paths), len(errors), workers, seconds, len(paths) / seconds if seconds > 0 else float('inf'))
+    logger.info(f"Ingested {stats.num_files} airfoil files ({stats.num_errors} errors) with {stats.workers} workers "
+                f"in {stats.seconds:.2f} s ({stats.files_per_second:.0f} files/s)")
+    return records, errors, stats
+
+
+if __name__ == "__main__":
+    from globals import AIRFOILS_FOLDER
+    from scripts.functions import get_foils_from_dir
+    ingest_airfoils([path for _, path in get_foils_from_dir(AIRFOILS_FOLDER)])
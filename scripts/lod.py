@@ -0,0 +1,89 @@
+"""
+Level-of-detail pyramid for drawing coordinates in charts
+
+A chart cannot show more than a few points per pixel, so pushing every coordinate of a dense airfoil into a series is
+wasted work, and more so when the chart is zoomed into a small part of the outline. The pyramid keeps, for every level,
+the indices of the points that are extreme (first, last, min and max x, min and max y) within buckets of 2**level
+consecutive points. Drawing only those points looks the same as drawing all of them, as long as a bucket is no wider
+than a pixel. A query returns the visible part of the outline from the coarsest level with no more than about one bucket
+per pixel.
+
+Classes:
+    LODPyramid: Min/max bucket pyramid of a polyline, queried by visible range and screen resolution
+
+Functions:
+    minmax_buckets: Returns the indices of the extreme points of buckets of consecutive points
+"""
+import numpy as np
+
+def minmax_buckets(points:np.ndarray, size:int)->np.ndarray:
+    """
+    Returns the sorted indices of the first, last and extreme x and y points of every bucket of size consecutive points
+
+    Args:
+        points (np.ndarray): (N, 2) coordinates of a polyline
+        size (int): number of points per bucket
+    """
+    count = len(points)
+    buckets = -(-count // size)
+    # the last bucket is padded with copies of the last point, their argmin/argmax land on it or on an equal point
+    padded = np.pad(points, ((0, buckets * size - count), (0, 0)), mode="edge").reshape(buckets, size, 2)
+    starts = np.arange(buckets)[:, np.newaxis] * size
+    extremes = np.concatenate((padded.argmin(axis=1), padded.argmax(axis=1)), axis=1) + starts
+    indices = np.concatenate((starts.ravel(), np.minimum(extremes.ravel(), count - 1), [count - 1]))
+    return np.unique(indices)
+
+class LODPyramid:
+    """
+    Min/max bucket pyramid of a polyline. Level 0 is every point, level k keeps the extreme points of buckets of 2**k points.
+
+    Attributes:
+        POINTS (np.ndarray): (N, 2) coordinates of the polyline
+        LEVELS (list): sorted index arrays into POINTS, one per level, down to a level of a single bucket
+    """
+    def __init__(self, points:np.ndarray):
+        self.POINTS = np.asarray(points, dtype=np.float64)
+        count = len(self.POINTS)
+        self.LEVELS = [np.arange(count)]
+        size = 2
+        while size < 2 * count:
+            self.LEVELS.append(minmax_buckets(self.POINTS, size))
+            size *= 2
+
+    def __len__(self):
+        return len(self.LEVELS)
+
+    def level_for(self, count:int, pixels:int)->int:
+        """Returns the level whose buckets hold about count / pixels points, so one bucket is about a pixel wide"""
+        if pixels <= 0 or count <= pixels:
+            return 0
+        return min(int(np.log2(count / pixels)), len(self.LEVELS) - 1)
+
+    def visible(self, x_range:tuple, y_range:tuple, pixels:int)->np.ndarray:
+        """
+        Returns the points to draw for a chart showing x_range by y_range over pixels pixels
+
+        The result is the contiguous stretch of the outline from the first to the last visible point, extended by one
+        point at each end so that the lines leaving the view are drawn. It is a single stretch, because joining separate
+        visible stretches would draw lines across the view that are not part of the outline.
+
+        Args:
+            x_range (tuple): min, max of the horizontal axis
+            y_range (tuple): min, max of the vertical axis
+            pixels (int): width of the plot area in pixels
+
+        Returns:
+            np.ndarray: (M, 2) coordinates, empty if no point is visible
+        """
+        x, y = self.POINTS[:, 0], self.POINTS[:, 1]
+        inside = np.flatnonzero((x >= x_range[0]) & (x <= x_range[1]) & (y >= y_range[0]) & (y <= y_range[1]))
+        if len(inside) == 0:
+            return self.POINTS[:0]
+        first = max(inside[0] - 1, 0)
+        last = min(inside[-1] + 1, len(self.POINTS) - 1)
+
+        indices = self.LEVELS[self.level_for(last - first + 1, pixels)]
+        # every level holds the first and last points, so the stretch can be widened to level points around first and last
+        start = np.searchsorted(indices, first, side="right") - 1
+        stop = np.searchsorted(indices, last, side="left") + 1
+        return self.POINTS[indices[start:stop]]
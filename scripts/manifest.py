@@ -0,0 +1,204 @@
+"""
+Persisted manifest of the airfoil folder
+
+The manifest records the size, modification time, content hash, airfoil name and point count of every file in the airfoil
+folder. On startup each file is only stat-ed and compared against its entry; files are hashed and parsed only if they are new
+or their size or modification time changed. The files parsed by a refresh are kept as records, so the archive can be
+written from them and from the unchanged airfoils of the previous archive without parsing any file twice.
+
+Classes:
+    AirfoilManifest: Loads, refreshes and saves the manifest of an airfoil folder
+"""
+import hashlib
+import json
+import os
+
+from logger_config import logger
+from scripts.ingest import AirfoilRecord, ingest_airfoils
+
+MANIFEST_VERSION = 1
+
+def file_hash(path:str)->str:
+    """
+    Returns the sha1 hex digest of the contents of the file
+    """
+    with open(path, 'rb') as f:
+        return hashlib.sha1(f.read()).hexdigest()
+
+class AirfoilManifest:
+    """
+    Manifest of the airfoil files in a folder
+
+    Attributes:
+        FOLDER (str): the airfoil folder
+        PATH (str): path of the manifest file
+        ENTRIES (dict): file name -> entry dict with the keys path, size, mtime, hash, name, num_points and error.
+            error is None for files that were parsed successfully
+        RECORDS (dict): file name -> AirfoilRecord of every file parsed successfully by the last refresh()
+    """
+    def __init__(self, folder:str, manifest_path:str, max_workers:int=None):
+        """
+        Args:
+            folder (str): the airfoil folder
+            manifest_path (str): path of the manifest file, it is created on the first save() if it does not exist
+            max_workers (int): the number of worker processes used to parse new and changed files, defaults to the number of CPUs
+        """
+        self.FOLDER = folder
+        self.PATH = manifest_path
+        self.max_workers = max_workers
+        self.ENTRIES = dict()
+        self.RECORDS = dict()
+        self.load()
+
+    def load(self):
+        """
+        Reads the manifest file. A missing, unreadable or outdated manifest is treated as empty.
+        """
+        try:
+            with open(self.PATH, 'r') as f:
+                manifest = json.load(f)
+        except FileNotFoundError:
+            return
+        except (OSError, ValueError) as e:
+            logger.warning(f"Ignoring unreadable airfoil manifest {self.PATH}: {e}")
+            return
+
+        if manifest.get("version") != MANIFEST_VERSION or manifest.get("folder") != os.fspath(self.FOLDER):
+            logger.info(f"Airfoil manifest {self.PATH} is outdated, it will be rebuilt")
+            return
+        self.ENTRIES = manifest["entries"]
+
+    def save(self):
+        """
+        Writes the manifest file
+        """
+        temp_path = self.PATH + ".tmp"
+        with open(temp_path, 'w') as f:
+            json.dump({"version": MANIFEST_VERSION, "folder": os.fspath(self.FOLDER), "entries": self.ENTRIES}, f)
+        os.replace(temp_path, self.PATH)
+
+    def refresh(self)->tuple[list, list, list]:
+        """
+        Brings the manifest up to date with the folder and saves it if anything changed.
+
+        Unchanged files cost one stat each. A file whose size or modification time changed is hashed and only parsed again
+        if its contents changed.
+
+        Returns:
+            tuple: added, changed, removed - lists of file names
+        """
+        added = []
+        changed = []
+        seen = set()
+        self.RECORDS = dict()
+        touched = False
+        to_parse = []
+
+        with os.scandir(self.FOLDER) as entries:
+            for entry in entries:
+                if not entry.is_file():
+                    continue
+                seen.add(entry.name)
+                stat = entry.stat()
+                old = self.ENTRIES.get(entry.name)
+                if old is not None and old["size"] == stat.st_size and old["mtime"] == stat.st_mtime_ns:
+                    continue
+
+                path = os.path.join(self.FOLDER, entry.name)
+                digest = file_hash(path)
+                if old is not None and old["hash"] == digest:
+                    # touched but not modified
+                    old["size"], old["mtime"] = stat.st_size, stat.st_mtime_ns
+                    touched = True
+                    continue
+
+                to_parse.append((entry.name, path, stat, digest))
+                (changed if old is not None else added).append(entry.name)
+
+        # parse all new and changed files in one batch, across worker processes if there are many of them
+        if to_parse:
+            records, errors, stats = ingest_airfoils([path for _, path, _, _ in to_parse], max_workers=self.max_workers)
+            results = {result.path: result for result in records + errors}
+            for name, path, stat, digest in to_parse:
+                self.ENTRIES[name] = self._entry(results[path], stat, digest)
+                if isinstance(results[path], AirfoilRecord):
+                    self.RECORDS[name] = results[path]
+
+        removed = [name for name in self.ENTRIES if name not in seen]
+        for name in removed:
+            del self.ENTRIES[name]
+
+        if added or changed or removed or touched or not os.path.exists(self.PATH):
+            self.save()
+        logger.info(f"Airfoil manifest: {len(self.ENTRIES)} files, {len(added)} added, {len(changed)} changed, {len(removed)} removed")
+        return added, changed, removed
+
+    def _entry(self, result, stat, digest:str)->dict:
+        """
+        Builds the manifest entry of a file from its AirfoilRecord or IngestError
+        """
+        entry = {"path": result.path, "size": stat.st_size, "mtime": stat.st_mtime_ns, "hash": digest, "name": None, "num_points": 0, "error": None}
+        if isinstance(result, AirfoilRecord):
+            entry["name"] = result.name
+            entry["num_points"] = result.num_points
+        else:
+            entry["error"] = f"{result.error}: {result.message}"
+        return entry
+
+    def airfoils(self)->list:
+        """
+        Returns a list of tuples of (filename, path) for every file that could be parsed, sorted by filename
+        """
+        return [(name, entry["path"]) for name, entry in sorted(self.ENTRIES.items()) if entry["error"] is None]
+
+    def hashes(self)->list:
+        """
+        Returns the content hash of every file that could be parsed, in the order of airfoils()
+        """
+        return [self.ENTRIES[name]["hash"] for name, _ in self.airfoils()]
+
+    def matches(self, archive)->bool:
+        """
+        Returns True if the archive holds exactly the files that could be parsed, in the order of airfoils() and with
+        their current contents
+        """
+        return (archive.HASHES is not None and archive.HASHES == self.hashes()
+                and [os.path.normpath(path) for path in archive.PATHS] == [os.path.normpath(path) for _, path in self.airfoils()])
+
+    def records(self, archive=None)->tuple[list, list]:
+        """
+        Returns the AirfoilRecord of every file that could be parsed, in the order of airfoils(), to write an archive.
+        Files parsed by the last refresh() come from RECORDS and unchanged files are sliced from the memory map of the
+        previous archive, so only files that are in neither are parsed, e.g. all of them if the archive was deleted.
+
+        Args:
+            archive (AirfoilArchive): the previous archive, if there is one
+
+        Returns:
+            tuple: records, hashes - the records and the content hash of their files, in the same order
+        """
+        archived = dict()
+        if archive is not None and archive.HASHES is not None:
+            archived = {(os.path.normpath(path), digest): i for i, (path, digest) in enumerate(zip(archive.PATHS, archive.HASHES))}
+
+        records = dict()
+        missing = []
+        for name, path in self.airfoils():
+            entry = self.ENTRIES[name]
+            if name in self.RECORDS:
+                records[name] = self.RECORDS[name]
+            elif (os.path.normpath(path), entry["hash"]) in archived:
+                i = archived[(os.path.normpath(path), entry["hash"])]
+                records[name] = AirfoilRecord(path, archive.NAMES[i], entry["num_points"], archive.coordinates(i), archive.split(i))
+            else:
+                missing.append((name, path))
+
+        if missing:
+            parsed, errors, stats = ingest_airfoils([path for _, path in missing], max_workers=self.max_workers)
+            parsed = {record.path: record for record in parsed}
+            for name, path in missing:
+                if path in parsed:
+                    records[name] = parsed[path]
+
+        names = [name for name, _ in self.airfoils() if name in records]
+        return [records[name] for name in names], [self.ENTRIES[name]["hash"] for name in names]
@@ -0,0 +1,284 @@
+"""
+Geometric parameters of the airfoil database as a columnar table
+
+The parameters of every airfoil are computed once, from the unit-chord surfaces sampled at common cosine-spaced stations,
+and stored as one contiguous NumPy column per parameter. A filter such as "t/c between 0.10 and 0.14 and camber < 2%"
+is then a handful of vectorized comparisons over the columns, without opening a single airfoil file.
+
+Columns (all lengths in chord units):
+    thickness, thickness_x: maximum thickness and its x location
+    camber, camber_x: maximum camber (signed, the largest in magnitude) and its x location
+    le_radius: radius of the circle through the leading edge point and its two neighbours
+    te_thickness: gap between the first and last points
+    te_angle: angle between the upper and lower surfaces over the last TE_ANGLE_CHORD of the chord, in degrees
+    area: cross-sectional area
+    num_points: number of points in the file, the NUM_POINTS of the loaded airfoil
+
+Classes:
+    ParameterTable: Columns of airfoil parameters with vectorized filter queries
+
+Functions:
+    compute_parameters: Computes the parameter columns of a list of airfoils
+    parse_query: Parses a filter query into (column, low, high) ranges
+"""
+import os
+import re
+
+import numpy as np
+
+from logger_config import logger
+from scripts.archive import match_rows
+from scripts.resample import cosine_stations, normalise_chord, resample_many
+
+PARAMETERS_VERSION = 2
+NUM_STATIONS = 101
+TE_ANGLE_CHORD = 0.05
+
+COLUMNS = ("thickness", "thickness_x", "camber", "camber_x", "le_radius", "te_thickness", "te_angle", "area", "num_points")
+
+# names accepted in queries for the columns
+ALIASES = {
+    "t/c": "thickness", "t": "thickness", "tc": "thickness",
+    "xt": "thickness_x", "x_t": "thickness_x",
+    "f": "camber", "f/c": "camber",
+    "xf": "camber_x", "x_f": "camber_x",
+    "rle": "le_radius", "r_le": "le_radius",
+    "te": "te_thickness", "te_gap": "te_thickness",
+    "points": "num_points",
+}
+
+QUERY_TOKEN = re.compile(r'\s*(<=|>=|==|<|>|=|[-+]?(?:\d+\.?\d*|\.\d+)(?:e[-+]?\d+)?%?|[a-z_/]+)')
+
+def _circumradius(a:np.ndarray, b:np.ndarray, c:np.ndarray)->np.ndarray:
+    """
+    Radius of the circle through the points a, b and c, each (K, 2). Collinear points give inf
+    """
+    ab = np.linalg.norm(b - a, axis=-1)
+    bc = np.linalg.norm(c - b, axis=-1)
+    ca = np.linalg.norm(a - c, axis=-1)
+    cross = np.abs((b - a)[:, 0] * (c - a)[:, 1] - (b - a)[:, 1] * (c - a)[:, 0])
+    with np.errstate(divide='ignore'):
+        return ab * bc * ca / (2 * cross)
+
+def compute_parameters(foils, num_stations:int=NUM_STATIONS)->dict:
+    """
+    Computes the parameter columns of many airfoils
+
+    Args:
+        foils (iterable): tuples of (data, i_le), data in Selig order
+        num_stations (int): number of cosine-spaced stations the surfaces are sampled at
+
+    Returns:
+        dict: column name -> (K,) array, see COLUMNS
+    """
+    foils = [(normalise_chord(data, i_le), i_le) for data, i_le in foils]
+    count = len(foils)
+    stations = cosine_stations(num_stations)
+    surfaces = resample_many(foils, stations)
+    upper, lower = surfaces[:, 0], surfaces[:, 1]
+
+    thickness = upper - lower
+    camber_line = 0.5 * (upper + lower)
+    i_thickness = thickness.argmax(axis=1)
+    i_camber = np.abs(camber_line).argmax(axis=1)
+    rows = np.arange(count)
+
+    # the points the leading edge radius and trailing edge are measured from
+    leading_edges = np.empty((count, 3, 2))
+    trailing_edges = np.empty((count, 2, 2))
+    areas = np.empty(count)
+    for k, (data, i_le) in enumerate(foils):
+        leading_edges[k] = data[i_le-1:i_le+2]
+        trailing_edges[k] = data[[0, -1]]
+        # shoelace formula over the closed outline
+        areas[k] = 0.5 * abs(np.dot(data[:, 0], np.roll(data[:, 1], -1)) - np.dot(data[:, 1], np.roll(data[:, 0], -1)))
+
+    # interpolate every surface at x = 1 - TE_ANGLE_CHORD with the same pair of stations
+    j = np.searchsorted(stations, 1 - TE_ANGLE_CHORD)
+    weight = (1 - TE_ANGLE_CHORD - stations[j-1]) / (stations[j] - stations[j-1])
+    upper_slope = (upper[:, -1] - (1 - weight) * upper[:, j-1] - weight * upper[:, j]) / TE_ANGLE_CHORD
+    lower_slope = (lower[:, -1] - (1 - weight) * lower[:, j-1] - weight * lower[:, j]) / TE_ANGLE_CHORD
+
+    return {
+        "thickness": thickness[rows, i_thickness],
+        "thickness_x": stations[i_thickness],
+        "camber": camber_line[rows, i_camber],
+        "camber_x": stations[i_camber],
+        "le_radius": _circumradius(leading_edges[:, 0], leading_edges[:, 1], leading_edges[:, 2]),
+        "te_thickness": np.linalg.norm(trailing_edges[:, 0] - trailing_edges[:, 1], axis=1),
+        "te_angle": np.degrees(np.arctan(lower_slope) - np.arctan(upper_slope)),
+        "area": areas,
+        "num_points": np.array([len(data) for data, _ in foils], dtype=np.int64),
+    }
+
+def _value(token:str)->float:
+    if token.endswith('%'):
+        return float(token[:-1]) / 100
+    return float(token)
+
+def parse_query(query:str)->list:
+    """
+    Parses a filter query into ranges. Clauses are joined by "and" and are either "<column> <op> <value>" with op one of
+    <, <=, >, >=, =, or "<column> between <low> and <high>". Values may be given in percent, e.g. "camber < 2%".
+
+    Returns:
+        list: tuples of (column, low, high, inclusive_low, inclusive_high), None for an open end
+
+    Raises:
+        ValueError: if the query cannot be parsed
+    """
+    query = query.strip().lower()
+    tokens = []
+    position = 0
+    while position < len(query):
+        match = QUERY_TOKEN.match(query, position)
+        if match is None or not match.group(1):
+            raise ValueError(f"Cannot parse {query[position:]!r}")
+        tokens.append(match.group(1))
+        position = match.end()
+
+    def take(expected=None):
+        if not tokens:
+            raise ValueError(f"Unexpected end of query {query!r}")
+        token = tokens.pop(0)
+        if expected is not None and token != expected:
+            raise ValueError(f"Expected {expected!r} instead of {token!r}")
+        return token
+
+    ranges = []
+    while tokens:
+        name = take()
+        column = ALIASES.get(name, name)
+        if column not in COLUMNS:
+            raise ValueError(f"Unknown parameter {name!r}")
+        operator = take()
+        if operator == "between":
+            low = _value(take())
+            take("and")
+            ranges.append((column, low, _value(take()), True, True))
+        elif operator in ("<", "<="):
+            ranges.append((column, None, _value(take()), True, operator == "<="))
+        elif operator in (">", ">="):
+            ranges.append((column, _value(take()), None, operator == ">=", True))
+        elif operator in ("=", "=="):
+            value = _value(take())
+            ranges.append((column, value, value, True, True))
+        else:
+            raise ValueError(f"Unknown operator {operator!r}")
+        if tokens:
+            take("and")
+    return ranges
+
+class ParameterTable:
+    """
+    Columns of geometric parameters of the airfoil database
+
+    Attributes:
+        NAMES (list): the airfoil names
+        PATHS (list): the paths of the airfoil files, in the same order as NAMES
+        COLUMNS (dict): column name -> (K,) contiguous array, see COLUMNS
+        HASHES (list): the content hashes of the airfoil files the rows were computed from, None if they are not known
+    """
+    def __init__(self, names:list, paths:list, columns:dict, hashes:list=None):
+        self.NAMES = list(names)
+        self.PATHS = list(paths)
+        self.HASHES = None if hashes is None else list(hashes)
+        self.COLUMNS = {name: np.ascontiguousarray(columns[name]) for name in COLUMNS}
+        self._lookup = {os.path.normpath(path): i for i, path in enumerate(self.PATHS)}
+
+    def __len__(self):
+        return len(self.NAMES)
+
+    def __contains__(self, path):
+        return os.path.normpath(path) in self._lookup
+
+    def __getitem__(self, column:str)->np.ndarray:
+        return self.COLUMNS[ALIASES.get(column, column)]
+
+    def index_of(self, path:str)->int:
+        """
+        Returns the row of the airfoil file at path, or -1 if it is not in the table
+        """
+        return self._lookup.get(os.path.normpath(path), -1)
+
+    @classmethod
+    def from_archive(cls, archive, previous=None):
+        """
+        Builds the table from an AirfoilArchive, reading the coordinates straight from the memory map. The rows of a
+        previous table are reused for the files that did not change (see scripts.archive.match_rows), only the
+        parameters of the other airfoils are computed.
+        """
+        sources = match_rows(archive, previous)
+        reused = sources >= 0
+        rows = np.flatnonzero(~reused)
+        computed = compute_parameters((archive.coordinates(i), archive.split(i)) for i in rows) if len(rows) else None
+        columns = dict()
+        for name in COLUMNS:
+            column = np.empty(len(archive), dtype=np.int64 if name == "num_points" else np.float64)
+            if reused.any():
+                column[reused] = previous.COLUMNS[name][sources[reused]]
+            if computed is not None:
+                column[rows] = computed[name]
+            columns[name] = column
+        logger.info(f"Parameter table: {np.count_nonzero(reused)} rows reused, {len(rows)} computed")
+        return cls(archive.NAMES, archive.PATHS, columns, archive.HASHES)
+
+    @classmethod
+    def from_records(cls, records:list):
+        """
+        Builds the table from AirfoilRecords returned by scripts.ingest.ingest_airfoils
+        """
+        columns = compute_parameters((record.coordinates, record.le_index) for record in records)
+        return cls([record.name for record in records], [record.path for record in records], columns)
+
+    @classmethod
+    def load(cls, table_path:str):
+        """
+        Reads a table written by save()
+
+        Raises:
+            ValueError: if the file is not a parameter table of a supported version
+        """
+        with np.load(table_path, allow_pickle=False) as table:
+            if int(table["version"]) != PARAMETERS_VERSION:
+                raise ValueError(f"{table_path} is not a parameter table of version {PARAMETERS_VERSION}")
+            hashes = table["hashes"].tolist() if "hashes" in table.files else None
+            return cls(table["names"].tolist(), table["paths"].tolist(), {name: table[name] for name in COLUMNS}, hashes)
+
+    def save(self, table_path:str):
+        """
+        Writes the table to a .npz file
+        """
+        temp_path = table_path + ".tmp.npz"
+        hashes = {} if self.HASHES is None else {"hashes": np.array(self.HASHES, dtype=str)}
+        np.savez(temp_path, version=PARAMETERS_VERSION, names=np.array(self.NAMES, dtype=str),
+                 paths=np.array(self.PATHS, dtype=str), **self.COLUMNS, **hashes)
+        os.replace(temp_path, table_path)
+        logger.info(f"Parameter table of {len(self)} airfoils written to {table_path}")
+
+    def mask(self, ranges:list)->np.ndarray:
+        """
+        Returns the boolean mask of the rows inside every range
+
+        Args:
+            ranges (list): tuples of (column, low, high, inclusive_low, inclusive_high) as returned by parse_query,
+                or (column, low, high) for an inclusive range. None is an open end
+        """
+        mask = np.ones(len(self), dtype=bool)
+        for column, low, high, *inclusive in ranges:
+            inclusive_low, inclusive_high = inclusive or (True, True)
+            values = self[column]
+            if low is not None:
+                mask &= values >= low if inclusive_low else values > low
+            if high is not None:
+                mask &= values <= high if inclusive_high else values < high
+        return mask
+
+    def query(self, query:str)->np.ndarray:
+        """
+        Returns the boolean mask of the rows matching a filter query, e.g. "t/c between 0.10 and 0.14 and camber < 2%"
+
+        Raises:
+            ValueError: if the query cannot be parsed
+        """
+        return self.mask(parse_query(query))
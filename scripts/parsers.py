@@ -0,0 +1,233 @@
+"""
+Parsers for airfoil coordinate files
+
+Functions:
+    parse_airfoil_file: Reads a Selig or Lednicer file into a name and a single (N, 2) coordinate array
+    parse_airfoil_files: Parses a list of files into one stacked coordinate array with per-foil offsets
+    split_selig: Finds the leading edge of Selig-ordered coordinates
+    read_airfoil: Parses a file and splits it at the leading edge, as done by Airfoil_new.load
+"""
+import os
+import re
+
+import numpy as np
+
+from logger_config import logger
+
+# Matches an optional integer index followed by two floats (x and y), as used by the original line-by-line parser.
+# Only lines that are not two plain numbers are passed through this pattern.
+COORDINATE_PATTERN = re.compile(
+    r'^\s*(?:\d+\s+)?([-+]?\d*\.?\d+(?:[eE][-+]?\d+)?)\s+([-+]?\d*\.?\d+(?:[eE][-+]?\d+)?)'
+)
+
+def _is_coordinate_line(tokens:list)->bool:
+    """
+    Checks if the tokens of a line are exactly two numbers
+    """
+    if len(tokens) != 2:
+        return False
+    try:
+        float(tokens[0])
+        float(tokens[1])
+    except ValueError:
+        return False
+    return True
+
+def _parse_lines(lines:list)->np.ndarray:
+    """
+    Converts coordinate lines to an (N, 2) float64 array.
+
+    All the lines are converted in one NumPy call when every line holds exactly two numbers.
+    Otherwise, well-formed lines are still converted directly and only the malformed lines go through COORDINATE_PATTERN.
+    """
+    tokens = [line.split() for line in lines]
+    if all(len(line_tokens) == 2 for line_tokens in tokens):
+        try:
+            return np.array(tokens, dtype=np.float64)
+        except ValueError:
+            pass # at least one token is not a plain number, handle line by line below
+
+    data = []
+    for line, line_tokens in zip(lines, tokens):
+        if _is_coordinate_line(line_tokens):
+            data.append((float(line_tokens[0]), float(line_tokens[1])))
+            continue
+        match = COORDINATE_PATTERN.match(line)
+        if match:
+            data.append((float(match.group(1)), float(match.group(2))))
+    return np.array(data, dtype=np.float64).reshape(-1, 2)
+
+def _read_airfoil_lines(filename:str)->tuple[str, list, tuple]:
+    """
+    Reads an airfoil file and separates the name, the coordinate lines and the Lednicer point counts (if any)
+
+    Returns:
+        tuple: name, data_lines, counts - counts is (num_upper, num_lower) for Lednicer files and None for Selig files
+    """
+    with open(filename, 'r') as f:
+        text = f.read()
+    lines = [line.strip() for line in text.splitlines() if line.strip() != '']
+
+    if not lines:
+        raise ValueError("File is empty.")
+
+    if _is_coordinate_line(lines[0].split()) or COORDINATE_PATTERN.match(lines[0]):
+        # No header present; use the file name (without extension) as the airfoil name.
+        name = os.path.splitext(os.path.basename(filename))[0]
+        data_lines = lines
+    else:
+        name = lines[0]
+        data_lines = lines[1:]
+
+    # Lednicer format: the first data line holds the number of points of the upper and lower surfaces
+    counts = None
+    if data_lines:
+        count_tokens = data_lines[0].split()
+        if _is_coordinate_line(count_tokens):
+            num_upper, num_lower = float(count_tokens[0]), float(count_tokens[1])
+            if num_upper > 1 and num_lower > 1 and num_upper.is_integer() and num_lower.is_integer():
+                counts = (int(num_upper), int(num_lower))
+                data_lines = data_lines[1:]
+
+    return name, data_lines, counts
+
+def _finish(filename:str, data:np.ndarray, counts:tuple)->np.ndarray:
+    """
+    Merges the surfaces of a Lednicer file into Selig order and checks that there are enough points
+    """
+    if counts is not None:
+        num_upper, num_lower = counts
+        if num_upper + num_lower != len(data):
+            logger.warning(f"{filename}: expected {num_upper + num_lower} points from the Lednicer header, found {len(data)}")
+        upper = data[:num_upper]
+        lower = data[num_upper:num_upper + num_lower]
+        if len(lower) and np.allclose(upper[0], lower[0], atol=1e-6):
+            # the leading edge is listed at the start of both surfaces
+            lower = lower[1:]
+        data = np.vstack((upper[::-1], lower))
+
+    if len(data) < 2:
+        raise ValueError("Not enough data points were found in the file.")
+    return data
+
+def parse_airfoil_file(filename:str)->tuple[str, np.ndarray]:
+    """
+    Reads a Selig or Lednicer format airfoil file in a single pass.
+
+    The first non-empty line is used as the name if it is not coordinate data, otherwise the file name (without extension) is used.
+    Lednicer files are recognised by the line of point counts (e.g. "61.0  61.0") that follows the name. Their upper and lower
+    surfaces, which both run from the leading edge to the trailing edge, are merged into Selig order so that all files come out
+    the same way: from the trailing edge over the upper surface to the leading edge and back over the lower surface.
+
+    Args:
+        filename (str): Path to the airfoil file.
+
+    Returns:
+        tuple: name, coordinates - coordinates is an (N, 2) float64 array in Selig order
+
+    Raises:
+        ValueError: if the file is empty or fewer than 2 points were found
+    """
+    name, data_lines, counts = _read_airfoil_lines(filename)
+    return name, _finish(filename, _parse_lines(data_lines), counts)
+
+def parse_airfoil_files(paths:list)->tuple[list, list, np.ndarray, np.ndarray]:
+    """
+    Parses a list of airfoil files into one stacked coordinate array.
+
+    The coordinate lines of all the files are gathered first and converted with a single NumPy call, so the conversion cost
+    does not grow per file. Files with malformed lines are converted on their own through the regex fallback.
+    Files that cannot be parsed are logged and left out of the result.
+
+    Args:
+        paths (list): paths to the airfoil files
+
+    Returns:
+        tuple: names, paths, coordinates, offsets - coordinates is an (M, 2) float64 array holding every parsed foil back to back.
+            The points of foil i are coordinates[offsets[i]:offsets[i+1]]
+    """
+    files = []
+    for path in paths:
+        try:
+            files.append((path, *_read_airfoil_lines(path)))
+        except (OSError, ValueError) as e:
+            logger.warning(f"Skipping {path}: {e}")
+
+    # convert every well-formed file in one call
+    tokens = []
+    bulk = []
+    for path, name, data_lines, counts in files:
+        file_tokens = [line.split() for line in data_lines]
+        if all(len(line_tokens) == 2 for line_tokens in file_tokens):
+            tokens.extend(file_tokens)
+            bulk.append(len(file_tokens))
+        else:
+            bulk.append(None)
+    try:
+        bulk_data = np.array(tokens, dtype=np.float64).reshape(-1, 2)
+    except ValueError:
+        bulk_data = None # a token is not a number, so every file is converted on its own
+
+    names = []
+    parsed_paths = []
+    blocks = []
+    start = 0
+    for (path, name, data_lines, counts), num_lines in zip(files, bulk):
+        if num_lines is not None and bulk_data is not None:
+            data = bulk_data[start:start + num_lines]
+            start += num_lines
+        else:
+            data = _parse_lines(data_lines)
+        try:
+            data = _finish(path, data, counts)
+        except ValueError as e:
+            logger.warning(f"Skipping {path}: {e}")
+            continue
+        names.append(name)
+        parsed_paths.append(path)
+        blocks.append(data)
+
+    offsets = np.zeros(len(blocks) + 1, dtype=np.int64)
+    if blocks:
+        np.cumsum([len(block) for block in blocks], out=offsets[1:])
+        coordinates = np.concatenate(blocks)
+    else:
+        coordinates = np.empty((0, 2), dtype=np.float64)
+
+    return names, parsed_paths, coordinates, offsets
+
+def split_selig(data:np.ndarray)->tuple[np.ndarray, int]:
+    """
+    Finds the leading edge of Selig-ordered coordinates.
+
+    The leading edge is the point with the minimum x value. The upper surface is data[:i_le+1] (trailing edge to leading edge)
+    and the lower surface is data[i_le:] (leading edge to trailing edge). A trailing edge point shared by both surfaces is
+    kept at both ends, so data[0] and data[-1] are always the trailing edge points of the upper and lower surfaces.
+
+    Args:
+        data (np.ndarray): (N, 2) coordinates in Selig order
+
+    Returns:
+        tuple: data, i_le - the coordinates and the index of the leading edge
+    """
+    return data, int(np.argmin(data[:, 0]))
+
+def read_airfoil(filename:str)->tuple[str, int, np.ndarray, int]:
+    """
+    Parses an airfoil file and splits it at the leading edge. This is the loading logic of Airfoil_new.load, kept separate
+    from the Qt object so that it can also run in worker processes.
+
+    Args:
+        filename (str): Path to the airfoil file.
+
+    Returns:
+        tuple: name, num_points, data, i_le - num_points is the number of points defined in the file, data holds all of them
+            in Selig order and i_le is the index of the leading edge in data
+
+    Raises:
+        ValueError: if the file is empty or fewer than 2 points were found
+    """
+    name, data = parse_airfoil_file(filename)
+    num_points = len(data)
+    data, i_le = split_selig(data)
+    return name, num_points, data, i_le
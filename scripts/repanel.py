@@ -0,0 +1,124 @@
+"""
+Repaneling of airfoil coordinates
+
+Airfoil files come with anywhere from a few dozen to a few hundred points at arbitrary spacing. The repaneling engine fits
+a cubic spline through the points, parameterised by the arc length along the outline, and redistributes a fixed number
+of points along it with a chosen spacing. The leading edge point of the input stays a point of the output, so the two
+surfaces are repaneled separately and keep their split.
+
+Repaneled coordinates are memoized by (geometry hash, number of points, spacing) in a least-recently-used cache, since
+the same airfoil is repaneled again every time it is lofted, analysed or exported.
+
+Spacings:
+    cosine: points clustered at the leading and trailing edges
+    le: points clustered at the leading edge only (half-cosine)
+    uniform: equal arc length between the points
+
+Classes:
+    RepanelCache: Least-recently-used cache of repaneled coordinates with a memory budget
+
+Functions:
+    geometry_hash: Returns a digest of a coordinate buffer and its leading edge index
+    spacing_fractions: Returns the fractions of a surface's arc length the points are placed at
+    repanel: Redistributes the points of an airfoil along an arc-length spline
+"""
+import hashlib
+
+import numpy as np
+
+from globals import REPANEL_CACHE_BYTES
+from scripts.cache import LRUCache
+
+SPACINGS = ("cosine", "le", "uniform")
+
+def geometry_hash(points:np.ndarray, le_index:int)->str:
+    """
+    Returns a digest of the coordinates and the leading edge index, equal for equal geometry whatever the array layout
+    """
+    digest = hashlib.blake2b(np.ascontiguousarray(points, dtype=np.float64).tobytes(), digest_size=16)
+    digest.update(int(le_index).to_bytes(8, "little"))
+    return digest.hexdigest()
+
+def spacing_fractions(count:int, spacing:str="cosine")->np.ndarray:
+    """
+    Returns count fractions from 0 (leading edge) to 1 (trailing edge) of the arc length of a surface
+
+    Raises:
+        ValueError: if the spacing is not one of SPACINGS
+    """
+    u = np.linspace(0.0, 1.0, count)
+    if spacing == "cosine":
+        return 0.5 * (1 - np.cos(np.pi * u))
+    if spacing == "le":
+        return 1 - np.cos(0.5 * np.pi * u)
+    if spacing == "uniform":
+        return u
+    raise ValueError(f"Unknown spacing {spacing!r}, expected one of {', '.join(SPACINGS)}")
+
+def repanel(points:np.ndarray, le_index:int, num_points:int, spacing:str="cosine")->tuple[np.ndarray, int]:
+    """
+    Redistributes the points of an airfoil along a cubic spline through its points, parameterised by arc length
+
+    Args:
+        points (np.ndarray): (N, 2) coordinates in Selig order
+        le_index (int): index of the leading edge point
+        num_points (int): number of points of the result, the leading edge is shared by both surfaces
+        spacing (str): one of SPACINGS
+
+    Returns:
+        tuple: points, le_index - the (num_points, 2) repaneled coordinates in Selig order and the new leading edge index
+
+    Raises:
+        ValueError: if num_points is below 5, the spacing is unknown or the points have fewer than 2 distinct points per surface
+    """
+    # scipy is only imported when an airfoil is repaneled, to keep it out of the application start-up
+    from scipy.interpolate import CubicSpline
+
+    if num_points < 5:
+        raise ValueError(f"At least 5 points are needed to repanel an airfoil, got {num_points}")
+    num_upper = num_points // 2 + 1 # both counts include the leading edge
+    num_lower = num_points - num_upper + 1
+    fractions_upper = spacing_fractions(num_upper, spacing)
+    fractions_lower = spacing_fractions(num_lower, spacing)
+
+    # cumulative chord length along the outline, repeated points are dropped since the spline needs increasing knots
+    points = np.asarray(points, dtype=np.float64)
+    steps = np.hypot(*np.diff(points, axis=0).T)
+    keep = np.concatenate(([True], steps > 0))
+    arc = np.concatenate(([0.0], np.cumsum(steps)))[keep]
+    le_arc = arc[np.count_nonzero(keep[:le_index + 1]) - 1]
+    if le_arc <= 0 or le_arc >= arc[-1] or len(arc) < 4:
+        raise ValueError("Not enough distinct points on both surfaces to repanel the airfoil")
+
+    spline = CubicSpline(arc, points[keep], axis=0)
+    stations = np.concatenate((
+        le_arc * (1 - fractions_upper[::-1]),             # trailing edge to leading edge over the upper surface
+        le_arc + (arc[-1] - le_arc) * fractions_lower[1:], # leading edge to trailing edge over the lower surface
+    ))
+    return spline(stations), num_upper - 1
+
+class RepanelCache(LRUCache):
+    """
+    Least-recently-used cache of repaneled coordinates, keyed by (geometry hash, number of points, spacing).
+    The cached arrays are read-only, since the same array is handed to every caller.
+    """
+    def __init__(self, max_bytes:int=REPANEL_CACHE_BYTES):
+        super().__init__(max_bytes)
+
+    def get(self, points:np.ndarray, le_index:int, num_points:int, spacing:str="cosine", digest:str=None)->tuple[np.ndarray, int]:
+        """
+        Returns the repaneled coordinates, see repanel(). digest may be given if the geometry hash is already known
+        """
+        key = (digest or geometry_hash(points, le_index), num_points, spacing)
+        entry = self.lookup(key)
+        if entry is not None:
+            return entry
+
+        repaneled, new_le_index = repanel(points, le_index, num_points, spacing)
+        repaneled.setflags(write=False)
+        entry = (repaneled, new_le_index)
+        self.store(key, entry, repaneled.nbytes)
+        return entry
+
+# cache shared by all airfoil objects
+repanel_cache = RepanelCache()
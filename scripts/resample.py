@@ -0,0 +1,71 @@
+"""
+Resampling of airfoil surfaces onto common chordwise stations
+
+Functions:
+    cosine_stations: Returns cosine-spaced x stations between 0 and 1
+    normalise_chord: Moves the leading edge to (0, 0) and scales the chord to 1
+    resample_surfaces: Interpolates the upper and lower surfaces of an airfoil at the given x stations
+    resample_many: Resamples a list of airfoils into one (K, 2, S) array
+"""
+import numpy as np
+
+def cosine_stations(n:int)->np.ndarray:
+    """
+    Returns n cosine-spaced x stations from 0 to 1, clustered at the leading and trailing edges
+    """
+    return 0.5 * (1 - np.cos(np.linspace(0, np.pi, n)))
+
+def normalise_chord(data:np.ndarray, i_le:int)->np.ndarray:
+    """
+    Moves the leading edge to (0, 0) and scales the airfoil so that the trailing edge is at x = 1
+
+    Args:
+        data (np.ndarray): (N, 2) coordinates in Selig order
+        i_le (int): index of the leading edge in data
+
+    Returns:
+        np.ndarray: normalised (N, 2) coordinates
+    """
+    leading_edge = data[i_le]
+    chord = data[:, 0].max() - leading_edge[0]
+    return (data - leading_edge) / chord
+
+def _surface_at(surface:np.ndarray, stations:np.ndarray)->np.ndarray:
+    """
+    Interpolates the y values of one surface at the x stations. The points are sorted by x first, since np.interp
+    needs increasing x values and points near the leading edge are not always in order
+    """
+    order = np.argsort(surface[:, 0], kind='stable')
+    return np.interp(stations, surface[order, 0], surface[order, 1])
+
+def resample_surfaces(data:np.ndarray, i_le:int, stations:np.ndarray)->tuple[np.ndarray, np.ndarray]:
+    """
+    Interpolates the upper and lower surfaces of an airfoil at the given x stations, after normalising it to a unit chord
+
+    Args:
+        data (np.ndarray): (N, 2) coordinates in Selig order
+        i_le (int): index of the leading edge in data
+        stations (np.ndarray): x stations between 0 and 1
+
+    Returns:
+        tuple: upper_y, lower_y - y values of the upper and lower surfaces at the stations
+    """
+    data = normalise_chord(data, i_le)
+    return _surface_at(data[:i_le+1], stations), _surface_at(data[i_le:], stations)
+
+def resample_many(foils, stations:np.ndarray)->np.ndarray:
+    """
+    Resamples many airfoils onto the same x stations
+
+    Args:
+        foils (iterable): tuples of (data, i_le)
+        stations (np.ndarray): x stations between 0 and 1
+
+    Returns:
+        np.ndarray: (K, 2, S) array, [:, 0] holds the upper surfaces and [:, 1] the lower surfaces
+    """
+    foils = list(foils)
+    surfaces = np.empty((len(foils), 2, len(stations)), dtype=np.float64)
+    for k, (data, i_le) in enumerate(foils):
+        surfaces[k, 0], surfaces[k, 1] = resample_surfaces(data, i_le, stations)
+    return surfaces
@@ -0,0 +1,132 @@
+"""
+Name index for incremental airfoil search
+
+Names are normalised to lower-case letters and digits, so "NACA 0015", "naca0015" and "NACA-0015.dat" are the same key.
+A leading "naca" is also indexed as "n", so "n0015" finds "NACA 0015". Prefix queries are answered by a trie and
+substring queries by a trigram index, so a keystroke never has to scan every name. Queries of up to three characters are
+looked up directly, since every substring of up to 3 characters is indexed.
+
+Classes:
+    NameIndex: Prefix trie and trigram index over a list of airfoil names
+
+Functions:
+    normalise_name: Reduces a name to lower-case letters and digits
+    name_keys: Returns the normalised keys a name is indexed under
+"""
+import os
+import re
+
+NON_ALPHANUMERIC = re.compile(r'[^a-z0-9]+')
+# extensions of airfoil files, removed from names before indexing
+AIRFOIL_EXTENSIONS = ('.dat', '.txt')
+
+def normalise_name(name:str)->str:
+    """
+    Reduces a name to lower-case letters and digits, dropping an airfoil file extension
+    """
+    name = name.lower()
+    root, ext = os.path.splitext(name)
+    if ext in AIRFOIL_EXTENSIONS:
+        name = root
+    return NON_ALPHANUMERIC.sub('', name)
+
+def name_keys(name:str)->set:
+    """
+    Returns the normalised keys a name is indexed under
+    """
+    key = normalise_name(name)
+    keys = {key}
+    if key.startswith('naca'):
+        keys.add('n' + key[4:])
+    return keys
+
+def trigrams(key:str)->set:
+    """
+    Returns the set of 3 character substrings of key
+    """
+    return {key[i:i+3] for i in range(len(key) - 2)}
+
+def short_grams(key:str)->set:
+    """
+    Returns the set of 1, 2 and 3 character substrings of key
+    """
+    return {key[i:i+n] for n in (1, 2, 3) for i in range(len(key) - n + 1)}
+
+class NameIndex:
+    """
+    Prefix trie and trigram index over a list of airfoil names. Rows are the positions of the names in the list.
+    """
+    def __init__(self, names=()):
+        """
+        Args:
+            names (iterable): the names to index, in row order
+        """
+        self.clear()
+        self.extend(names)
+
+    def __len__(self):
+        return len(self._keys)
+
+    def clear(self):
+        """
+        Removes every name from the index
+        """
+        self._keys = [] # row -> set of keys
+        self._trie = {} # nested dicts of characters, the rows under a node are stored in its None entry
+        self._grams = {} # substring of 1 to 3 characters -> set of rows
+
+    def extend(self, names):
+        """
+        Appends names to the index, their rows follow the rows already indexed
+        """
+        for name in names:
+            row = len(self._keys)
+            keys = name_keys(name)
+            self._keys.append(keys)
+            for key in keys:
+                node = self._trie
+                for char in key:
+                    node = node.setdefault(char, {})
+                    node.setdefault(None, set()).add(row)
+                for gram in short_grams(key):
+                    self._grams.setdefault(gram, set()).add(row)
+
+    def prefix(self, query:str)->set:
+        """
+        Returns the rows with a key that starts with the normalised query
+        """
+        node = self._trie
+        for char in normalise_name(query):
+            node = node.get(char)
+            if node is None:
+                return set()
+        return set(node.get(None, range(len(self._keys))))
+
+    def search(self, query:str):
+        """
+        Returns the rows whose name contains the normalised query, or None if the query is empty (every row matches)
+
+        Returns:
+            set or None: matching rows
+        """
+        query = normalise_name(query)
+        if not query:
+            return None
+
+        rows = self.prefix(query)
+        if len(query) <= 3:
+            # every substring of up to 3 characters is indexed, so the lookup is exact
+            rows.update(self._grams.get(query, ()))
+            return rows
+
+        # rows that contain every trigram of the query are candidates, confirm that the whole query is a substring
+        candidates = None
+        for trigram in sorted(trigrams(query), key=lambda trigram: len(self._grams.get(trigram, ()))):
+            trigram_rows = self._grams.get(trigram)
+            if not trigram_rows:
+                return rows
+            candidates = set(trigram_rows) if candidates is None else candidates & trigram_rows
+            if not candidates:
+                return rows
+        rows.update(row for row in candidates if any(query in key for key in self._keys[row]))
+        return rows
@@ -0,0 +1,155 @@
+"""
+Shape-similarity search across the airfoil database
+
+Every airfoil is normalised to a unit chord and its upper and lower surfaces are sampled at the same cosine-spaced
+x stations. The samples of all the airfoils form one feature matrix, so a k-nearest-neighbour query is a single
+matrix-vector product.
+
+Classes:
+    SimilarityIndex: Feature matrix of the airfoil database with k-nearest-neighbour queries
+"""
+import os
+
+import numpy as np
+
+from logger_config import logger
+from scripts.archive import match_rows
+from scripts.resample import cosine_stations, resample_many, resample_surfaces
+
+SIMILARITY_VERSION = 2
+NUM_STATIONS = 41
+
+class SimilarityIndex:
+    """
+    Feature matrix of the airfoil database
+
+    Attributes:
+        NAMES (list): the airfoil names
+        PATHS (list): the paths of the airfoil files, in the same order as NAMES
+        STATIONS (np.ndarray): the x stations the surfaces are sampled at
+        FEATURES (np.ndarray): (K, 2S) matrix, the upper surface samples followed by the lower surface samples of each airfoil
+        HASHES (list): the content hashes of the airfoil files the rows were computed from, None if they are not known
+    """
+    def __init__(self, names:list, paths:list, stations:np.ndarray, features:np.ndarray, hashes:list=None):
+        self.NAMES = list(names)
+        self.PATHS = list(paths)
+        self.HASHES = None if hashes is None else list(hashes)
+        self.STATIONS = stations
+        self.FEATURES = np.ascontiguousarray(features, dtype=np.float64)
+        self._squared_norms = np.einsum('ij,ij->i', self.FEATURES, self.FEATURES)
+        self._lookup = {os.path.normpath(path): i for i, path in enumerate(self.PATHS)}
+
+    def __len__(self):
+        return len(self.NAMES)
+
+    def __contains__(self, path):
+        return os.path.normpath(path) in self._lookup
+
+    @classmethod
+    def from_archive(cls, archive, num_stations:int=NUM_STATIONS, previous=None):
+        """
+        Builds the index from an AirfoilArchive, reading the coordinates straight from the memory map. The rows of a
+        previous index are reused for the files that did not change (see scripts.archive.match_rows), only the other
+        airfoils are resampled.
+        """
+        stations = cosine_stations(num_stations)
+        if previous is not None and not np.array_equal(previous.STATIONS, stations):
+            previous = None
+        sources = match_rows(archive, previous)
+        features = np.empty((len(archive), 2 * num_stations))
+        reused = sources >= 0
+        if reused.any():
+            features[reused] = previous.FEATURES[sources[reused]]
+        rows = np.flatnonzero(~reused)
+        if len(rows):
+            surfaces = resample_many(((archive.coordinates(i), archive.split(i)) for i in rows), stations)
+            features[rows] = surfaces.reshape(len(rows), -1)
+        logger.info(f"Similarity index: {np.count_nonzero(reused)} rows reused, {len(rows)} computed")
+        return cls(archive.NAMES, archive.PATHS, stations, features, archive.HASHES)
+
+    @classmethod
+    def from_records(cls, records:list, num_stations:int=NUM_STATIONS):
+        """
+        Builds the index from AirfoilRecords returned by scripts.ingest.ingest_airfoils
+        """
+        stations = cosine_stations(num_stations)
+        surfaces = resample_many(((record.coordinates, record.le_index) for record in records), stations)
+        return cls([record.name for record in records], [record.path for record in records], stations, surfaces.reshape(len(records), -1))
+
+    @classmethod
+    def load(cls, index_path:str):
+        """
+        Reads an index written by save()
+
+        Raises:
+            ValueError: if the file is not a similarity index of a supported version
+        """
+        with np.load(index_path, allow_pickle=False) as index:
+            if int(index["version"]) != SIMILARITY_VERSION:
+                raise ValueError(f"{index_path} is not a similarity index of version {SIMILARITY_VERSION}")
+            hashes = index["hashes"].tolist() if "hashes" in index.files else None
+            return cls(index["names"].tolist(), index["paths"].tolist(), index["stations"], index["features"], hashes)
+
+    def save(self, index_path:str):
+        """
+        Writes the index to a .npz file
+        """
+        temp_path = index_path + ".tmp.npz"
+        hashes = {} if self.HASHES is None else {"hashes": np.array(self.HASHES, dtype=str)}
+        np.savez(temp_path, version=SIMILARITY_VERSION, names=np.array(self.NAMES, dtype=str),
+                 paths=np.array(self.PATHS, dtype=str), stations=self.STATIONS, features=self.FEATURES, **hashes)
+        os.replace(temp_path, index_path)
+        logger.info(f"Similarity index of {len(self)} airfoils written to {index_path}")
+
+    def features(self, data:np.ndarray, i_le:int)->np.ndarray:
+        """
+        Returns the feature vector of an airfoil that is not necessarily in the index
+
+        Args:
+            data (np.ndarray): (N, 2) coordinates in Selig order
+            i_le (int): index of the leading edge in data
+        """
+        return np.concatenate(resample_surfaces(data, i_le, self.STATIONS))
+
+    def nearest(self, vector:np.ndarray, k:int=10, exclude:int=None)->tuple[np.ndarray, np.ndarray]:
+        """
+        Finds the k airfoils closest to a feature vector (root-mean-square difference of the surface samples)
+
+        Args:
+            vector (np.ndarray): feature vector, see features()
+            k (int): number of airfoils to return
+            exclude (int): row to leave out of the result, e.g. the query airfoil itself
+
+        Returns:
+            tuple: rows, distances - sorted from the closest airfoil
+        """
+        # |a - b|^2 = |a|^2 - 2 a.b + |b|^2 for every row at once
+        squared = self._squared_norms - 2 * (self.FEATURES @ vector) + vector @ vector
+        np.maximum(squared, 0, out=squared)
+        if exclude is not None:
+            squared[exclude] = np.inf
+
+        k = min(k, len(squared) - (exclude is not None))
+        if k <= 0:
+            return np.empty(0, dtype=np.intp), np.empty(0)
+        rows = np.argpartition(squared, k - 1)[:k]
+        rows = rows[np.argsort(squared[rows])]
+        return rows, np.sqrt(squared[rows] / self.FEATURES.shape[1])
+
+    def similar_to(self, path:str, k:int=10)->list:
+        """
+        Finds the k airfoils most similar to an airfoil in the index
+
+        Args:
+            path (str): path of the airfoil file
+            k (int): number of airfoils to return
+
+        Returns:
+            list: tuples of (name, path, distance), sorted from the most similar airfoil
+
+        Raises:
+            KeyError: if the file is not in the index
+        """
+        row = self._lookup[os.path.normpath(path)]
+        rows, distances = self.nearest(self.FEATURES[row], k=k, exclude=row)
+        return [(self.NAMES[i], self.PATHS[i], float(distance)) for i, distance in zip(rows, distances)]
@@ -0,0 +1,80 @@
+"""
+Tolerance-driven decimation of airfoil coordinates
+
+Airfoil files and repaneled airfoils often have far more points than a CAD curve or a chart needs. The points are
+decimated with the Douglas-Peucker algorithm: a polyline is split at the point furthest from the segment between its ends
+until every dropped point lies within the tolerance of the segment that replaces it. Instead of recursing segment by
+segment, every iteration splits all the segments at once, so the cost is a handful of vectorized passes over the buffer.
+
+The tolerance is given in chord units, so the same value gives the same visual quality whatever the scale of the airfoil.
+The first, last and leading edge points are always kept, so the result is still a valid Selig-ordered buffer.
+
+Functions:
+    simplify_mask: Returns which points of a polyline Douglas-Peucker keeps for an absolute tolerance
+    simplify: Decimates an airfoil to a maximum deviation given in chord units
+"""
+import numpy as np
+
+def simplify_mask(points:np.ndarray, tolerance:float, keep:np.ndarray=None)->np.ndarray:
+    """
+    Returns which points of a polyline are kept so that no dropped point is further than tolerance from the segment
+    between the kept points around it
+
+    Args:
+        points (np.ndarray): (N, 2) coordinates of the polyline
+        tolerance (float): maximum distance of a dropped point to the simplified polyline, in the units of points
+        keep (array_like): optional indices of points that are always kept, e.g. the leading edge
+
+    Returns:
+        np.ndarray: (N,) boolean mask of the kept points, the first and last points are always kept
+    """
+    points = np.asarray(points, dtype=np.float64)
+    count = len(points)
+    mask = np.zeros(count, dtype=bool)
+    if count == 0:
+        return mask
+    mask[[0, -1]] = True
+    if keep is not None:
+        mask[keep] = True
+    indices = np.arange(count)
+
+    while True:
+        kept = np.flatnonzero(mask)
+        if len(kept) < 2:
+            return mask
+        # segment of every point, given by the kept points before and after it
+        segment = np.minimum(np.searchsorted(kept, indices, side="right") - 1, len(kept) - 2)
+        start = points[kept[segment]]
+        direction = points[kept[segment + 1]] - start
+        offset = points - start
+        # distance to the segment, not to its line, so that points beyond the ends of a short segment are not dropped
+        length2 = np.einsum("ij,ij->i", direction, direction)
+        along = np.clip(np.einsum("ij,ij->i", offset, direction) / np.where(length2 > 0, length2, 1.0), 0.0, 1.0)
+        distance = np.hypot(*(offset - along[:, np.newaxis] * direction).T)
+        distance[mask] = 0.0
+
+        furthest = np.maximum.reduceat(distance, kept[:-1])
+        split = distance > tolerance
+        split &= distance == furthest[segment]
+        if not split.any():
+            return mask
+        # one split per segment, at its first furthest point
+        _, first = np.unique(segment[split], return_index=True)
+        mask[np.flatnonzero(split)[first]] = True
+
+def simplify(points:np.ndarray, le_index:int, tolerance:float)->tuple[np.ndarray, int]:
+    """
+    Decimates an airfoil so that its outline deviates from the original by at most tolerance chords
+
+    Args:
+        points (np.ndarray): (N, 2) coordinates in Selig order
+        le_index (int): index of the leading edge point
+        tolerance (float): maximum deviation as a fraction of the chord
+
+    Returns:
+        tuple: points, le_index - the kept coordinates (a new array) and the index of the leading edge among them
+    """
+    points = np.asarray(points, dtype=np.float64)
+    chord = np.hypot(*(0.5 * (points[0] + points[-1]) - points[le_index]))
+    mask = simplify_mask(points, tolerance * chord, keep=[le_index])
+    return points[mask], int(np.count_nonzero(mask[:le_index]))
@@ -0,0 +1,151 @@
+"""
+Offscreen airfoil thumbnails
+
+Small previews of the airfoils, shown in the airfoil selection list. They are drawn without any plotting library: the
+outline is rasterised with numpy (filled by an even-odd test of the pixel centres against the outline, then stroked by
+sampling every segment at sub-pixel steps) and written as a PNG with zlib. Rendering all the airfoils of the folder is
+spread over a process pool, and every thumbnail is stored on disk under the hash of its geometry, so an airfoil is only
+rendered again when its coordinates change.
+
+Functions:
+    rasterise: Draws an airfoil outline into an RGBA image
+    encode_png: Encodes an RGBA image as PNG
+    thumbnail_path: Returns the path of the thumbnail of a geometry in a thumbnail folder
+    render_thumbnail: Renders the thumbnail of one airfoil to a file
+    render_thumbnails: Renders the missing thumbnails of many airfoils in a process pool
+"""
+import multiprocessing
+import os
+import struct
+import zlib
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+from globals import THUMBNAIL_SIZE
+from scripts.repanel import geometry_hash
+
+def rasterise(points:np.ndarray, size:tuple=THUMBNAIL_SIZE, colour:tuple=(33, 190, 43), margin:int=2)->np.ndarray:
+    """
+    Draws an airfoil outline, scaled to fit the image and centred, on a transparent background
+
+    Args:
+        points (np.ndarray): (N, 2) coordinates of the closed outline
+        size (tuple): width, height of the image in pixels
+        colour (tuple): r, g, b of the outline, the inside is filled with the same colour at a third of the opacity
+        margin (int): empty pixels around the outline
+
+    Returns:
+        np.ndarray: (height, width, 4) uint8 RGBA image
+    """
+    width, height = size
+    image = np.zeros((height, width, 4), dtype=np.uint8)
+    image[..., :3] = colour
+    points = np.asarray(points, dtype=np.float64)
+    if len(points) < 2:
+        return image
+
+    # fit the outline into the image, keeping its aspect ratio, y up
+    low, high = points.min(axis=0), points.max(axis=0)
+    extent = np.maximum(high - low, 1e-12)
+    scale = min((width - 1 - 2 * margin) / extent[0], (height - 1 - 2 * margin) / extent[1])
+    centre = 0.5 * (low + high)
+    pixels = np.empty_like(points)
+    pixels[:, 0] = 0.5 * (width - 1) + (points[:, 0] - centre[0]) * scale
+    pixels[:, 1] = 0.5 * (height - 1) - (points[:, 1] - centre[1]) * scale
+    closed = np.concatenate((pixels, pixels[:1]))
+    start, end = closed[:-1], closed[1:]
+
+    # fill: a pixel centre is inside if a ray to its right crosses the outline an odd number of times
+    ys = np.arange(height)[:, np.newaxis] # (height, 1) against (segments,)
+    crosses = (start[:, 1] > ys) != (end[:, 1] > ys)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        x_cross = start[:, 0] + (ys - start[:, 1]) * (end[:, 0] - start[:, 0]) / (end[:, 1] - start[:, 1])
+    x_cross = np.where(crosses, x_cross, -np.inf) # (height, segments)
+    xs = np.arange(width)
+    inside = np.count_nonzero(x_cross[:, np.newaxis, :] > xs[np.newaxis, :, np.newaxis], axis=2) % 2 == 1
+    image[..., 3] = np.where(inside, 85, 0)
+
+    # stroke: every segment is sampled at steps shorter than half a pixel
+    steps = np.maximum(np.ceil(2 * np.hypot(*(end - start).T)).astype(np.int64), 1)
+    segment = np.repeat(np.arange(len(start)), steps)
+    t = (np.arange(len(segment)) - np.repeat(np.cumsum(steps) - steps, steps)) / steps[segment]
+    samples = start[segment] + t[:, np.newaxis] * (end - start)[segment]
+    columns = np.clip(np.rint(samples[:, 0]).astype(np.int64), 0, width - 1)
+    rows = np.clip(np.rint(samples[:, 1]).astype(np.int64), 0, height - 1)
+    image[rows, columns, 3] = 255
+    return image
+
+def _chunk(kind:bytes, data:bytes)->bytes:
+    return struct.pack(">I", len(data)) + kind + data + struct.pack(">I", zlib.crc32(kind + data) & 0xFFFFFFFF)
+
+def encode_png(image:np.ndarray)->bytes:
+    """
+    Encodes an RGBA image as an 8 bit PNG
+
+    Args:
+        image (np.ndarray): (height, width, 4) uint8 image
+    """
+    height, width, _ = image.shape
+    # every row starts with its filter type, 0 (none)
+    rows = np.concatenate((np.zeros((height, 1), dtype=np.uint8), np.ascontiguousarray(image, dtype=np.uint8).reshape(height, -1)), axis=1)
+    return b"".join((
+        b"\x89PNG\r\n\x1a\n",
+        _chunk(b"IHDR", struct.pack(">IIBBBBB", width, height, 8, 6, 0, 0, 0)),
+        _chunk(b"IDAT", zlib.compress(rows.tobytes(), 9)),
+        _chunk(b"IEND", b""),
+    ))
+
+def thumbnail_path(folder:str, digest:str, size:tuple=THUMBNAIL_SIZE)->str:
+    """Returns the path of the thumbnail of the geometry with the given hash, see scripts.repanel.geometry_hash"""
+    return os.path.join(folder, f"{digest}_{size[0]}x{size[1]}.png")
+
+def render_thumbnail(points:np.ndarray, filename:str, size:tuple=THUMBNAIL_SIZE)->str:
+    """
+    Renders the thumbnail of an airfoil to a PNG file. The file is written under a temporary name and renamed, so a
+    reader never sees a partial file
+
+    Returns:
+        str: filename
+    """
+    temporary = f"{filename}.{os.getpid()}.tmp"
+    with open(temporary, "wb") as file:
+        file.write(encode_png(rasterise(points, size)))
+    os.replace(temporary, filename)
+    return filename
+
+def _render_job(job:tuple)->str:
+    points, filename, size = job
+    return render_thumbnail(points, filename, size)
+
+def render_thumbnails(foils, folder:str, size:tuple=THUMBNAIL_SIZE, processes:int=None)->dict:
+    """
+    Renders the thumbnails of many airfoils into folder, skipping the ones that are already there, in a process pool
+
+    Args:
+        foils (iterable): tuples of (path, points, le_index)
+        folder (str): thumbnail folder, created if it does not exist
+        size (tuple): width, height of the thumbnails in pixels
+        processes (int): number of worker processes, the number of CPUs by default. 0 renders in this process
+
+    Returns:
+        dict: path of every airfoil -> path of its thumbnail
+    """
+    os.makedirs(folder, exist_ok=True)
+    thumbnails = dict()
+    jobs = list()
+    for path, points, le_index in foils:
+        filename = thumbnail_path(folder, geometry_hash(points, le_index), size)
+        thumbnails[path] = filename
+        if not os.path.exists(filename):
+            jobs.append((np.asarray(points), filename, size))
+
+    if processes == 0 or len(jobs) < 2:
+        for job in jobs:
+            _render_job(job)
+    elif jobs:
+        # spawned workers only import this module, forking a process that runs Qt threads is not safe
+        context = multiprocessing.get_context("spawn")
+        with ProcessPoolExecutor(max_workers=processes, mp_context=context) as pool:
+            list(pool.map(_render_job, jobs, chunksize=max(1, len(jobs) // (4 * (processes or os.cpu_count() or 1)))))
+    return thumbnails
@@ -0,0 +1,192 @@
+"""
+2D affine transforms of airfoil coordinates
+
+A transform is one 3x3 homogeneous matrix. Translations, rotations and scalings are accumulated into the matrix, and the
+matrix is applied once to a contiguous (N, 2) coordinate buffer, instead of transforming the upper and lower surfaces
+separately for every operation.
+
+Rotations follow the convention of the airfoil classes: positive angles (in degrees) rotate clockwise, so a positive
+incidence raises the leading edge of an airfoil whose chord runs along +x.
+
+Classes:
+    AffineTransform: Accumulated 3x3 affine matrix
+
+Functions:
+    section_matrices: Builds the (K, 3, 3) matrices of K section transforms at once
+    transform_sections: Transforms a (K, N, 2) stack of sections, each with its own chord, twist and position, in one call
+"""
+import numpy as np
+
+class AffineTransform:
+    """
+    Accumulated 3x3 affine matrix. Every operation is applied after the ones before it, and returns the transform so that
+    operations can be chained:
+
+        AffineTransform().translate(-0.25, 0).scale(2).rotate(5).translate(1, 0)
+
+    Attributes:
+        MATRIX (np.ndarray): the 3x3 homogeneous matrix, points are column vectors (x, y, 1)
+    """
+    def __init__(self, matrix:np.ndarray=None):
+        self.MATRIX = np.eye(3) if matrix is None else np.array(matrix, dtype=np.float64)
+        self._linear = np.empty((2, 2)) # contiguous copy of the linear part, used by apply(out=)
+
+    def __matmul__(self, other:"AffineTransform")->"AffineTransform":
+        """Returns the transform that applies other first and then self"""
+        return AffineTransform(self.MATRIX @ other.MATRIX)
+
+    def __repr__(self):
+        return f"AffineTransform({self.MATRIX.tolist()})"
+
+    @classmethod
+    def from_parameters(cls, scale:float=1.0, angle:float=0.0, position:tuple=(0.0, 0.0), pivot:tuple=(0.0, 0.0)):
+        """
+        Builds the transform that scales and rotates a shape about pivot and then moves pivot to position, see set_parameters()
+        """
+        return cls().set_parameters(scale, angle, position, pivot)
+
+    def set_parameters(self, scale:float=1.0, angle:float=0.0, position:tuple=(0.0, 0.0), pivot:tuple=(0.0, 0.0))->"AffineTransform":
+        """
+        Sets the transform, in place, to scaling and rotating about pivot and then moving pivot to position. This is the same
+        as reset().translate(-pivot).scale(scale).rotate(angle).translate(position) without building the intermediate matrices
+
+        Args:
+            scale (float): scale factor
+            angle (float): rotation in degrees, positive clockwise
+            position (tuple): x, y where the pivot ends up
+            pivot (tuple): x, y of the point that is scaled and rotated about, e.g. the quarter chord
+        """
+        angle_rad = np.deg2rad(angle)
+        cos, sin = scale * np.cos(angle_rad), scale * np.sin(angle_rad)
+        matrix = self.MATRIX
+        matrix[0, 0], matrix[0, 1] = cos, sin
+        matrix[1, 0], matrix[1, 1] = -sin, cos
+        matrix[0, 2] = position[0] - cos * pivot[0] - sin * pivot[1]
+        matrix[1, 2] = position[1] + sin * pivot[0] - cos * pivot[1]
+        matrix[2, 0] = matrix[2, 1] = 0.0
+        matrix[2, 2] = 1.0
+        return self
+
+    def copy(self)->"AffineTransform":
+        return AffineTransform(self.MATRIX)
+
+    def reset(self)->"AffineTransform":
+        """Resets the transform to the identity"""
+        self.MATRIX = np.eye(3)
+        return self
+
+    def then(self, matrix:np.ndarray)->"AffineTransform":
+        """Applies the 3x3 matrix after the current transform"""
+        self.MATRIX = matrix @ self.MATRIX
+        return self
+
+    def translate(self, dx:float, dy:float)->"AffineTransform":
+        """Moves by dx, dy"""
+        return self.then(np.array([[1.0, 0.0, dx], [0.0, 1.0, dy], [0.0, 0.0, 1.0]]))
+
+    def rotate(self, angle:float, origin:tuple=(0.0, 0.0))->"AffineTransform":
+        """Rotates by angle degrees about origin, positive angles rotate clockwise"""
+        angle_rad = np.deg2rad(angle)
+        cos, sin = np.cos(angle_rad), np.sin(angle_rad)
+        ox, oy = origin
+        return self.then(np.array([
+            [ cos, sin, ox - cos * ox - sin * oy],
+            [-sin, cos, oy + sin * ox - cos * oy],
+            [ 0.0, 0.0, 1.0],
+        ]))
+
+    def scale(self, sx:float, sy:float=None, origin:tuple=(0.0, 0.0))->"AffineTransform":
+        """Scales by sx horizontally and sy vertically (sx if not given) about origin"""
+        sy = sx if sy is None else sy
+        ox, oy = origin
+        return self.then(np.array([[sx, 0.0, ox - sx * ox], [0.0, sy, oy - sy * oy], [0.0, 0.0, 1.0]]))
+
+    def inverse(self)->"AffineTransform":
+        return AffineTransform(np.linalg.inv(self.MATRIX))
+
+    def apply(self, points:np.ndarray, out:np.ndarray=None)->np.ndarray:
+        """
+        Applies the transform to points
+
+        Args:
+            points (np.ndarray): (N, 2) coordinates
+            out (np.ndarray): optional C-contiguous (N, 2) float64 array the result is written into, so no array is
+                allocated. It may be points itself
+
+        Returns:
+            np.ndarray: the (N, 2) transformed coordinates, out if it was given
+        """
+        if out is None:
+            return points @ self.MATRIX[:2, :2].T + self.MATRIX[:2, 2]
+        # np.dot with contiguous operands and a column-wise scalar add are the variants that do not allocate a
+        # temporary buffer, broadcasting a strided (2,) offset over out does
+        np.copyto(self._linear, self.MATRIX[:2, :2].T)
+        np.dot(points, self._linear, out=out)
+        out[:, 0] += self.MATRIX[0, 2]
+        out[:, 1] += self.MATRIX[1, 2]
+        return out
+
+    def apply_to_point(self, x:float, y:float)->tuple:
+        """Applies the transform to a single point and returns x, y"""
+        return (self.MATRIX[0, 0] * x + self.MATRIX[0, 1] * y + self.MATRIX[0, 2],
+                self.MATRIX[1, 0] * x + self.MATRIX[1, 1] * y + self.MATRIX[1, 2])
+
+
+def section_matrices(chords, twists, positions=(0.0, 0.0), offsets=0.0, pivot=(0.25, 0.0))->np.ndarray:
+    """
+    Builds the matrices of K section transforms at once. Each section is scaled by its chord and rotated by its twist
+    about the pivot, and the pivot is then moved to the position of the section, raised by its dihedral offset.
+    This is AffineTransform.from_parameters for every section, without a Python loop.
+
+    Args:
+        chords (array_like): (K,) scale factors, the chords of unit-chord sections
+        twists (array_like): (K,) rotations in degrees, positive values raise the leading edge
+        positions (array_like): (K, 2) or (2,) positions of the pivots
+        offsets (array_like): (K,) or scalar vertical offsets added to the positions, e.g. span * tan(dihedral)
+        pivot (array_like): (K, 2) or (2,) point of the sections that is scaled and rotated about, the quarter chord of
+            a unit-chord section by default
+
+    Returns:
+        np.ndarray: (K, 3, 3) homogeneous matrices
+    """
+    shape = np.broadcast_shapes(np.shape(chords), np.shape(twists), np.shape(offsets), np.shape(positions)[:-1], np.shape(pivot)[:-1])
+    count = shape[0] if shape else 1
+    chords = np.broadcast_to(np.asarray(chords, dtype=np.float64), (count,))
+    twists = np.deg2rad(np.broadcast_to(np.asarray(twists, dtype=np.float64), (count,)))
+    positions = np.broadcast_to(np.asarray(positions, dtype=np.float64), (count, 2))
+    offsets = np.broadcast_to(np.asarray(offsets, dtype=np.float64), (count,))
+    pivot = np.broadcast_to(np.asarray(pivot, dtype=np.float64), (count, 2))
+
+    cos = chords * np.cos(twists)
+    sin = chords * np.sin(twists)
+    matrices = np.zeros((count, 3, 3))
+    matrices[:, 0, 0] = cos
+    matrices[:, 0, 1] = sin
+    matrices[:, 1, 0] = -sin
+    matrices[:, 1, 1] = cos
+    matrices[:, 0, 2] = positions[:, 0] - cos * pivot[:, 0] - sin * pivot[:, 1]
+    matrices[:, 1, 2] = positions[:, 1] + offsets + sin * pivot[:, 0] - cos * pivot[:, 1]
+    matrices[:, 2, 2] = 1.0
+    return matrices
+
+def transform_sections(sections:np.ndarray, chords, twists, positions=(0.0, 0.0), offsets=0.0, pivot=(0.25, 0.0), out:np.ndarray=None)->np.ndarray:
+    """
+    Transforms a stack of sections, each with its own chord, twist, position and dihedral offset, with one batched
+    matrix multiply instead of a loop of scale_to, rotate_to and translate_to calls. See section_matrices() for the
+    transform parameters.
+
+    Args:
+        sections (np.ndarray): (K, N, 2) coordinates of the sections, usually resampled unit-chord airfoils. Parameters
+            given as scalars apply to every section
+        out (np.ndarray): optional (K, N, 2) float64 array the result is written into
+
+    Returns:
+        np.ndarray: (K, N, 2) transformed coordinates, out if it was given
+    """
+    chords = np.broadcast_to(np.asarray(chords, dtype=np.float64), (len(sections),))
+    matrices = section_matrices(chords, twists, positions, offsets, pivot)
+    if len(matrices) != len(sections):
+        raise ValueError(f"{len(matrices)} transforms were given for {len(sections)} sections")
+    out = np.matmul(sections, matrices[:, :2, :2].transpose(0, 2, 1), out=out)
+    out += matrices[:, np.newaxis, :2, 2]
+    return out
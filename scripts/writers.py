@@ -0,0 +1,157 @@
+"""
+Streaming CAD writers for airfoils and wing lofts
+
+Every writer streams the coordinates from the (K, N, 2) buffer of K sections into a buffered text file. The values are
+formatted in blocks of CHUNK points with one %-formatting operation per block, so no string is built per point and the
+memory used does not grow with the number of points. A loft of many sections is written into one file in one pass.
+
+Formats:
+    dxf: AutoCAD R12 ASCII DXF, one 3D polyline per section, in the plane of scripts.export
+    svg: one polyline per section, in section coordinates (y up), scaled to millimetres
+    xml: airfoil coordinates in XML for XFLR5, one <airfoil> element per section
+    dat: Selig .dat, the name on the first line and one point per line, for a single section only
+
+Functions:
+    write_dxf: Writes sections to a DXF file handle
+    write_svg: Writes sections to an SVG file handle
+    write_xml: Writes sections to an XML file handle
+    write_selig: Writes a section to a Selig .dat file handle
+    export_sections_to: Writes sections to a file in the format given by its extension
+"""
+import os
+from xml.sax.saxutils import escape, quoteattr
+
+import numpy as np
+
+from scripts.export import map_to_plane
+
+CHUNK = 4096 # points formatted per block
+
+def _stream(file, rows:np.ndarray, line:str):
+    """Writes rows with the format line, which takes one row of values, CHUNK rows at a time"""
+    for start in range(0, len(rows), CHUNK):
+        block = rows[start:start + CHUNK]
+        file.write((line * len(block)) % tuple(block.ravel().tolist()))
+
+def _sections(sections, depths, names)->tuple:
+    sections = np.asarray(sections, dtype=np.float64)
+    if sections.ndim == 2:
+        sections = sections[np.newaxis]
+    depths = np.broadcast_to(np.asarray(depths, dtype=np.float64), (len(sections),))
+    if names is None:
+        names = [f"section_{k}" for k in range(len(sections))]
+    elif isinstance(names, str):
+        names = [names] if len(sections) == 1 else [f"{names}_{k}" for k in range(len(sections))]
+    if len(names) != len(sections):
+        raise ValueError(f"{len(names)} names were given for {len(sections)} sections")
+    return sections, depths, list(names)
+
+def write_dxf(file, sections, depths=0.0, names=None, plane:str="XY", precision:int=8):
+    """
+    Writes sections as 3D polylines of an R12 ASCII DXF file, each on a layer named after it
+
+    Args:
+        file: text file handle open for writing
+        sections (np.ndarray): (N, 2) coordinates of an airfoil or (K, N, 2) coordinates of K sections
+        depths (array_like): position of every section along the axis that is not in the plane, e.g. its spanwise position
+        names (list): name of every section, a single name for all of them, or None for section_0, section_1, ...
+        plane (str): plane the sections lie in, see scripts.export.PLANES
+        precision (int): significant digits of every value
+    """
+    sections, depths, names = _sections(sections, depths, names)
+    file.write("0\nSECTION\n2\nENTITIES\n")
+    for section, depth, name in zip(sections, depths, names):
+        layer = name.replace(' ', '_')
+        # 70 = 8: 3D polyline, 70 = 32: vertex of a 3D polyline
+        file.write(f"0\nPOLYLINE\n8\n{layer}\n66\n1\n10\n0\n20\n0\n30\n0\n70\n8\n")
+        vertex = f"0\nVERTEX\n8\n{layer.replace('%', '%%')}\n10\n%.{precision}g\n20\n%.{precision}g\n30\n%.{precision}g\n70\n32\n"
+        _stream(file, map_to_plane(section, plane, depth), vertex)
+        file.write(f"0\nSEQEND\n8\n{layer}\n")
+    file.write("0\nENDSEC\n0\nEOF\n")
+
+def write_svg(file, sections, depths=0.0, names=None, scale:float=1.0, precision:int=6, stroke:str="black"):
+    """
+    Writes sections as polylines of an SVG file, in section coordinates with y up. The view box fits all the sections.
+
+    Args:
+        file: text file handle open for writing
+        sections, depths, names: see write_dxf(), the depth of every section is kept in a data-depth attribute
+        scale (float): millimetres per unit of the coordinates
+        precision (int): significant digits of every value
+        stroke (str): colour of the outlines
+    """
+    sections, depths, names = _sections(sections, depths, names)
+    low = sections.reshape(-1, 2).min(axis=0)
+    high = sections.reshape(-1, 2).max(axis=0)
+    margin = 0.02 * max(high - low)
+    x, y = low[0] - margin, -high[1] - margin
+    width, height = high[0] - low[0] + 2 * margin, high[1] - low[1] + 2 * margin
+    file.write('<?xml version="1.0" encoding="UTF-8"?>\n')
+    file.write(f'<svg xmlns="http://www.w3.org/2000/svg" width="{width * scale:g}mm" height="{height * scale:g}mm" '
+               f'viewBox="{x:g} {y:g} {width:g} {height:g}">\n')
+    file.write(f'<g transform="scale(1,-1)" fill="none" stroke={quoteattr(stroke)} stroke-width="{0.002 * width:g}">\n')
+    for section, depth, name in zip(sections, depths, names):
+        file.write(f'<polyline id={quoteattr(name)} data-depth="{depth:g}" points="')
+        _stream(file, section, f"%.{precision}g,%.{precision}g ")
+        file.write('"/>\n')
+    file.write("</g>\n</svg>\n")
+
+def write_xml(file, sections, depths=0.0, names=None, plane:str="XY", precision:int=8):
+    """
+    Writes sections as <airfoil> elements of an XML file for XFLR5, each with its name and its points in 3D
+
+    Args:
+        file: text file handle open for writing
+        sections, depths, names, plane: see write_dxf()
+        precision (int): significant digits of every value
+    """
+    sections, depths, names = _sections(sections, depths, names)
+    point = f"        <point><x>%.{precision}g</x><y>%.{precision}g</y><z>%.{precision}g</z></point>\n"
+    file.write('<?xml version="1.0"?>\n<airfoils>\n')
+    for section, depth, name in zip(sections, depths, names):
+        file.write(f"<airfoil>\n    <name>{escape(name)}</name>\n    <points>\n")
+        _stream(file, map_to_plane(section, plane, depth), point)
+        file.write("    </points>\n</airfoil>\n")
+    file.write("</airfoils>\n")
+
+def write_selig(file, sections, depths=0.0, names=None, precision:int=8):
+    """
+    Writes a section as a Selig .dat file, the name on the first line and then x, y per line in the order of the buffer
+
+    Raises:
+        ValueError: if more than one section is given, a .dat file holds a single airfoil
+    """
+    sections, depths, names = _sections(sections, depths, names)
+    if len(sections) != 1:
+        raise ValueError(f"A Selig .dat file holds one airfoil, {len(sections)} sections were given")
+    file.write(f"{names[0]}\n")
+    _stream(file, sections[0], f" %.{precision}f  %.{precision}f\n")
+
+WRITERS = {
+    ".dxf": write_dxf,
+    ".svg": write_svg,
+    ".xml": write_xml,
+    ".dat": write_selig,
+}
+
+def export_sections_to(filename:str, sections, depths=0.0, names=None, **options)->str:
+    """
+    Writes an airfoil or a loft of sections to one file, in the format given by the extension of filename (see WRITERS)
+
+    Args:
+        filename (str): path of the file
+        sections, depths, names: see write_dxf()
+        options: passed on to the writer, e.g. plane or precision
+
+    Returns:
+        str: filename
+
+    Raises:
+        ValueError: if the extension is not one of WRITERS
+    """
+    extension = os.path.splitext(filename)[1].lower()
+    if extension not in WRITERS:
+        raise ValueError(f"Unknown file type {extension!r}, expected one of {', '.join(WRITERS)}")
+    with open(filename, mode="w", encoding="utf-8", newline="\n", buffering=1 << 16) as file:
+        WRITERS[extension](file, sections, depths, names, **options)
+    return filename
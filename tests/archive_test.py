@@ -0,0 +1,47 @@
+import os
+import numpy as np
+import pytest
+from scripts.archive import AirfoilArchive, build_archive
+from scripts.parsers import parse_airfoil_file, split_selig
+
+FOIL = """FOIL {0}
+1.0 0.0
+0.5 0.0{0}
+0.0 0.0
+0.5 -0.0{0}
+1.0 0.0
+"""
+
+@pytest.fixture
+def archive(tmp_path):
+    folder = tmp_path / "airfoils"
+    folder.mkdir()
+    for i in range(1, 4):
+        (folder / f"foil{i}.dat").write_text(FOIL.format(i))
+    (folder / "broken.dat").write_text("BROKEN\nnot a number\n")
+    archive_path = str(tmp_path / "archive.bin")
+    count, errors = build_archive(str(folder), archive_path)
+    assert count == 3
+    assert [os.path.basename(error.path) for error in errors] == ["broken.dat"]
+    return AirfoilArchive(archive_path)
+
+def test_archive_round_trip(archive):
+    assert len(archive) == 3
+    for i, path in enumerate(archive.PATHS):
+        name, data = parse_airfoil_file(path)
+        data, i_le = split_selig(data)
+        assert archive.NAMES[i] == name
+        assert archive.split(i) == i_le
+        np.testing.assert_array_equal(archive.coordinates(archive.index_of(path)), data)
+
+def test_archive_coordinates_are_views(archive):
+    coordinates = archive.coordinates(0)
+    assert not coordinates.flags['OWNDATA']
+    assert np.shares_memory(coordinates, archive.COORDINATES)
+    np.testing.assert_array_equal(np.vstack((archive.upper(0), archive.lower(0)[1:])), coordinates)
+
+def test_archive_rejects_other_files(tmp_path):
+    path = tmp_path / "not_an_archive.bin"
+    path.write_bytes(b"0" * 64)
+    with pytest.raises(ValueError):
+        AirfoilArchive(str(path))
@@ -0,0 +1,98 @@
+import os
+import numpy as np
+import pytest
+import scripts.cache
+from scripts.cache import GeometryCache
+
+FOIL = """FOIL {0}
+1.0 0.0
+0.5 0.0{0}
+0.0 0.0
+0.5 -0.0{0}
+1.0 0.0
+"""
+ENTRY_BYTES = 5 * 2 * 8 # 5 points of float64 x, y
+
+@pytest.fixture
+def paths(tmp_path):
+    paths = []
+    for i in range(1, 5):
+        path = tmp_path / f"foil{i}.dat"
+        path.write_text(FOIL.format(i))
+        paths.append(str(path))
+    return paths
+
+@pytest.fixture
+def parsed(monkeypatch):
+    """Records the files parsed by the cache"""
+    parsed = []
+    read_airfoil = scripts.cache.read_airfoil
+    def recording_read(path):
+        parsed.append(os.path.basename(path))
+        return read_airfoil(path)
+    monkeypatch.setattr(scripts.cache, "read_airfoil", recording_read)
+    return parsed
+
+def test_hits_and_misses(paths, parsed):
+    cache = GeometryCache()
+    first = cache.get(paths[0])
+    assert cache.get(paths[0]) is first
+    cache.get(paths[1])
+    assert parsed == ["foil1.dat", "foil2.dat"]
+    assert cache.stats() == {"entries": 2, "nbytes": 2 * ENTRY_BYTES, "max_bytes": cache.max_bytes, "hits": 1, "misses": 2, "hit_rate": 1 / 3}
+    name, num_points, data, i_le = first
+    assert (name, num_points, i_le) == ("FOIL 1", 5, 2) and data.shape == (5, 2)
+
+def test_least_recently_used_entries_are_evicted(paths, parsed):
+    cache = GeometryCache(max_bytes=2 * ENTRY_BYTES)
+    cache.get(paths[0])
+    cache.get(paths[1])
+    cache.get(paths[0]) # foil2 is now the least recently used
+    cache.get(paths[2])
+    assert len(cache) == 2 and cache.nbytes == 2 * ENTRY_BYTES
+    parsed.clear()
+    cache.get(paths[0])
+    cache.get(paths[1])
+    assert parsed == ["foil2.dat"]
+
+def test_entries_over_budget_are_not_kept(paths):
+    cache = GeometryCache(max_bytes=ENTRY_BYTES - 1)
+    assert cache.get(paths[0])[0] == "FOIL 1"
+    assert len(cache) == 0 and cache.nbytes == 0
+
+def test_changed_files_are_parsed_again(paths, parsed):
+    cache = GeometryCache()
+    cache.get(paths[0])
+    with open(paths[0], "w") as file:
+        file.write(FOIL.format(9))
+    stat = os.stat(paths[0])
+    os.utime(paths[0], ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+    assert cache.get(paths[0])[0] == "FOIL 9"
+    assert parsed == ["foil1.dat", "foil1.dat"]
+    assert len(cache) == 1 and cache.nbytes == ENTRY_BYTES
+
+def test_resize_evicts_down_to_the_new_budget(paths):
+    cache = GeometryCache()
+    for path in paths:
+        cache.get(path)
+    assert len(cache) == 4
+    cache.resize(ENTRY_BYTES)
+    assert len(cache) == 1 and cache.nbytes == ENTRY_BYTES
+    # the most recently used entry is kept
+    hits = cache.hits
+    cache.get(paths[-1])
+    assert cache.hits == hits + 1
+
+def test_cached_arrays_are_read_only(paths):
+    cache = GeometryCache()
+    data = cache.get(paths[0])[2]
+    assert not data.flags.writeable
+    with pytest.raises(ValueError):
+        data[0, 0] = 2.0
+
+def test_clear(paths):
+    cache = GeometryCache()
+    cache.get(paths[0])
+    cache.get(paths[0])
+    cache.clear()
+    assert cache.stats() == {"entries": 0, "nbytes": 0, "max_bytes": cache.max_bytes, "hits": 0, "misses": 0, "hit_rate": 0.0}
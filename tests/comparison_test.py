@@ -0,0 +1,48 @@
+import numpy as np
+import pytest
+from models.comparison import ComparisonListModel, GeometryStore
+from scripts.transforms import AffineTransform
+
+AIRFOIL = "airfoils/clarky.dat"
+
+@pytest.fixture
+def model():
+    return ComparisonListModel(GeometryStore())
+
+def test_foils_share_the_source_geometry(model):
+    for _ in range(30):
+        model.addAirfoil(AIRFOIL)
+    assert model.rowCount() == 30 and len(model.store) == 1
+    assert model._data[0].source is model._data[29].source
+    assert model.points(0) is not model.points(1)
+    assert len({model.data(model.index(row), ComparisonListModel.ColourRole) for row in range(10)}) == 10
+    for row in reversed(range(30)):
+        model.removeAirfoil(row)
+    assert len(model.store) == 0
+    assert model.addAirfoil("missing.dat") == -1
+
+def test_transform_changes_one_row(model):
+    model.addAirfoil(AIRFOIL)
+    model.addAirfoil(AIRFOIL)
+    before = model.points(0).copy()
+    changes = []
+    model.dataChanged.connect(lambda first, last, roles: changes.append((first.row(), last.row(), list(roles))))
+
+    model.setTransform(1, 5.0, 2.0, 1.0, 0.5)
+    assert [(first, last) for first, last, _ in changes] == [(1, 1)]
+    assert ComparisonListModel.VersionRole in changes[0][2]
+    np.testing.assert_array_equal(model.points(0), before)
+    source = model._data[1].source
+    expected = AffineTransform.from_parameters(2.0 / source.chord(), 5.0, (1.0, 0.5), source.quarter_chord()).apply(source.points)
+    np.testing.assert_allclose(model.points(1), expected)
+    assert model.data(model.index(1), ComparisonListModel.VersionRole) == 1
+
+def test_colour_and_visibility_do_not_touch_coordinates(model):
+    model.addAirfoil(AIRFOIL)
+    changes = []
+    model.dataChanged.connect(lambda first, last, roles: changes.append(list(roles)))
+    model.setColour(0, "#000000")
+    model.setVisible(0, False)
+    assert changes == [[ComparisonListModel.ColourRole], [ComparisonListModel.VisibleRole]]
+    assert model.data(model.index(0), ComparisonListModel.VisibleRole) is False
+    assert model.data(model.index(0), ComparisonListModel.VersionRole) == 0
@@ -0,0 +1,26 @@
+import numpy as np
+import pytest
+from models.geometry import GeometryCore
+from scripts.resample import cosine_stations
+
+def make_ellipse(n:int, thickness:float=0.12, chord:float=1.0)->GeometryCore:
+    """Elliptic airfoil in Selig order, from (chord, 0) over the top to (0, 0) and back under, leading edge at n // 2"""
+    angles = np.linspace(0, 2 * np.pi, n)
+    return GeometryCore(np.column_stack((0.5 * chord * (1 + np.cos(angles)), 0.5 * chord * thickness * np.sin(angles))), n // 2)
+
+def make_naca4(thickness:float, camber:float, n:int=81)->tuple[np.ndarray, int]:
+    """NACA 4-digit airfoil with its maximum camber at half chord, as Selig coordinates and the leading edge index"""
+    x = cosine_stations(n)
+    yt = 5 * thickness * (0.2969 * np.sqrt(x) - 0.1260 * x - 0.3516 * x**2 + 0.2843 * x**3 - 0.1015 * x**4)
+    yc = 4 * camber * x * (1 - x)
+    upper = np.column_stack((x, yc + yt))[::-1]
+    lower = np.column_stack((x, yc - yt))[1:]
+    return np.vstack((upper, lower)), n - 1
+
+@pytest.fixture
+def ellipse():
+    return make_ellipse
+
+@pytest.fixture
+def naca4():
+    return make_naca4
@@ -0,0 +1,37 @@
+import pytest
+from PySide2.QtCore import QCoreApplication
+from models.data import AirfoilListModel
+
+@pytest.fixture
+def app():
+    return QCoreApplication.instance() or QCoreApplication([])
+
+@pytest.fixture
+def signals(app):
+    model = AirfoilListModel()
+    signals = []
+    model.modelReset.connect(lambda: signals.append("reset"))
+    model.rowsInserted.connect(lambda parent, first, last: signals.append(("inserted", first, last)))
+    return model, signals
+
+def test_first_items_reset_the_model(signals):
+    model, signals = signals
+    model.addItems((f"foil {i}", f"foil{i}.dat") for i in range(100))
+    assert signals == ["reset"]
+    assert model.rowCount() == 100
+    assert model.data(model.index(42), AirfoilListModel.NameRole) == "foil 42"
+    assert model.data(model.index(42), AirfoilListModel.PathRole) == "foil42.dat"
+
+def test_more_items_are_inserted_at_once(signals):
+    model, signals = signals
+    model.addItems([("a", "a.dat")])
+    model.addItems((f"foil {i}", f"foil{i}.dat") for i in range(50))
+    model.addItems([])
+    assert signals == ["reset", ("inserted", 1, 50)]
+    assert model.rowCount() == 51
+
+def test_single_items_are_inserted(signals):
+    model, signals = signals
+    model.addItem("a", "a.dat")
+    model.addItem("b", "b.dat")
+    assert signals == [("inserted", 0, 0), ("inserted", 1, 1)]
@@ -0,0 +1,71 @@
+import os
+import numpy as np
+import pytest
+import scripts.export
+from models.airfoils import Airfoil_new
+from scripts.export import PLANES, export_batch, export_sections, format_points, map_to_plane, write_curve
+
+POINTS = np.array([[1.0, 0.01], [0.0, 0.0], [1.0, -0.01]])
+
+@pytest.mark.parametrize("plane, expected", [
+    ("XY", [1.0, 0.01, 5.0]), ("YX", [0.01, 1.0, 5.0]), ("XZ", [1.0, 5.0, 0.01]),
+    ("ZX", [0.01, 5.0, 1.0]), ("YZ", [5.0, 1.0, 0.01]), ("zy", [5.0, 0.01, 1.0]),
+])
+def test_plane_mappings(plane, expected):
+    np.testing.assert_array_equal(map_to_plane(POINTS, plane, depth=5.0)[0], expected)
+
+def test_unknown_plane():
+    with pytest.raises(ValueError):
+        map_to_plane(POINTS, "XX")
+
+def test_sections_are_mapped_at_their_depth():
+    sections = np.stack([POINTS, 2 * POINTS])
+    mapped = map_to_plane(sections, "XY", depth=[0.0, 3.0])
+    assert mapped.shape == (2, 3, 3)
+    np.testing.assert_array_equal(mapped[:, :, 2], [[0, 0, 0], [3, 3, 3]])
+
+def test_format_matches_loadtxt(tmp_path):
+    points = np.random.default_rng(0).normal(size=(500, 3))
+    text = format_points(points, delimiter=",", precision=17)
+    assert text.count("\n") == 500
+    path = write_curve(str(tmp_path / "curve"), points[:, :2], plane="XY", format="csv")
+    assert path.endswith(".csv")
+    np.testing.assert_allclose(np.loadtxt(path, delimiter=",", skiprows=1)[:, :2], points[:, :2], rtol=1e-7)
+
+def test_batch_export(tmp_path, monkeypatch):
+    monkeypatch.setattr(scripts.export, "MIN_PARALLEL_FILES", 2)
+    foils = [(f"foil {i}", POINTS * (i + 1)) for i in range(8)]
+    paths = export_batch(foils, str(tmp_path / "out"), plane="XZ", processes=2)
+    assert [os.path.basename(path) for path in paths] == [f"foil_{i}.txt" for i in range(8)]
+    np.testing.assert_allclose(np.loadtxt(paths[3]), map_to_plane(POINTS * 4, "XZ"))
+
+def test_small_batches_are_written_in_process(tmp_path, monkeypatch):
+    def no_pool(*args, **kwargs):
+        raise AssertionError("a process pool was started")
+    monkeypatch.setattr(scripts.export, "ProcessPoolExecutor", no_pool)
+    foils = [(f"foil{i}", POINTS) for i in range(3)]
+    paths = export_batch(foils, str(tmp_path), processes=4)
+    assert [os.path.basename(path) for path in paths] == ["foil0.txt", "foil1.txt", "foil2.txt"]
+
+def test_export_sections(tmp_path):
+    paths = export_sections("wing", np.stack([POINTS] * 3), [0.0, 1.0, 2.0], str(tmp_path), plane="XY", processes=0)
+    assert len(paths) == 3
+    np.testing.assert_allclose(np.loadtxt(paths[2])[:, 2], 2.0)
+
+def test_airfoil_export_uses_its_plane(tmp_path, monkeypatch):
+    foil = Airfoil_new()
+    foil.load("airfoils/clarky.dat")
+    foil.plane("yz")
+    monkeypatch.chdir(tmp_path)
+    foil.export_curve_to("solidworks_curve")
+    exported = np.loadtxt(foil.EXPORT_FILENAME)
+    np.testing.assert_array_equal(exported[:, 0], 0.0)
+    np.testing.assert_allclose(exported[:, 1:], foil.getData()[::-1], rtol=1e-7)
+
+def test_airfoil_export_rejects_unknown_formats(tmp_path, monkeypatch):
+    foil = Airfoil_new()
+    foil.load("airfoils/clarky.dat")
+    monkeypatch.chdir(tmp_path)
+    with pytest.raises(ValueError, match="Invalid format"):
+        foil.export_curve_to("NURBS")
+    assert list(tmp_path.iterdir()) == []
@@ -0,0 +1,54 @@
+import re
+import time
+import numpy as np
+import pytest
+from models.wings import Section
+from scripts.gcode import feed_rates, generate_gcode, offset_outline, toolpath
+
+def area(points):
+    x, y = points.T
+    return 0.5 * abs(np.dot(x, np.roll(y, -1)) - np.dot(y, np.roll(x, -1)))
+
+def test_offset_outline_grows_outwards(ellipse):
+    points = ellipse(401).points
+    for outline in (points, points[::-1]):
+        grown = offset_outline(outline, 0.01)
+        assert len(grown) == len(outline)
+        assert area(grown) > area(outline)
+        np.testing.assert_allclose(np.hypot(*(grown - outline).T), 0.01)
+
+def test_straight_panel_is_synchronised(ellipse):
+    section = Section(ellipse(81), ellipse(81), root_chord=200.0, tip_chord=200.0, span=500.0, num_points=101)
+    xy, uv = toolpath(section, kerf=1.0)
+    assert xy.shape == uv.shape == (101 + 4, 2)
+    np.testing.assert_allclose(xy, uv)
+    np.testing.assert_array_equal(xy[0], xy[-1])
+    # equal moves at both towers run at feed * sqrt(2) over the four axes
+    np.testing.assert_allclose(feed_rates(xy, uv, 300.0)[1:-1], 300.0 * np.sqrt(2))
+
+def test_tapered_panel(ellipse):
+    section = Section(ellipse(81), ellipse(61, 0.09), root_chord=200.0, tip_chord=100.0, span=500.0, twist=-2.0, num_points=101)
+    xy, uv = toolpath(section, kerf=1.0, tip_kerf=1.4)
+    lengths_xy = np.hypot(*np.diff(xy, axis=0).T)
+    lengths_uv = np.hypot(*np.diff(uv, axis=0).T)
+    feeds = feed_rates(xy, uv, 300.0)
+    # the longer move of every step runs at the nominal feed
+    speed = feeds * np.maximum(lengths_xy, lengths_uv) / np.hypot(lengths_xy, lengths_uv)
+    np.testing.assert_allclose(speed, 300.0)
+
+    # extended to towers 800 apart with the root 150 from the XY tower, the wire passes through the root and tip outlines
+    tower_xy, tower_uv = toolpath(section, kerf=1.0, tip_kerf=1.4, tower_span=800.0, root_offset=150.0)
+    np.testing.assert_allclose(tower_xy + (tower_uv - tower_xy) * 150.0 / 800.0, xy, atol=1e-9)
+    np.testing.assert_allclose(tower_xy + (tower_uv - tower_xy) * 650.0 / 800.0, uv, atol=1e-9)
+
+def test_generate_gcode(ellipse):
+    section = Section(ellipse(2001), ellipse(2001, 0.09), root_chord=200.0, tip_chord=120.0, span=400.0, num_points=20001)
+    start = time.perf_counter()
+    program = section.gcode(300.0, kerf=1.0, heat=40, axes=("X", "Y", "Z", "A"))
+    assert time.perf_counter() - start < 1.0
+    lines = program.splitlines()
+    assert lines[1:3] == ["G21", "G90"] and lines[3].startswith("G0 X") and lines[4] == "M3 S40"
+    assert lines[-2:] == ["M5", "M2"]
+    moves = [line for line in lines if line.startswith("G1")]
+    assert len(moves) == 20001 + 3
+    assert re.fullmatch(r"G1 X-?\d+\.\d{4} Y-?\d+\.\d{4} Z-?\d+\.\d{4} A-?\d+\.\d{4} F\d+\.\d", moves[100])
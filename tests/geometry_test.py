@@ -0,0 +1,82 @@
+import numpy as np
+import pytest
+from models.airfoils import Airfoil, Airfoil_new
+from models.geometry import GeometryCore
+from scripts.parsers import parse_airfoil_file
+
+# Selig order, leading edge at index 2
+POINTS = np.array([[1.0, 0.01], [0.5, 0.06], [0.0, 0.0], [0.5, -0.04], [1.0, -0.01]])
+
+def test_surfaces_are_views():
+    core = GeometryCore(POINTS.copy(), 2)
+    np.testing.assert_array_equal(core.upper, POINTS[2::-1])
+    np.testing.assert_array_equal(core.lower, POINTS[2:])
+    for view in (core.upper, core.lower, core.x, core.y):
+        assert np.shares_memory(view, core.points)
+    core.upper[-1] = (2.0, 0.0)
+    assert tuple(core.points[0]) == (2.0, 0.0)
+
+def test_from_surfaces_round_trip():
+    core = GeometryCore(POINTS, 2)
+    rebuilt = GeometryCore.from_surfaces(core.upper.T, core.lower.T)
+    assert rebuilt.le_index == 2
+    np.testing.assert_array_equal(rebuilt.points, POINTS)
+
+def test_chord_and_quarter_chord():
+    core = GeometryCore(POINTS, 2)
+    assert core.chord() == pytest.approx(1.0)
+    assert core.quarter_chord() == pytest.approx((0.25, 0.0))
+
+def test_closed_trailing_edge():
+    core = GeometryCore(POINTS, 2)
+    blended = core.closed_trailing_edge(blend=True)
+    assert len(blended) == 5 and tuple(blended.points[0]) == tuple(blended.points[-1]) == (1.0, 0.0)
+    line = core.closed_trailing_edge(blend=False)
+    assert len(line) == 7 and line.le_index == 3
+    np.testing.assert_array_equal(line.points[[0, 1, -2, -1]], [[1.0, 0.0], [1.0, 0.01], [1.0, -0.01], [1.0, 0.0]])
+
+def test_invalid_geometry():
+    with pytest.raises(ValueError):
+        GeometryCore(np.zeros((4, 3)), 0)
+    with pytest.raises(ValueError):
+        GeometryCore(POINTS, 5)
+
+def test_airfoil_stores_one_buffer(tmp_path):
+    path = tmp_path / "foil.dat"
+    np.savetxt(path, POINTS, header="FOIL", comments="")
+    foil = Airfoil(str(path), chord=2.0, incidence=4.0, position=(1.0, 0.5))
+    assert foil.calculate_chord() == pytest.approx(2.0)
+    assert foil.calculate_quarter_chord() == pytest.approx((1.0, 0.5))
+    for view in (foil.UPPER_X, foil.UPPER_Y, foil.LOWER_X, foil.LOWER_Y, foil.X, foil.Y):
+        assert np.shares_memory(view, foil.GEOMETRY.points)
+    assert foil.UPPER_X[0] == foil.LOWER_X[0]
+
+def test_point_orders(tmp_path):
+    path = tmp_path / "foil.dat"
+    np.savetxt(path, POINTS, header="FOIL", comments="")
+    foil = Airfoil(str(path))
+    points = foil.GEOMETRY.points
+    # X and Y are reversed Selig order: lower trailing edge, leading edge, upper trailing edge
+    assert (foil.X[0], foil.Y[0]) == tuple(points[-1])
+    assert (foil.X[2], foil.Y[2]) == tuple(points[foil.LE_INDEX])
+    assert (foil.X[-1], foil.Y[-1]) == tuple(points[0])
+    # order_points starts at the leading edge, goes over the upper surface and comes back over the lower surface
+    x, y = foil.order_points()
+    np.testing.assert_array_equal(np.column_stack((x, y)), points[[2, 1, 0, 4, 3]])
+
+def test_closed_trailing_edge_files():
+    # NACA 63-412 lists its sharp trailing edge point at both ends
+    _, data = parse_airfoil_file("airfoils/631-412.dat")
+    foil = Airfoil_new()
+    foil.load("airfoils/631-412.dat")
+    assert foil.NUM_POINTS == len(foil.GEOMETRY) == len(data)
+    assert foil.SOURCE_CHORD == pytest.approx(1.0)
+    assert foil.SOURCE_QUARTER_CHORD == pytest.approx((0.25, 0.0))
+    foil.close_TE(blend=True)
+    np.testing.assert_array_equal(foil.getData(), data)
+    foil.scale_to(100.0)
+    assert np.ptp(foil.getData()[:, 0]) == pytest.approx(100.0)
+
+    old = Airfoil("airfoils/631-412.dat")
+    assert old.calculate_chord() == pytest.approx(1.0)
+    np.testing.assert_allclose(old.GEOMETRY.points + (0.25, 0.0), data, atol=1e-12)
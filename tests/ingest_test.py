@@ -0,0 +1,53 @@
+import numpy as np
+import pytest
+from scripts.ingest import MIN_PARALLEL_FILES, AirfoilRecord, IngestError, ingest_airfoils, ingest_file
+
+FOIL = """FOIL {0}
+1.0 0.0
+0.5 0.{0:03d}
+0.0 0.0
+0.5 -0.{0:03d}
+1.0 0.0
+"""
+
+@pytest.fixture
+def paths(tmp_path):
+    paths = []
+    for i in range(1, MIN_PARALLEL_FILES + 6):
+        path = tmp_path / f"foil{i:03d}.dat"
+        path.write_text(FOIL.format(i))
+        paths.append(str(path))
+    # a file without coordinates and a file with a missing surface
+    (tmp_path / "empty.dat").write_text("EMPTY\n")
+    (tmp_path / "flat.dat").write_text("FLAT\n1.0 0.0\n0.0 0.0\n")
+    return paths + [str(tmp_path / "empty.dat"), str(tmp_path / "flat.dat"), str(tmp_path / "missing.dat")]
+
+def test_ingest_file(paths):
+    record = ingest_file(paths[0])
+    assert isinstance(record, AirfoilRecord)
+    assert record.name == "FOIL 1" and record.num_points == 5 and record.le_index == 2
+    np.testing.assert_array_equal(record.coordinates[:, 0], [1.0, 0.5, 0.0, 0.5, 1.0])
+
+def test_bad_files_are_returned_as_errors(paths):
+    for path, error in zip(paths[-3:], ("ValueError", "ValueError", "FileNotFoundError")):
+        result = ingest_file(path)
+        assert isinstance(result, IngestError)
+        assert result.path == path and result.error == error and result.message
+
+def test_serial_and_parallel_ingestion_agree(paths):
+    serial, serial_errors, serial_stats = ingest_airfoils(paths, max_workers=1)
+    parallel, parallel_errors, parallel_stats = ingest_airfoils(paths, max_workers=2)
+    assert serial_stats.workers == 1 and parallel_stats.workers == 2
+    assert [record.path for record in parallel] == [record.path for record in serial] == paths[:-3]
+    for a, b in zip(serial, parallel):
+        assert (a.name, a.num_points, a.le_index) == (b.name, b.num_points, b.le_index)
+        np.testing.assert_array_equal(a.coordinates, b.coordinates)
+    assert parallel_errors == serial_errors
+
+def test_ingest_stats(paths):
+    records, errors, stats = ingest_airfoils(paths)
+    assert stats.num_files == len(paths) == len(records) + len(errors)
+    assert stats.num_errors == len(errors) == 3
+    assert stats.seconds >= 0 and stats.files_per_second > 0
+    # small batches are parsed in this process
+    assert ingest_airfoils(paths[:MIN_PARALLEL_FILES - 1], max_workers=4)[2].workers == 1
@@ -0,0 +1,34 @@
+import pytest
+from PySide2.QtCore import QCoreApplication
+import models.controllers
+from models.controllers import LoaderThread
+
+@pytest.fixture
+def loader(monkeypatch):
+    QCoreApplication.instance() or QCoreApplication([])
+    clock = [0.0]
+    monkeypatch.setattr(models.controllers.time, "monotonic", lambda: clock[0])
+    loader = LoaderThread()
+    progress = []
+    loader.loadingProgress.connect(lambda step_number, step: progress.append((step_number, step)))
+    return loader, clock, progress
+
+def test_progress_is_rate_limited(loader):
+    loader, clock, progress = loader
+    for i in range(10):
+        loader.process_step(1, f"step {i}")
+    assert progress == [(1, "step 0")]
+    clock[0] += LoaderThread.PROGRESS_INTERVAL
+    loader.process_step(1, "later step", count=5)
+    # the steps counted in between are included in the next update
+    assert progress == [(1, "step 0"), (15, "later step")]
+
+def test_forced_progress_is_always_emitted(loader):
+    loader, clock, progress = loader
+    loader.process_step(1, "first")
+    loader.process_step(1, "skipped")
+    loader.process_step(1, "final", force=True)
+    assert progress == [(1, "first"), (3, "final")]
+    # a forced update restarts the interval
+    loader.process_step(1, "skipped too")
+    assert progress[-1] == (3, "final")
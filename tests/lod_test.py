@@ -0,0 +1,37 @@
+import numpy as np
+import pytest
+from scripts.lod import LODPyramid, minmax_buckets
+
+def test_minmax_buckets():
+    points = np.array([[0, 0], [1, 5], [2, -1], [3, 0], [4, 2], [5, 1], [6, 0]], dtype=float)
+    np.testing.assert_array_equal(minmax_buckets(points, 3), [0, 1, 2, 3, 4, 5, 6])
+    np.testing.assert_array_equal(minmax_buckets(points, 7), [0, 1, 2, 6])
+
+def test_levels_keep_the_extremes(ellipse):
+    points = ellipse(10001).points
+    pyramid = LODPyramid(points)
+    assert len(pyramid.LEVELS[0]) == len(points)
+    assert [len(level) for level in pyramid.LEVELS] == sorted((len(level) for level in pyramid.LEVELS), reverse=True)
+    for level in pyramid.LEVELS:
+        kept = points[level]
+        np.testing.assert_array_equal(kept.min(axis=0), points.min(axis=0))
+        np.testing.assert_array_equal(kept.max(axis=0), points.max(axis=0))
+
+def test_full_view_is_limited_by_pixels(ellipse):
+    points = ellipse(100001).points
+    visible = LODPyramid(points).visible((0, 1), (-1, 1), pixels=800)
+    assert len(visible) <= 6 * 800
+    np.testing.assert_array_equal(visible[[0, -1]], points[[0, -1]])
+
+def test_zoomed_view(ellipse):
+    points = ellipse(100001).points
+    pyramid = LODPyramid(points)
+    # the leading edge region, which lies in the middle of the Selig order
+    visible = pyramid.visible((0.0, 0.01), (-0.1, 0.1), pixels=800)
+    inside = (points[:, 0] <= 0.01)
+    assert len(visible) < 6 * 800
+    assert visible[:, 0].min() == pytest.approx(0.0)
+    # one point beyond the view at each end, so the lines leaving the view are drawn
+    assert visible[0, 0] > 0.01 and visible[-1, 0] > 0.01
+    assert np.count_nonzero(visible[:, 0] <= 0.01) <= np.count_nonzero(inside)
+    assert len(pyramid.visible((2, 3), (2, 3), pixels=800)) == 0
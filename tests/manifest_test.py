@@ -0,0 +1,146 @@
+import os
+import numpy as np
+import pytest
+import scripts.manifest
+import scripts.parameters
+from scripts.archive import AirfoilArchive, write_archive
+from scripts.manifest import AirfoilManifest
+from scripts.parameters import ParameterTable
+
+FOIL = """FOIL {0}
+1.0 0.0
+0.5 0.0{0}
+0.0 0.0
+0.5 -0.0{0}
+1.0 0.0
+"""
+
+@pytest.fixture
+def folder(tmp_path):
+    folder = tmp_path / "airfoils"
+    folder.mkdir()
+    for i in range(1, 4):
+        (folder / f"foil{i}.dat").write_text(FOIL.format(i))
+    return folder
+
+@pytest.fixture
+def calls(monkeypatch):
+    """Records the files hashed and parsed by the manifest"""
+    calls = {"hashed": [], "parsed": []}
+    file_hash, ingest_airfoils = scripts.manifest.file_hash, scripts.manifest.ingest_airfoils
+    def recording_hash(path):
+        calls["hashed"].append(os.path.basename(path))
+        return file_hash(path)
+    def recording_ingest(paths, **kwargs):
+        calls["parsed"].extend(os.path.basename(path) for path in paths)
+        return ingest_airfoils(paths, **kwargs)
+    monkeypatch.setattr(scripts.manifest, "file_hash", recording_hash)
+    monkeypatch.setattr(scripts.manifest, "ingest_airfoils", recording_ingest)
+    return calls
+
+def refresh(folder)->tuple[AirfoilManifest, tuple]:
+    manifest = AirfoilManifest(str(folder), str(folder.parent / "manifest.json"))
+    added, changed, removed = manifest.refresh()
+    return manifest, (sorted(added), sorted(changed), sorted(removed))
+
+def test_first_refresh_parses_every_file(folder, calls):
+    manifest, changes = refresh(folder)
+    assert changes == (["foil1.dat", "foil2.dat", "foil3.dat"], [], [])
+    assert sorted(calls["parsed"]) == ["foil1.dat", "foil2.dat", "foil3.dat"]
+    assert sorted(manifest.RECORDS) == ["foil1.dat", "foil2.dat", "foil3.dat"]
+    assert [name for name, _ in manifest.airfoils()] == ["foil1.dat", "foil2.dat", "foil3.dat"]
+    assert os.path.exists(manifest.PATH)
+
+def test_unchanged_files_are_only_stat_ed(folder, calls):
+    refresh(folder)
+    calls["hashed"].clear()
+    calls["parsed"].clear()
+    manifest, changes = refresh(folder)
+    assert changes == ([], [], [])
+    assert calls == {"hashed": [], "parsed": []}
+    assert manifest.RECORDS == {}
+
+def test_touched_files_are_hashed_but_not_parsed(folder, calls):
+    refresh(folder)
+    calls["hashed"].clear()
+    calls["parsed"].clear()
+    path = folder / "foil2.dat"
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+    _, changes = refresh(folder)
+    assert changes == ([], [], [])
+    assert calls == {"hashed": ["foil2.dat"], "parsed": []}
+    # the new modification time was saved, so the file is not hashed again
+    assert refresh(folder)[1] == ([], [], [])
+    assert calls["hashed"] == ["foil2.dat"]
+
+def test_added_changed_and_removed_files(folder, calls):
+    refresh(folder)
+    calls["parsed"].clear()
+    (folder / "foil4.dat").write_text(FOIL.format(4))
+    (folder / "foil2.dat").write_text(FOIL.format(5) + "\n")
+    (folder / "foil3.dat").unlink()
+    manifest, changes = refresh(folder)
+    assert changes == (["foil4.dat"], ["foil2.dat"], ["foil3.dat"])
+    assert sorted(calls["parsed"]) == ["foil2.dat", "foil4.dat"]
+    assert manifest.ENTRIES["foil2.dat"]["name"] == "FOIL 5"
+    assert [name for name, _ in manifest.airfoils()] == ["foil1.dat", "foil2.dat", "foil4.dat"]
+
+def test_bad_files_are_recorded_but_not_listed(folder, calls):
+    (folder / "broken.dat").write_text("BROKEN\nnot a number\n")
+    manifest, changes = refresh(folder)
+    assert "broken.dat" in changes[0]
+    assert manifest.ENTRIES["broken.dat"]["error"] is not None
+    assert "broken.dat" not in dict(manifest.airfoils())
+
+def test_archive_is_written_without_parsing_twice(folder, calls):
+    manifest, _ = refresh(folder)
+    archive_path = str(folder.parent / "archive.bin")
+    records, hashes = manifest.records()
+    write_archive(archive_path, str(folder), records, hashes)
+    archive = AirfoilArchive(archive_path)
+    # a cold start parses every file once, in refresh()
+    assert sorted(calls["parsed"]) == ["foil1.dat", "foil2.dat", "foil3.dat"]
+    assert manifest.matches(archive)
+
+    calls["parsed"].clear()
+    (folder / "foil2.dat").write_text(FOIL.format(5) + "\n")
+    manifest, _ = refresh(folder)
+    assert not manifest.matches(archive)
+    records, hashes = manifest.records(archive)
+    # only the changed file was parsed, the others are sliced from the previous archive
+    assert calls["parsed"] == ["foil2.dat"]
+    assert [record.name for record in records] == ["FOIL 1", "FOIL 5", "FOIL 3"]
+    assert np.shares_memory(records[0].coordinates, archive.COORDINATES)
+    assert not np.shares_memory(records[1].coordinates, archive.COORDINATES)
+
+def test_records_parse_files_missing_from_the_archive(folder, calls):
+    refresh(folder)
+    calls["parsed"].clear()
+    manifest, _ = refresh(folder)
+    records, hashes = manifest.records(None)
+    assert sorted(calls["parsed"]) == ["foil1.dat", "foil2.dat", "foil3.dat"]
+    assert hashes == manifest.hashes() and len(records) == 3
+
+def test_index_rows_of_unchanged_files_are_reused(folder, monkeypatch):
+    manifest, _ = refresh(folder)
+    archive_path = str(folder.parent / "archive.bin")
+    write_archive(archive_path, str(folder), *manifest.records())
+    table = ParameterTable.from_archive(AirfoilArchive(archive_path))
+
+    (folder / "foil2.dat").write_text(FOIL.format(5) + "\n")
+    manifest, _ = refresh(folder)
+    write_archive(archive_path, str(folder), *manifest.records(AirfoilArchive(archive_path)))
+    archive = AirfoilArchive(archive_path)
+    computed = []
+    compute_parameters = scripts.parameters.compute_parameters
+    def recording_compute(foils):
+        foils = list(foils)
+        computed.extend(foils)
+        return compute_parameters(foils)
+    monkeypatch.setattr(scripts.parameters, "compute_parameters", recording_compute)
+    updated = ParameterTable.from_archive(archive, previous=table)
+    assert len(computed) == 1
+    full = ParameterTable.from_archive(archive)
+    for name, column in full.COLUMNS.items():
+        np.testing.assert_array_equal(updated[name], column)
@@ -0,0 +1,58 @@
+import numpy as np
+import pytest
+from models.airfoils import Airfoil_new
+from models.data import AirfoilFilterModel, AirfoilListModel
+from scripts.parameters import ParameterTable, compute_parameters, parse_query
+from scripts.parsers import read_airfoil
+
+FOILS = [(0.12, 0.0), (0.12, 0.02), (0.15, 0.04), (0.09, 0.01)]
+
+@pytest.fixture
+def table(naca4):
+    foils = [naca4(*foil) for foil in FOILS]
+    names = [f"foil{i}" for i in range(len(FOILS))]
+    return ParameterTable(names, [f"{name}.dat" for name in names], compute_parameters(foils))
+
+def test_parameters_of_naca_sections(table):
+    np.testing.assert_allclose(table["t/c"], [0.12, 0.12, 0.15, 0.09], atol=1e-3)
+    np.testing.assert_allclose(table["camber"], [0.0, 0.02, 0.04, 0.01], atol=1e-4)
+    np.testing.assert_allclose(table["thickness_x"], 0.3, atol=0.02)
+    np.testing.assert_allclose(table["camber_x"][1:], 0.5, atol=0.01)
+    # NACA leading edge radius is 1.1019 (t/c)^2, te thickness is 0.0021 t/c / 0.1
+    np.testing.assert_allclose(table["le_radius"], 1.1019 * table["t/c"]**2, rtol=0.15)
+    np.testing.assert_allclose(table["te_thickness"], 0.021 * table["t/c"], rtol=0.02)
+    assert (table["num_points"] == 161).all()
+
+def test_closed_trailing_edge_file():
+    # NACA 63-412 lists its sharp trailing edge point at both ends
+    _, num_points, data, i_le = read_airfoil("airfoils/631-412.dat")
+    parameters = compute_parameters([(data, i_le)])
+    assert parameters["te_thickness"][0] == 0.0
+    assert parameters["thickness"][0] == pytest.approx(0.12, abs=1e-3)
+    assert parameters["camber"][0] == pytest.approx(0.022, abs=1e-3)
+    assert 5.0 < parameters["te_angle"][0] < 8.0
+    foil = Airfoil_new()
+    foil.load("airfoils/631-412.dat")
+    assert parameters["num_points"][0] == num_points == foil.NUM_POINTS == 51
+
+def test_query_masks(table):
+    assert table.query("t/c between 0.10 and 0.14 and camber < 1.5%").tolist() == [True, False, False, False]
+    assert table.query("camber > 0.015").tolist() == [False, True, True, False]
+    assert table.query("").all()
+
+def test_parse_query_errors():
+    for query in ["t/c", "chord < 1", "t/c < 0.1 camber < 1", "t/c between 0.1"]:
+        with pytest.raises(ValueError):
+            parse_query(query)
+
+def test_filter_model_combines_name_and_parameters(table):
+    source = AirfoilListModel()
+    source.addItems((name, path) for name, path in zip(table.NAMES + ["other"], table.PATHS + ["other.dat"]))
+    model = AirfoilFilterModel(source)
+    model.setParameterTable(table)
+    model.parameterFilter = "t/c > 0.11"
+    assert [model.sourceRow(row) for row in range(model.rowCount())] == [0, 1, 2]
+    model.filterString = "foil2"
+    assert model.rowCount() == 1 and model.sourceRow(0) == 2
+    model.parameterFilter = "t/c >="
+    assert not model.parameterFilterValid and model.rowCount() == 1
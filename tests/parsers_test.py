@@ -0,0 +1,82 @@
+import numpy as np
+import pytest
+from scripts.parsers import parse_airfoil_file, parse_airfoil_files, split_selig
+
+SELIG = """TEST FOIL
+1.0 0.001
+0.5 0.06
+0.0 0.0
+0.5 -0.04
+1.0 -0.001
+"""
+
+LEDNICER = """LEDNICER FOIL
+       3.0       3.0
+
+0.0 0.0
+0.5 0.06
+1.0 0.001
+
+0.0 0.0
+0.5 -0.04
+1.0 -0.001
+"""
+
+@pytest.fixture
+def selig_file(tmp_path):
+    path = tmp_path / "selig.dat"
+    path.write_text(SELIG)
+    return str(path)
+
+@pytest.fixture
+def lednicer_file(tmp_path):
+    path = tmp_path / "lednicer.dat"
+    path.write_text(LEDNICER)
+    return str(path)
+
+def test_parse_selig(selig_file):
+    name, data = parse_airfoil_file(selig_file)
+    assert name == "TEST FOIL"
+    assert data.shape == (5, 2)
+    assert data.dtype == np.float64
+
+def test_parse_lednicer_matches_selig(selig_file, lednicer_file):
+    _, selig = parse_airfoil_file(selig_file)
+    name, lednicer = parse_airfoil_file(lednicer_file)
+    assert name == "LEDNICER FOIL"
+    # the count header is not a point and the shared leading edge point is kept once
+    np.testing.assert_allclose(lednicer, selig)
+
+def test_parse_without_header_uses_filename(tmp_path):
+    path = tmp_path / "noheader.dat"
+    path.write_text(SELIG.split("\n", 1)[1])
+    name, data = parse_airfoil_file(str(path))
+    assert name == "noheader"
+    assert len(data) == 5
+
+def test_parse_malformed_lines_use_regex_fallback(tmp_path):
+    path = tmp_path / "indexed.dat"
+    path.write_text("INDEXED\n1 1.0 0.0\n2 0.0 0.0\n3 1.0 -0.01\n")
+    _, data = parse_airfoil_file(str(path))
+    np.testing.assert_allclose(data, [[1.0, 0.0], [0.0, 0.0], [1.0, -0.01]])
+
+def test_parse_empty_file_raises(tmp_path):
+    path = tmp_path / "empty.dat"
+    path.write_text("\n\n")
+    with pytest.raises(ValueError):
+        parse_airfoil_file(str(path))
+
+def test_parse_files_stacks_and_skips_bad_files(selig_file, lednicer_file, tmp_path):
+    bad = tmp_path / "bad.dat"
+    bad.write_text("ONLY A NAME\n")
+    names, paths, coordinates, offsets = parse_airfoil_files([selig_file, str(bad), lednicer_file])
+    assert names == ["TEST FOIL", "LEDNICER FOIL"]
+    assert paths == [selig_file, lednicer_file]
+    assert coordinates.shape == (10, 2)
+    np.testing.assert_array_equal(offsets, [0, 5, 10])
+
+def test_split_selig_keeps_shared_trailing_edge():
+    data = np.array([[1.0, 0.0], [0.0, 0.0], [1.0, 0.0]])
+    data, i_le = split_selig(data)
+    assert i_le == 1
+    assert len(data) == 3
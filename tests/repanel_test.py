@@ -0,0 +1,38 @@
+import numpy as np
+import pytest
+from scripts.repanel import RepanelCache, geometry_hash, repanel, spacing_fractions
+
+def test_repanel_stays_on_the_curve(ellipse):
+    geometry = ellipse(81, 0.1, chord=2.0)
+    points, le_index = geometry.points, geometry.le_index
+    repaneled, new_le_index = repanel(points, le_index, 161, "cosine")
+    assert repaneled.shape == (161, 2) and new_le_index == 80
+    np.testing.assert_allclose(repaneled[new_le_index], points[le_index], atol=1e-12)
+    np.testing.assert_allclose(repaneled[[0, -1]], points[[0, -1]], atol=1e-12)
+    # every point lies on the ellipse (x - 1)^2 + (y / 0.1)^2 = 1
+    np.testing.assert_allclose((repaneled[:, 0] - 1)**2 + (repaneled[:, 1] / 0.1)**2, 1, atol=1e-3)
+
+def test_spacings():
+    cosine, le, uniform = (spacing_fractions(11, spacing) for spacing in ("cosine", "le", "uniform"))
+    assert np.diff(cosine)[0] < np.diff(uniform)[0] and np.diff(cosine)[-1] < np.diff(uniform)[-1]
+    assert np.diff(le)[0] < np.diff(uniform)[0] and np.diff(le)[-1] > np.diff(uniform)[-1]
+    with pytest.raises(ValueError):
+        spacing_fractions(11, "random")
+
+def test_repanel_handles_repeated_points(ellipse):
+    geometry = ellipse(41, 0.1, chord=2.0)
+    points, le_index = geometry.points, geometry.le_index
+    points = np.insert(points, 5, points[5], axis=0)
+    repaneled, _ = repanel(points, le_index + 1, 51)
+    assert np.isfinite(repaneled).all()
+
+def test_repanel_cache_memoizes(ellipse):
+    geometry = ellipse(41, 0.1, chord=2.0)
+    points, le_index = geometry.points, geometry.le_index
+    cache = RepanelCache()
+    first = cache.get(points, le_index, 101, "le")
+    second = cache.get(points.copy(), le_index, 101, "le")
+    assert second[0] is first[0] and not first[0].flags.writeable
+    cache.get(points, le_index, 101, "cosine")
+    assert (cache.hits, cache.misses, len(cache)) == (1, 2, 2)
+    assert geometry_hash(points, le_index) != geometry_hash(points, le_index + 1)
@@ -0,0 +1,66 @@
+import time
+import numpy as np
+import pytest
+from PySide2.QtCore import QCoreApplication
+from models.airfoils import Airfoil_new
+from models.scheduler import UpdateScheduler
+from scripts.transforms import AffineTransform
+
+AIRFOIL = "airfoils/clarky.dat"
+
+@pytest.fixture
+def app():
+    return QCoreApplication.instance() or QCoreApplication([])
+
+@pytest.fixture
+def scheduler(app):
+    foil = Airfoil_new()
+    foil.load(AIRFOIL)
+    scheduler = UpdateScheduler(foil)
+    yield scheduler
+    scheduler.stop()
+
+def process_events(app, seconds):
+    end = time.perf_counter() + seconds
+    while time.perf_counter() < end:
+        app.processEvents()
+        time.sleep(0.001)
+
+def test_bursts_are_coalesced(app, scheduler):
+    foil = scheduler.airfoil
+    emitted = []
+    foil.dataChanged.connect(lambda: emitted.append(time.perf_counter()))
+    for angle in np.linspace(0, 10, 200):
+        scheduler.setIncidence(float(angle))
+    scheduler.setChord(2.0)
+    process_events(app, 0.2)
+
+    assert 1 <= len(emitted) < 200
+    assert np.all(np.diff(emitted) >= 0.8 * UpdateScheduler.FRAME_INTERVAL / 1000)
+    # the latest values of both parameters win
+    assert (foil.INCIDENCE, foil.CHORD) == (10.0, 2.0)
+    expected = AffineTransform.from_parameters(scale=2.0 / foil.SOURCE_CHORD, angle=10.0, position=foil.SOURCE_QUARTER_CHORD,
+                                               pivot=foil.SOURCE_QUARTER_CHORD).apply(foil.SOURCE.points)
+    np.testing.assert_allclose(foil.getData(), expected)
+
+def test_results_for_a_reloaded_airfoil_are_dropped(app, scheduler):
+    foil = scheduler.airfoil
+    scheduler.setPosition(1.0, 1.0)
+    foil.load(AIRFOIL)
+    process_events(app, 0.1)
+    assert foil.POSITION == foil.SOURCE_QUARTER_CHORD
+
+def test_results_are_written_into_recycled_buffers(app, scheduler):
+    foil = scheduler.airfoil
+    foil.IN_PLACE = True
+    buffers = set()
+    scheduler.worker.transformed.connect(lambda result: buffers.add(id(result[-1])))
+    for angle in np.linspace(0, 10, 50):
+        scheduler.setIncidence(float(angle))
+        process_events(app, 0.002)
+    process_events(app, 0.1)
+
+    assert foil.INCIDENCE == 10.0
+    # the airfoil copies every result into its own buffer, the worker reuses a few result buffers instead of allocating 50
+    assert foil.GEOMETRY.points is foil._buffer
+    assert 1 <= len(buffers) <= 3
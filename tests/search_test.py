@@ -0,0 +1,29 @@
+from scripts.search import NameIndex, normalise_name
+
+NAMES = ["NACA 0015.dat", "naca2412.dat", "clarky.dat", "S1223.dat"]
+
+def test_normalise_name():
+    assert normalise_name("NACA 0015.dat") == "naca0015"
+    assert normalise_name("NACA-0015") == "naca0015"
+
+def test_search_name_variants():
+    index = NameIndex(NAMES)
+    for query in ["NACA 0015", "naca0015", "n0015", "0015"]:
+        assert index.search(query) == {0}
+
+def test_search_short_and_long_queries():
+    index = NameIndex(NAMES)
+    assert index.search("n") == {0, 1}
+    assert index.search("12") == {1, 3}
+    assert index.search("clarky") == {2}
+    assert index.search("zzzz") == set()
+
+def test_search_empty_query_matches_everything():
+    index = NameIndex(NAMES)
+    assert index.search("") is None
+    assert index.search(" - ") is None
+
+def test_extend_appends_rows():
+    index = NameIndex(NAMES)
+    index.extend(["e387.dat"])
+    assert index.search("e387") == {4}
@@ -0,0 +1,39 @@
+import numpy as np
+import pytest
+from scripts.ingest import ingest_airfoils
+from scripts.resample import cosine_stations, resample_surfaces
+from scripts.similarity import SimilarityIndex
+
+@pytest.fixture
+def index(tmp_path, naca4):
+    paths = []
+    for thickness in (0.06, 0.09, 0.12, 0.15, 0.18):
+        data, _ = naca4(thickness, 0.025, n=61)
+        path = tmp_path / f"foil{int(thickness * 100):02d}.dat"
+        np.savetxt(path, data, header=f"FOIL {thickness}", comments="")
+        paths.append(str(path))
+    records, errors, _ = ingest_airfoils(paths)
+    assert errors == []
+    return SimilarityIndex.from_records(sorted(records, key=lambda record: record.path))
+
+def test_resample_surfaces_is_chord_independent(naca4):
+    data, i_le = naca4(0.12, 0.0, n=61)
+    stations = cosine_stations(21)
+    upper, lower = resample_surfaces(data, i_le, stations)
+    scaled_upper, scaled_lower = resample_surfaces(data * 3 + 1, i_le, stations)
+    np.testing.assert_allclose(upper, scaled_upper, atol=1e-12)
+    np.testing.assert_allclose(upper, -lower, atol=1e-12)
+
+def test_nearest_are_neighbouring_thicknesses(index):
+    names = [name for name, _, _ in index.similar_to(index.PATHS[2], k=2)]
+    assert sorted(names) == ["FOIL 0.09", "FOIL 0.15"]
+    distances = [distance for _, _, distance in index.similar_to(index.PATHS[0], k=4)]
+    assert distances == sorted(distances)
+
+def test_similarity_index_round_trip(index, tmp_path):
+    index_path = str(tmp_path / "similarity.npz")
+    index.save(index_path)
+    loaded = SimilarityIndex.load(index_path)
+    assert loaded.NAMES == index.NAMES and loaded.PATHS == index.PATHS
+    np.testing.assert_array_equal(loaded.FEATURES, index.FEATURES)
+    assert index.PATHS[0] in loaded
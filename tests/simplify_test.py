@@ -0,0 +1,61 @@
+import numpy as np
+import pytest
+from models.airfoils import Airfoil_new
+from models.geometry import GeometryCore
+from scripts.simplify import simplify, simplify_mask
+
+def deviation(points, simplified):
+    """Largest distance of points to the polyline simplified"""
+    start, end = simplified[:-1, np.newaxis], simplified[1:, np.newaxis]
+    direction = end - start
+    along = np.clip(np.sum((points - start) * direction, axis=-1) / np.sum(direction**2, axis=-1), 0, 1)
+    distance = np.hypot(*np.moveaxis(points - start - along[..., np.newaxis] * direction, -1, 0))
+    return distance.min(axis=0).max()
+
+def test_collinear_points_are_dropped():
+    points = np.column_stack((np.linspace(0, 1, 11), np.zeros(11)))
+    np.testing.assert_array_equal(np.flatnonzero(simplify_mask(points, 1e-9)), [0, 10])
+    np.testing.assert_array_equal(np.flatnonzero(simplify_mask(points, 1e-9, keep=[4])), [0, 4, 10])
+
+@pytest.mark.parametrize("tolerance", [1e-2, 1e-3, 1e-4])
+def test_deviation_within_tolerance(tolerance, ellipse):
+    geometry = ellipse(2001)
+    points, le_index = simplify(geometry.points, geometry.le_index, tolerance)
+    assert len(points) < len(geometry)
+    np.testing.assert_array_equal(points[le_index], geometry.leading_edge)
+    np.testing.assert_array_equal(points[[0, -1]], geometry.points[[0, -1]])
+    assert deviation(geometry.points, points) <= tolerance
+
+def test_tolerance_is_in_chord_units(ellipse):
+    geometry = ellipse(501)
+    scaled = GeometryCore(geometry.points * 250.0, geometry.le_index)
+    assert len(geometry.simplified(1e-3)) == len(scaled.simplified(1e-3))
+
+def test_display_data(tmp_path, ellipse):
+    geometry = ellipse(1001)
+    path = tmp_path / "ellipse.dat"
+    np.savetxt(path, geometry.points, header="ellipse", comments="")
+    foil = Airfoil_new()
+    foil.load(str(path))
+    assert foil.getDisplayData() is foil.getData()
+    foil.DISPLAY_TOLERANCE = 1e-3
+    display = foil.getDisplayData()
+    assert len(display) < len(foil.getData())
+    assert foil.getDisplayData() is display
+    foil.rotate_to(5.0)
+    assert foil.getDisplayData() is not display
+
+def test_fill_series(tmp_path, ellipse):
+    from PySide2.QtCharts import QtCharts
+    geometry = ellipse(1001)
+    path = tmp_path / "ellipse.dat"
+    np.savetxt(path, geometry.points, header="ellipse", comments="")
+    foil = Airfoil_new()
+    foil.load(str(path))
+    foil.DISPLAY_TOLERANCE = 1e-3
+    series = QtCharts.QLineSeries()
+    series.append(0.0, 0.0)
+    foil.fillSeries(series)
+    points = series.pointsVector()
+    assert len(points) == len(foil.getDisplayData())
+    assert (points[-1].x(), points[-1].y()) == tuple(foil.getDisplayData()[-1])
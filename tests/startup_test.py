@@ -0,0 +1,8 @@
+import pytest
+from benchmarks.startup_importtime import lazy_modules_imported, measure_import_time
+
+@pytest.mark.parametrize("module", ["main", "models.airfoils", "models.data", "scripts.functions"])
+def test_startup_does_not_import_lazy_modules(module):
+    times = measure_import_time(module)
+    assert module in times
+    assert lazy_modules_imported(times) == []
@@ -0,0 +1,64 @@
+import os
+import struct
+import zlib
+import numpy as np
+from models.data import AirfoilFilterModel, AirfoilListModel
+from scripts.parsers import read_airfoil
+from scripts.thumbnails import encode_png, rasterise, render_thumbnails
+
+AIRFOILS = ["airfoils/clarky.dat", "airfoils/NACA 0015.dat"]
+
+def decode_png(data):
+    """Minimal decoder for the unfiltered RGBA images written by encode_png"""
+    assert data[:8] == b"\x89PNG\r\n\x1a\n"
+    width, height = struct.unpack(">II", data[16:24])
+    position, idat = 8, b""
+    while position < len(data):
+        length, kind = struct.unpack(">I4s", data[position:position + 8])
+        chunk = data[position + 8:position + 8 + length]
+        assert struct.unpack(">I", data[position + 8 + length:position + 12 + length])[0] == zlib.crc32(kind + chunk)
+        if kind == b"IDAT":
+            idat += chunk
+        position += 12 + length
+    rows = np.frombuffer(zlib.decompress(idat), dtype=np.uint8).reshape(height, 1 + 4 * width)
+    assert not rows[:, 0].any()
+    return rows[:, 1:].reshape(height, width, 4)
+
+def test_rasterise_fills_and_strokes():
+    angles = np.linspace(0, 2 * np.pi, 200)
+    image = rasterise(np.column_stack((np.cos(angles), 0.25 * np.sin(angles))), size=(64, 24), margin=2)
+    alpha = image[..., 3]
+    assert alpha[12, 32] == 85 # filled inside
+    assert alpha[12, 2] == 255 and alpha[12, 61] == 255 # outline at both ends
+    assert alpha[0, 0] == 0 and alpha[:, :2].max() == 0 # margin
+    np.testing.assert_array_equal(decode_png(encode_png(image)), image)
+
+def test_render_thumbnails_is_cached_by_geometry(tmp_path):
+    foils = []
+    for path in AIRFOILS:
+        _, _, data, i_le = read_airfoil(path)
+        foils.append((path, data, i_le))
+    thumbnails = render_thumbnails(foils, str(tmp_path), processes=2)
+    assert sorted(thumbnails) == sorted(AIRFOILS)
+    assert all(os.path.exists(image) for image in thumbnails.values())
+    assert len(set(thumbnails.values())) == 2
+    modified = {image: os.stat(image).st_mtime_ns for image in thumbnails.values()}
+
+    # a renamed file with the same coordinates uses the same thumbnail, nothing is rendered again
+    again = render_thumbnails([("copy.dat",) + foils[0][1:]] + foils, str(tmp_path), processes=2)
+    assert again["copy.dat"] == thumbnails[AIRFOILS[0]]
+    assert {image: os.stat(image).st_mtime_ns for image in again.values()} == modified
+    assert not [name for name in os.listdir(tmp_path) if name.endswith(".tmp")]
+
+def test_thumbnail_role(tmp_path):
+    source = AirfoilListModel()
+    source.addItems([("Clark Y", AIRFOILS[0]), ("NACA 2412", AIRFOILS[1])])
+    filtered = AirfoilFilterModel(source)
+    changes = []
+    filtered.dataChanged.connect(lambda first, last, roles: changes.append((first.row(), last.row(), list(roles))))
+    assert source.data(source.index(0), AirfoilListModel.ThumbnailRole) == ""
+    image = tmp_path / "clarky.png"
+    source.setThumbnails({AIRFOILS[0]: str(image)})
+    assert source.data(source.index(0), AirfoilListModel.ThumbnailRole) == image.as_uri()
+    assert changes == [(0, 1, [AirfoilListModel.ThumbnailRole])]
+    assert b"thumbnail" in source.roleNames().values()
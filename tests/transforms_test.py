@@ -0,0 +1,83 @@
+import numpy as np
+import pytest
+from models.airfoils import Airfoil_new
+from benchmarks.transform_allocations import measure_update_allocations
+from scripts.transforms import AffineTransform, transform_sections
+
+FOIL = """FOIL
+1.0 0.001
+0.5 0.05
+0.0 0.0
+0.5 -0.04
+1.0 -0.001
+"""
+
+def test_transform_matches_separate_operations():
+    points = np.random.default_rng(0).random((20, 2))
+    transform = AffineTransform().translate(-0.25, 0).scale(2).rotate(5).translate(1, 2)
+    angle = np.deg2rad(5)
+    rotation = np.array([[np.cos(angle), -np.sin(angle)], [np.sin(angle), np.cos(angle)]])
+    expected = ((points - [0.25, 0]) * 2) @ rotation + [1, 2]
+    np.testing.assert_allclose(transform.apply(points), expected)
+    np.testing.assert_allclose(transform.inverse().apply(transform.apply(points)), points)
+    np.testing.assert_allclose(transform.apply_to_point(*points[3]), expected[3])
+
+def test_rotation_about_origin():
+    transform = AffineTransform().rotate(90, origin=(1, 1))
+    np.testing.assert_allclose(transform.apply_to_point(1, 1), (1, 1), atol=1e-12)
+    np.testing.assert_allclose(transform.apply_to_point(1, 2), (2, 1), atol=1e-12)
+
+@pytest.fixture
+def foil_path(tmp_path):
+    path = tmp_path / "foil.dat"
+    path.write_text(FOIL)
+    return str(path)
+
+def test_apply_out_matches_apply():
+    points = np.random.default_rng(1).random((30, 2))
+    transform = AffineTransform.from_parameters(scale=1.5, angle=-3, position=(2, 1), pivot=(0.25, 0))
+    out = np.empty_like(points)
+    assert transform.apply(points, out=out) is out
+    np.testing.assert_allclose(out, transform.apply(points))
+    np.testing.assert_allclose(transform.MATRIX, AffineTransform().translate(-0.25, 0).scale(1.5).rotate(-3).translate(2, 1).MATRIX)
+
+def test_in_place_updates_reuse_one_buffer(foil_path):
+    foil = Airfoil_new()
+    foil.IN_PLACE = True
+    foil.load(foil_path)
+    version = foil.VERSION
+    buffer = foil.update_transform(incidence=2.0)
+    assert foil.update_transform(chord=3.0) is buffer
+    assert foil.VERSION == version + 2
+    np.testing.assert_allclose(foil.calculate_chord(), 3.0)
+
+def test_in_place_updates_do_not_allocate_coordinates():
+    result = measure_update_allocations(updates=50)
+    assert result["peak_bytes"] < result["array_bytes"]
+
+def test_airfoil_transforms_recompute_from_source(foil_path):
+    foil = Airfoil_new()
+    foil.load(foil_path)
+    source = np.array(foil.getData())
+
+    foil.update_transform(chord=2.0, position=(0.0, 0.0))
+    np.testing.assert_allclose(foil.calculate_chord(), 2.0)
+    np.testing.assert_allclose(foil.calculate_quarter_chord(), (0.0, 0.0), atol=1e-12)
+    for angle in np.linspace(-10, 10, 1001):
+        foil.rotate_to(angle)
+    assert foil.getData()[foil.LE_INDEX][1] > 0 # positive incidence raises the leading edge
+    foil.update_transform(incidence=0.0, chord=foil.SOURCE_CHORD, position=foil.SOURCE_QUARTER_CHORD)
+    np.testing.assert_allclose(foil.getData(), source, atol=1e-12)
+
+def test_transform_sections_matches_single_transforms():
+    rng = np.random.default_rng(2)
+    sections = rng.random((6, 40, 2))
+    chords, twists, positions, offsets = rng.random(6) + 0.5, rng.random(6) * 10 - 5, rng.random((6, 2)), rng.random(6)
+    stack = transform_sections(sections, chords, twists, positions, offsets)
+    for k in range(6):
+        transform = AffineTransform.from_parameters(chords[k], twists[k], (positions[k, 0], positions[k, 1] + offsets[k]), (0.25, 0))
+        np.testing.assert_allclose(stack[k], transform.apply(sections[k]))
+    # scalar parameters apply to every section
+    np.testing.assert_allclose(transform_sections(sections, 2.0, 0.0, pivot=(0, 0)), 2 * sections)
+    with pytest.raises(ValueError):
+        transform_sections(sections, chords[:3], 0.0)
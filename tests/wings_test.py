@@ -0,0 +1,38 @@
+import numpy as np
+import pytest
+from models.geometry import GeometryCore
+from models.wings import Section, unit_chord
+
+@pytest.fixture
+def section(ellipse):
+    return Section(ellipse(61, 0.12, chord=3.0), ellipse(41, 0.06), root_chord=2.0, tip_chord=1.0, span=10.0, twist=-4.0, dihedral=5.0, num_points=81)
+
+def test_root_and_tip_share_stations(section):
+    assert len(section.ROOT) == len(section.TIP) == 81
+    assert section.ROOT.le_index == section.TIP.le_index == section.LE_INDEX
+    assert section.ROOT.chord() == pytest.approx(1.0) and section.TIP.chord() == pytest.approx(1.0)
+    np.testing.assert_allclose(section.ROOT.leading_edge, (0, 0), atol=1e-12)
+
+def test_blend_is_linear(section):
+    shapes = section.blend([0.0, 0.5, 1.0])
+    np.testing.assert_allclose(shapes[0], section.ROOT.points)
+    np.testing.assert_allclose(shapes[2], section.TIP.points)
+    np.testing.assert_allclose(shapes[1], 0.5 * (section.ROOT.points + section.TIP.points))
+
+def test_sections(section):
+    spanwise, sections = section.sections(200)
+    assert sections.shape == (200, 81, 2)
+    np.testing.assert_allclose(spanwise[[0, -1]], (0.0, 10.0))
+    root, tip = GeometryCore(sections[0], section.LE_INDEX), GeometryCore(sections[-1], section.LE_INDEX)
+    assert root.chord() == pytest.approx(2.0) and tip.chord() == pytest.approx(1.0)
+    assert root.quarter_chord() == pytest.approx((0.0, 0.0), abs=1e-12)
+    assert tip.quarter_chord()[1] == pytest.approx(10.0 * np.tan(np.radians(5.0)))
+    # negative twist lowers the leading edge of the tip
+    assert tip.leading_edge[1] < tip.quarter_chord()[1]
+
+def test_user_weighting(section):
+    _, sections = section.sections(3, weighting=lambda fraction: fraction**2)
+    expected = section.blend([0.0, 0.25, 1.0])[1]
+    np.testing.assert_allclose(unit_chord(GeometryCore(sections[1], section.LE_INDEX)).points, expected, atol=1e-12)
+    with pytest.raises(ValueError):
+        section.sections(3, weighting=[0.0, 1.0])
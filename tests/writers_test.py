@@ -0,0 +1,56 @@
+import re
+import xml.etree.ElementTree as ElementTree
+import numpy as np
+import pytest
+from models.wings import Section
+from scripts import writers
+from scripts.writers import export_sections_to
+
+@pytest.fixture
+def loft(ellipse):
+    sections = np.stack([ellipse(101).points * scale for scale in (1.0, 0.8, 0.6)])
+    return sections, np.array([0.0, 1.0, 2.0])
+
+def test_dxf_loft(tmp_path, loft):
+    sections, spanwise = loft
+    path = export_sections_to(str(tmp_path / "wing.dxf"), sections, spanwise, names="rib", plane="XY")
+    lines = open(path).read().split("\n")
+    assert lines[:4] == ["0", "SECTION", "2", "ENTITIES"] and lines[-5:] == ["0", "ENDSEC", "0", "EOF", ""]
+    assert lines.count("POLYLINE") == 3 and lines.count("VERTEX") == 3 * 101
+    # group codes 10, 20, 30 hold x, y, z of every vertex
+    vertices = [i for i, line in enumerate(lines) if line == "VERTEX"]
+    coordinates = np.array([[float(lines[i + 4]), float(lines[i + 6]), float(lines[i + 8])] for i in vertices])
+    np.testing.assert_allclose(coordinates[:, :2], sections.reshape(-1, 2), rtol=1e-7, atol=1e-12)
+    np.testing.assert_array_equal(coordinates[:, 2], np.repeat(spanwise, 101))
+    assert lines[vertices[-1] + 2] == "rib_2"
+
+def test_svg_and_xml_parse(tmp_path, loft):
+    sections, spanwise = loft
+    svg = ElementTree.parse(export_sections_to(str(tmp_path / "wing.svg"), sections, spanwise, names=["a", "b & c", "d"]))
+    polylines = svg.getroot().findall(".//{http://www.w3.org/2000/svg}polyline")
+    assert [polyline.get("id") for polyline in polylines] == ["a", "b & c", "d"]
+    points = np.array([pair.split(",") for pair in polylines[1].get("points").split()], dtype=float)
+    np.testing.assert_allclose(points, sections[1], rtol=1e-5, atol=1e-9)
+
+    xml = ElementTree.parse(export_sections_to(str(tmp_path / "wing.xml"), sections, spanwise, plane="XZ"))
+    airfoils = xml.getroot().findall("airfoil")
+    assert [airfoil.find("name").text for airfoil in airfoils] == ["section_0", "section_1", "section_2"]
+    point = airfoils[2].find("points")[0]
+    assert float(point.find("y").text) == 2.0 and float(point.find("z").text) == pytest.approx(sections[2, 0, 1])
+
+def test_selig_dat(tmp_path, loft, monkeypatch):
+    sections, _ = loft
+    monkeypatch.setattr(writers, "CHUNK", 7) # several blocks
+    path = export_sections_to(str(tmp_path / "foil.dat"), sections[0], names="ellipse")
+    assert open(path).readline() == "ellipse\n"
+    np.testing.assert_allclose(np.loadtxt(path, skiprows=1), sections[0], atol=1e-8)
+    with pytest.raises(ValueError):
+        export_sections_to(str(tmp_path / "loft.dat"), sections)
+    with pytest.raises(ValueError):
+        export_sections_to(str(tmp_path / "loft.step"), sections)
+
+def test_section_export(tmp_path, ellipse):
+    foil = ellipse(61)
+    section = Section(foil, foil, root_chord=2.0, tip_chord=1.0, span=5.0, num_points=41)
+    path = section.export(str(tmp_path / "wing.dxf"), 6, plane="XY")
+    assert open(path).read().count("POLYLINE") == 6